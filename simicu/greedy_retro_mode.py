@@ -31,24 +31,18 @@ def greedy_decide(game, patient):
         return None
     vents_avail = game.free_vents > 0 and game.free_nurses > 0
     beds_avail = game.free_beds > 0 and game.free_nurses > 0
-    if getattr(patient, 'patient_type', None) == PatientType.RESPIRATORY and vents_avail:
-        try:
-            vidx = next(i for i, v in enumerate(game.ventilators) if v.available)
-            return ('vent', vidx)
-        except StopIteration:
-            pass
+    if patient.patient_type == PatientType.RESPIRATORY and vents_avail:
+        vent = game.get_available_ventilator()
+        if vent is not None:
+            return ('vent', vent.id)
     if beds_avail:
-        try:
-            bidx = next(i for i, b in enumerate(game.beds) if b.available)
-            return ('bed', bidx)
-        except StopIteration:
-            pass
+        bed = game.get_available_bed()
+        if bed is not None:
+            return ('bed', bed.id)
     if vents_avail:
-        try:
-            vidx = next(i for i, v in enumerate(game.ventilators) if v.available)
-            return ('vent', vidx)
-        except StopIteration:
-            pass
+        vent = game.get_available_ventilator()
+        if vent is not None:
+            return ('vent', vent.id)
     return None
 
 
@@ -9,7 +9,7 @@ import numpy as np
 from stable_baselines3 import PPO
 from sim_icu_env import SimICUEnv
 from retro_mode import RetroSimICU
-from sim_icu_logic import PatientStatus
+from sim_icu_logic import PatientStatus, PatientType
 
 
 def build_obs_from_game(env_helper: SimICUEnv, game) -> np.ndarray:
@@ -81,31 +81,19 @@ def main(model_path: str = "models/sim_icu_ai_agent"):
                 if at == 0:
                     # Prefer bed; if none, fall back to vent
                     if ui.game.free_beds > 0 and ui.game.free_nurses > 0:
-                        try:
-                            bidx = next(i for i, b in enumerate(ui.game.beds) if b.available)
-                            applied = ui.ai_click_bed(bidx)
-                        except StopIteration:
-                            applied = False
+                        bed = ui.game.get_available_bed()
+                        applied = bed is not None and ui.ai_click_bed(bed.id)
                     elif ui.game.free_vents > 0 and ui.game.free_nurses > 0:
-                        try:
-                            vidx = next(i for i, v in enumerate(ui.game.ventilators) if v.available)
-                            applied = ui.ai_click_vent(vidx)
-                        except StopIteration:
-                            applied = False
+                        vent = ui.game.get_available_ventilator()
+                        applied = vent is not None and ui.ai_click_vent(vent.id)
                 else:
                     # Prefer vent; if none, fall back to bed
                     if ui.game.free_vents > 0 and ui.game.free_nurses > 0:
-                        try:
-                            vidx = next(i for i, v in enumerate(ui.game.ventilators) if v.available)
-                            applied = ui.ai_click_vent(vidx)
-                        except StopIteration:
-                            applied = False
+                        vent = ui.game.get_available_ventilator()
+                        applied = vent is not None and ui.ai_click_vent(vent.id)
                     elif ui.game.free_beds > 0 and ui.game.free_nurses > 0:
-                        try:
-                            bidx = next(i for i, b in enumerate(ui.game.beds) if b.available)
-                            applied = ui.ai_click_bed(bidx)
-                        except StopIteration:
-                            applied = False
+                        bed = ui.game.get_available_bed()
+                        applied = bed is not None and ui.ai_click_bed(bed.id)
 
         # Heuristic fallback: if action not applied, no movement/pending, cooldown clear -> auto-assign best waiting
         if (not applied) and ui.input_cooldown_ticks == 0 and not ui.patient_moves and not ui.pending_assignments:
@@ -117,32 +105,20 @@ def main(model_path: str = "models/sim_icu_ai_agent"):
                 if ui.selected_patient is None:
                     ui.ai_select_patient(best.id)
                 # Prefer vent for respiratory if nurse+vent available, else bed if nurse+bed available
-                if getattr(best, 'patient_type', None) and best.patient_type.name.upper() == 'RESPIRATORY':
+                if best.patient_type == PatientType.RESPIRATORY:
                     if ui.game.free_vents > 0 and ui.game.free_nurses > 0:
-                        try:
-                            vidx = next(i for i, v in enumerate(ui.game.ventilators) if v.available)
-                            applied = ui.ai_click_vent(vidx)
-                        except StopIteration:
-                            applied = False
+                        vent = ui.game.get_available_ventilator()
+                        applied = vent is not None and ui.ai_click_vent(vent.id)
                     elif ui.game.free_beds > 0 and ui.game.free_nurses > 0:
-                        try:
-                            bidx = next(i for i, b in enumerate(ui.game.beds) if b.available)
-                            applied = ui.ai_click_bed(bidx)
-                        except StopIteration:
-                            applied = False
+                        bed = ui.game.get_available_bed()
+                        applied = bed is not None and ui.ai_click_bed(bed.id)
                 else:
                     if ui.game.free_beds > 0 and ui.game.free_nurses > 0:
-                        try:
-                            bidx = next(i for i, b in enumerate(ui.game.beds) if b.available)
-                            applied = ui.ai_click_bed(bidx)
-                        except StopIteration:
-                            applied = False
+                        bed = ui.game.get_available_bed()
+                        applied = bed is not None and ui.ai_click_bed(bed.id)
                     elif ui.game.free_vents > 0 and ui.game.free_nurses > 0:
-                        try:
-                            vidx = next(i for i, v in enumerate(ui.game.ventilators) if v.available)
-                            applied = ui.ai_click_vent(vidx)
-                        except StopIteration:
-                            applied = False
+                        vent = ui.game.get_available_ventilator()
+                        applied = vent is not None and ui.ai_click_vent(vent.id)
 
         # Advance simulation pacing like Retro
         ui.ai_tick(1)
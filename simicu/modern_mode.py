@@ -5,10 +5,14 @@ This demonstrates the AI agent managing the ICU automatically.
 
 import pygame
 import sys
+import math
+from collections import deque
 import numpy as np
+import torch
 from stable_baselines3 import PPO
 from sim_icu_env import SimICUEnv
-from ui.view import SimICUView
+from ui.view import SimICUView, LIFE_COLORS
+from ui_shared import merge_rects, scaled_sprite
 from sim_icu_logic import PatientStatus, PatientType
 import os
 
@@ -28,6 +32,10 @@ DARK_RED = (139, 0, 0)
 DARK_GREEN = (0, 100, 0)
 DARK_PINK = (199, 21, 133)
 
+# Fallback tile colour per status id (WAITING, IN_BED, ON_VENTILATOR, PENDING_DISCHARGE, CURED, LOST)
+STATUS_COLORS = (RED, GREEN, BLUE, GREEN, GRAY, GRAY)
+TYPE_LETTERS = {PatientType.RESPIRATORY: "R", PatientType.CARDIAC: "C", PatientType.TRAUMA: "T"}
+
 
 class ModernSimICU:
     """Pygame visualization for AI-controlled SimICU"""
@@ -58,6 +66,11 @@ class ModernSimICU:
         self.small_font = pygame.font.Font(base_font, 22)
         self.large_font = pygame.font.Font(base_font, 40)
         self.retro_antialias = False
+        # Overlay button labels and title, rendered once instead of every intro/rules frame
+        self._t_start = self.large_font.render("START GAME", self.retro_antialias, WHITE)
+        self._t_rules = self.font.render("RULES", self.retro_antialias, WHITE)
+        self._t_rules_title = self.large_font.render("RULES", self.retro_antialias, YELLOW)
+        self._t_back = self.large_font.render("BACK", self.retro_antialias, WHITE)
         
         # Load trained model
         print(f"Loading AI model from {model_path}...")
@@ -72,6 +85,12 @@ class ModernSimICU:
         # Create environment
         self.env = SimICUEnv(max_patients=10, max_ticks=1000)
         self.obs, self.info = self.env.reset()
+        # Reusable observation tensor: copy each new obs into it in place and
+        # feed the policy directly instead of letting predict() re-convert
+        self.model.policy.set_training_mode(False)
+        self._obs_tensor = torch.empty(self.env.observation_space.shape, dtype=torch.float32, device=self.model.device)
+        self._obs_batch = self._obs_tensor.unsqueeze(0)
+        self._obs_view = self._obs_tensor.numpy() if self._obs_tensor.device.type == "cpu" else None
         # Shared view/controller for parity with Retro
         self.view = SimICUView(self.env.game, self.screen, retro_antialias=self.retro_antialias)
         
@@ -92,8 +111,19 @@ class ModernSimICU:
         self.reco_log = []  # list of strings
         self.max_log_lines = 10
         self.show_emr = False
-         self.show_intro = True
-         self.show_rules = False
+        self._emr_dim = None  # full-window translucent backdrop, allocated on first use
+        self.show_intro = True
+        self.show_rules = False
+        # Overlay button hitboxes, placed when the overlay is drawn (empty Rects never collide)
+        self._intro_button = pygame.Rect(0, 0, 0, 0)
+        self._intro_rules_button = pygame.Rect(0, 0, 0, 0)
+        self._rules_back_button = pygame.Rect(0, 0, 0, 0)
+        # Dirty-rect rendering: rects the scene drew last frame, and whether the
+        # next frame must repaint/flip the whole window
+        self._dirty_rects = []
+        self._full_redraw = True
+        # Redraw request for run(): set by input, AI steps and animation, cleared after each draw()
+        self._dirty = True
 
         # Nurse render size
         self.nurse_size = 64
@@ -103,7 +133,7 @@ class ModernSimICU:
         self.nurse_positions = {}      # nurse -> (x,y)
         self.nurse_paths = {}          # nurse -> [(wx,wy), ...]
         self.nurse_stations = {}       # nurse -> (x,y)
-        self.pending_assignments = []  # [{'nurse': n, 'patient': p, 'bed': bed} | {'vent': vent}]
+        self.pending_assignments = deque()  # [{'nurse': n, 'patient': p, 'bed': bed} | {'vent': vent}]
         # Defer engine assignments until nurse arrival (to avoid immediate healing)
         self.deferred_action = None
         self.ready_to_apply_deferred = False
@@ -131,6 +161,7 @@ class ModernSimICU:
         except Exception:
             self.patient_in_bed_sprite_raw = None
         self._patient_in_bed_sprite_cache = {}
+        self._scale_cache = {}  # scaled_sprite() memo for art drawn at non-default sizes
         self.patient_in_bed_scale = 1.2
         self.waiting_sprite_scale_w = 1.3
         self.waiting_sprite_scale_h = 1.6
@@ -149,7 +180,6 @@ class ModernSimICU:
             self.waiting_bg_raw = pygame.image.load(wr_path).convert_alpha()
         except Exception:
             self.waiting_bg_raw = None
-        self._waiting_bg_cache = {}
 
         # Global hospital floor background
         floor_path = os.path.join(base_dir, "sprites", "hospital_floor.png")
@@ -157,7 +187,6 @@ class ModernSimICU:
             self.floor_bg_raw = pygame.image.load(floor_path).convert()
         except Exception:
             self.floor_bg_raw = None
-        self._floor_bg_cache = {}
         
         # Bed sprite (empty bed visual)
         bed_path = os.path.join(base_dir, "sprites", "bed.png")
@@ -187,26 +216,38 @@ class ModernSimICU:
             self.nurse_sprite_raw = pygame.image.load(nurse_path).convert_alpha()
         except Exception:
             self.nurse_sprite_raw = None
-        self._nurse_sprite_cache = {}
         # Optional: divider sprite (not used by default)
         divider_path = os.path.join(base_dir, "sprites", "divider.png")
         try:
             self.divider_sprite_raw = pygame.image.load(divider_path).convert_alpha()
         except Exception:
             self.divider_sprite_raw = None
-        self._divider_cache_by_height = {}
         self.divider_width_scale = 1.5
         self.divider_height_scale = 1.5
         self.divider_left_shift = -16
 
-         # Start screen background
-         start_bg_path = os.path.join(base_dir, "sprites", "start_screen.png")
-         try:
-             self.start_bg_raw = pygame.image.load(start_bg_path).convert_alpha()
-         except Exception:
-             self.start_bg_raw = None
-         self._start_bg_cache = {}
-    
+        # Start screen background
+        start_bg_path = os.path.join(base_dir, "sprites", "start_screen.png")
+        try:
+            self.start_bg_raw = pygame.image.load(start_bg_path).convert_alpha()
+        except Exception:
+            self.start_bg_raw = None
+
+        # Full-window backgrounds and the nurse sprite only draw at one size: scale once
+        size = (self.width, self.height)
+        self._floor_bg = pygame.transform.smoothscale(self.floor_bg_raw, size).convert() if self.floor_bg_raw else None
+        self._start_bg = pygame.transform.smoothscale(self.start_bg_raw, size).convert_alpha() if self.start_bg_raw else None
+        self._nurse_sprite = None
+        if self.nurse_sprite_raw:
+            self._nurse_sprite = pygame.transform.smoothscale(self.nurse_sprite_raw, (self.nurse_size, self.nurse_size)).convert_alpha()
+        self._divider = self._scaled_divider(120) if self.divider_sprite_raw else None
+        self._intro_surface = None  # composed on first draw_intro_overlay()
+
+    def _draw_life_bar(self, severity, x, y, width):
+        """Life bar: green when high life, orange mid, red low."""
+        bar_color = LIFE_COLORS[min(100, max(0, int(severity)))]
+        pygame.draw.rect(self.screen, bar_color, (x, y, int((severity / 100.0) * width), 10))
+
     def draw_patient(self, patient, x, y, width=100, height=80, minimal=False):
         """Draw a patient icon (sprite if available).
         minimal=True renders only the life bar (used for waiting room).
@@ -214,96 +255,67 @@ class ModernSimICU:
         if minimal:
             # Waiting room: show standing sprite (if available) + life bar + number only.
             # AI mode: show sitting sprite in waiting room if available
-            sprite = None
-            if getattr(self, "sitting_sprite_raw", None):
-                tw = max(1, int(width * self.waiting_sprite_scale_w))
-                th = max(1, int(height * self.waiting_sprite_scale_h))
-                key = (tw, th, "waiting_sit")
-                if key not in self._sitting_sprite_cache:
-                    self._sitting_sprite_cache[key] = pygame.transform.smoothscale(self.sitting_sprite_raw, (tw, th))
-                sprite = self._sitting_sprite_cache[key]
-            elif getattr(self, "patient_sprite_raw", None):
+            if self.sitting_sprite_raw is not None:
+                raw, cache = self.sitting_sprite_raw, self._sitting_sprite_cache
+            else:
+                raw, cache = self.patient_sprite_raw, self._patient_sprite_cache
+            if raw is not None:
                 tw = max(1, int(width * self.waiting_sprite_scale_w))
                 th = max(1, int(height * self.waiting_sprite_scale_h))
                 key = (tw, th, "waiting")
-                if key not in self._patient_sprite_cache:
-                    self._patient_sprite_cache[key] = pygame.transform.smoothscale(self.patient_sprite_raw, (tw, th))
-                sprite = self._patient_sprite_cache[key]
-            if sprite is not None:
-                draw_x = x + (width - sprite.get_width()) // 2
-                draw_y = y + (height - sprite.get_height()) // 2
-                self.screen.blit(sprite, (draw_x, draw_y))
-            bar_width = int((patient.severity / 100.0) * width)
-            bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-            pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
-            life_value = int(round(patient.severity))
-            value_text = self.small_font.render(f"{life_value}", True, WHITE)
-            self.screen.blit(value_text, (x + 5, y + 5))
+                if key not in cache:
+                    cache[key] = pygame.transform.smoothscale(raw, (tw, th)).convert_alpha()
+                self.screen.blit(cache[key], (x + (width - tw) // 2, y + (height - th) // 2))
+            self._draw_life_bar(patient.severity, x, y + height - 10, width)
+            self.screen.blit(self.small_font.render(f"{int(round(patient.severity))}", self.retro_antialias, WHITE), (x + 5, y + 5))
             # Type badge in waiting room (top-right small badge)
-            try:
-                t_letter = "R" if patient.patient_type == PatientType.RESPIRATORY else "C" if patient.patient_type == PatientType.CARDIAC else "T"
-                badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
-                bw, bh = badge.get_size()
-                pad = 4
-                bx = x + width - bw - pad - 2
-                by = y + 2
-                pygame.draw.rect(self.screen, YELLOW, (bx - 2, by - 2, bw + 4, bh + 4))
-                self.screen.blit(badge, (bx, by))
-            except Exception:
-                pass
+            badge = self.small_font.render(TYPE_LETTERS[patient.patient_type], self.retro_antialias, BLACK)
+            bw, bh = badge.get_size()
+            pad = 4
+            bx = x + width - bw - pad - 2
+            by = y + 2
+            pygame.draw.rect(self.screen, YELLOW, (bx - 2, by - 2, bw + 4, bh + 4))
+            self.screen.blit(badge, (bx, by))
             return
-        drew_sprite = False
-        if getattr(self, "patient_sprite_raw", None):
+        if self.patient_sprite_raw is not None:
             key = (width, height)
             if key not in self._patient_sprite_cache:
                 src_w, src_h = self.patient_sprite_raw.get_size()
                 scale = min(width / src_w, height / src_h)
                 scaled = (max(1, int(src_w * scale)), max(1, int(src_h * scale)))
-                self._patient_sprite_cache[key] = pygame.transform.smoothscale(self.patient_sprite_raw, scaled)
+                self._patient_sprite_cache[key] = pygame.transform.smoothscale(self.patient_sprite_raw, scaled).convert_alpha()
             sprite = self._patient_sprite_cache[key]
             draw_x = x + (width - sprite.get_width()) // 2
             draw_y = y + (height - sprite.get_height()) // 2
             self.screen.blit(sprite, (draw_x, draw_y))
-            pygame.draw.rect(self.screen, BLACK, (x, y, width, height), 2)
-            drew_sprite = True
-        if not drew_sprite:
-            color = RED if patient.status == PatientStatus.WAITING else GREEN
-            if patient.status == PatientStatus.ON_VENTILATOR:
-                color = BLUE
-            elif patient.status in [PatientStatus.CURED, PatientStatus.LOST]:
-                color = GRAY
+        else:
+            color = STATUS_COLORS[self.env.game.patient_status_id[patient.id]]
             pygame.draw.rect(self.screen, color, (x, y, width, height))
-            pygame.draw.rect(self.screen, BLACK, (x, y, width, height), 2)
+        pygame.draw.rect(self.screen, BLACK, (x, y, width, height), 2)
         
         # Severity bar
-        bar_width = int((patient.severity / 100.0) * width)
-        # Life bar: green when high life, orange mid, red low
-        bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-        pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
+        self._draw_life_bar(patient.severity, x, y + height - 10, width)
         
         # Patient ID
-        id_text = self.small_font.render(f"#{patient.id}", True, WHITE)
-        self.screen.blit(id_text, (x + 5, y + 5))
+        self.screen.blit(self.small_font.render(f"#{patient.id}", self.retro_antialias, WHITE), (x + 5, y + 5))
         
         # Status text
-        status_text = self.small_font.render(patient.status.value, True, WHITE)
-        self.screen.blit(status_text, (x + 5, y + 20))
+        self.screen.blit(self.small_font.render(patient.status.value, self.retro_antialias, WHITE), (x + 5, y + 20))
         
         # Severity number (rounded to whole number)
-        life_value = int(round(patient.severity))
-        severity_text = self.small_font.render(f"{life_value}", True, WHITE)
-        self.screen.blit(severity_text, (x + 5, y + 35))
+        self.screen.blit(self.small_font.render(f"{int(round(patient.severity))}", self.retro_antialias, WHITE), (x + 5, y + 35))
     
     def draw_bed(self, bed, x, y, width=120, height=120):
         """Draw a bed icon with sprites; overlay patient info when occupied."""
         # Record tile for nurse targeting
         self.bed_positions[bed] = (x, y, width, height)
+        game = self.env.game
         # Empty bed sprite or fallback rect (only for available regular beds)
-        if bed.available:
+        if game.bed_available[bed.id]:
             if getattr(self, "bed_sprite_raw", None):
                 key = (width, height)
                 if key not in self._bed_sprite_cache:
-                    self._bed_sprite_cache[key] = pygame.transform.smoothscale(self.bed_sprite_raw, (width, height))
+                    self._bed_sprite_cache[key] = pygame.transform.smoothscale(self.bed_sprite_raw, (width, height)).convert_alpha()
                 self.screen.blit(self._bed_sprite_cache[key], (x, y))
             else:
                 pygame.draw.rect(self.screen, LIGHT_GRAY, (x, y, width, height))
@@ -311,49 +323,41 @@ class ModernSimICU:
             pygame.draw.rect(self.screen, GREEN, (x, y, width, height), 2)
         else:
             # Occupied: show patient-in-bed sprite if available
-            if getattr(self, "patient_in_bed_sprite_raw", None):
+            if self.patient_in_bed_sprite_raw is not None:
                 sw = max(1, int(width * self.patient_in_bed_scale))
                 sh = max(1, int(height * self.patient_in_bed_scale))
                 key = (sw, sh)
                 if key not in self._patient_in_bed_sprite_cache:
-                    self._patient_in_bed_sprite_cache[key] = pygame.transform.smoothscale(self.patient_in_bed_sprite_raw, (sw, sh))
-                draw_x = x + (width - sw) // 2
-                draw_y = y + (height - sh) // 2
-                self.screen.blit(self._patient_in_bed_sprite_cache[key], (draw_x, draw_y))
+                    self._patient_in_bed_sprite_cache[key] = pygame.transform.smoothscale(self.patient_in_bed_sprite_raw, (sw, sh)).convert_alpha()
+                self.screen.blit(self._patient_in_bed_sprite_cache[key], (x + (width - sw) // 2, y + (height - sh) // 2))
             else:
                 pygame.draw.rect(self.screen, DARK_GRAY, (x, y, width, height))
             pygame.draw.rect(self.screen, RED, (x, y, width, height), 2)
             # Overlay bar, id, type badge
-            try:
-                patient = next(p for p in self.env.game.patients if p.assigned_bed == bed)
-                bar_width = int((patient.severity / 100.0) * width)
-                bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-                pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
-                id_text = self.small_font.render(f"#{patient.id}", self.retro_antialias, WHITE)
-                self.screen.blit(id_text, (x + 4, y + 4))
-                t_letter = "R" if patient.patient_type == PatientType.RESPIRATORY else "C" if patient.patient_type == PatientType.CARDIAC else "T"
-                badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
+            pidx = game.bed_patient[bed.id]
+            if pidx >= 0:
+                patient = game.patients[pidx]
+                self._draw_life_bar(game.patient_severity[pidx], x, y + height - 10, width)
+                self.screen.blit(self.small_font.render(f"#{patient.id}", self.retro_antialias, WHITE), (x + 4, y + 4))
+                badge = self.small_font.render(TYPE_LETTERS[patient.patient_type], self.retro_antialias, BLACK)
                 bw, bh = badge.get_size()
                 px, py = x + width - bw - 6, y + 2
                 pygame.draw.rect(self.screen, YELLOW, (px - 2, py - 2, bw + 4, bh + 4))
                 self.screen.blit(badge, (px, py))
-            except StopIteration:
-                pass
     
     def draw_nurse(self, nurse, x, y, size=40):
         """Draw a nurse sprite (fallback to circle)"""
-        if getattr(self, "nurse_sprite_raw", None):
-            key = (size, size)
-            if key not in self._nurse_sprite_cache:
-                self._nurse_sprite_cache[key] = pygame.transform.smoothscale(self.nurse_sprite_raw, (size, size))
-            self.screen.blit(self._nurse_sprite_cache[key], (x, y))
+        if self._nurse_sprite is not None:
+            sprite = self._nurse_sprite
+            if size != self.nurse_size:
+                sprite = scaled_sprite(self._scale_cache, self.nurse_sprite_raw, (size, size))
+            self.screen.blit(sprite, (x, y))
         else:
             color = GREEN if nurse.available else RED
             pygame.draw.circle(self.screen, color, (x + size // 2, y + size // 2), size // 2)
             pygame.draw.circle(self.screen, BLACK, (x + size // 2, y + size // 2), size // 2, 2)
         
-        label = "N" if nurse.available else "BUSY"
-        label_text = self.small_font.render(label, True, WHITE)
+        label_text = self.small_font.render("N" if nurse.available else "BUSY", self.retro_antialias, WHITE)
         text_rect = label_text.get_rect(center=(x + size // 2, y + size // 2))
         self.screen.blit(label_text, text_rect)
     
@@ -361,12 +365,13 @@ class ModernSimICU:
         """Draw a ventilator bed with sprites and overlay patient health bar when occupied."""
         # Record tile for nurse targeting
         self.vent_positions[vent] = (x, y, width, height)
-        occupied = not vent.available
+        game = self.env.game
+        occupied = not game.vent_available[vent.id]
         if not occupied:
             if getattr(self, "vent_bed_raw", None):
                 key = (width, height)
                 if key not in self._vent_bed_cache:
-                    self._vent_bed_cache[key] = pygame.transform.smoothscale(self.vent_bed_raw, (width, height))
+                    self._vent_bed_cache[key] = pygame.transform.smoothscale(self.vent_bed_raw, (width, height)).convert_alpha()
                 self.screen.blit(self._vent_bed_cache[key], (x, y))
             else:
                 pygame.draw.rect(self.screen, LIGHT_GRAY, (x, y, width, height))
@@ -375,41 +380,36 @@ class ModernSimICU:
             if getattr(self, "vent_patient_raw", None):
                 key = (width, height)
                 if key not in self._vent_patient_cache:
-                    self._vent_patient_cache[key] = pygame.transform.smoothscale(self.vent_patient_raw, (width, height))
+                    self._vent_patient_cache[key] = pygame.transform.smoothscale(self.vent_patient_raw, (width, height)).convert_alpha()
                 self.screen.blit(self._vent_patient_cache[key], (x, y))
             else:
                 pygame.draw.rect(self.screen, DARK_GRAY, (x, y, width, height))
             pygame.draw.rect(self.screen, RED, (x, y, width, height), 2)
             # Overlay health bar for the patient on this ventilator
-            try:
-                patient = next(p for p in self.env.game.patients if p.assigned_ventilator == vent and p.status == PatientStatus.ON_VENTILATOR)
-                bar_width = int((patient.severity / 100.0) * width)
-                bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-                pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
+            pidx = game.vent_patient[vent.id]
+            if pidx >= 0:
+                patient = game.patients[pidx]
+                self._draw_life_bar(game.patient_severity[pidx], x, y + height - 10, width)
                 # Type badge
-                t_letter = "R" if patient.patient_type == PatientType.RESPIRATORY else "C" if patient.patient_type == PatientType.CARDIAC else "T"
-                badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
+                badge = self.small_font.render(TYPE_LETTERS[patient.patient_type], self.retro_antialias, BLACK)
                 bw, bh = badge.get_size()
                 px, py = x + width - bw - 6, y + 2
                 pygame.draw.rect(self.screen, YELLOW, (px - 2, py - 2, bw + 4, bh + 4))
                 self.screen.blit(badge, (px, py))
-            except StopIteration:
-                pass
         # Optional divider to the right (kept from other branch)
-        if getattr(self, "divider_sprite_raw", None):
-            key_h = (height, self.divider_width_scale, self.divider_height_scale)
-            if key_h not in self._divider_cache_by_height:
-                base_w = self.divider_sprite_raw.get_width()
-                base_h = self.divider_sprite_raw.get_height()
-                sh = int(height * self.divider_height_scale)
-                sw = int(base_w * (sh / base_h) * self.divider_width_scale)
-                self._divider_cache_by_height[key_h] = pygame.transform.smoothscale(
-                    self.divider_sprite_raw, (max(1, sw), max(1, sh))
-                )
+        if self._divider is not None:
             pad = 8
-            surf = self._divider_cache_by_height[key_h]
+            surf = self._divider if height == 120 else self._scaled_divider(height)
             self.screen.blit(surf, (x + width + pad + self.divider_left_shift, y + (height - surf.get_height()) // 2))
 
+    def _scaled_divider(self, height):
+        """Scale the divider sprite to sit beside a card of the given height."""
+        base_w = self.divider_sprite_raw.get_width()
+        base_h = self.divider_sprite_raw.get_height()
+        sh = int(height * self.divider_height_scale)
+        sw = int(base_w * (sh / base_h) * self.divider_width_scale)
+        return scaled_sprite(self._scale_cache, self.divider_sprite_raw, (max(1, sw), max(1, sh)))
+
     def draw_ui_panel(self):
         """Draw the UI information panel"""
         panel_x = self.ui_panel_x
@@ -501,35 +501,61 @@ class ModernSimICU:
             text_rect = pause_text.get_rect(center=(panel_x + self.ui_panel_width // 2, self.height - 50))
             self.screen.blit(pause_text, text_rect)
     
+    def _restore_floor(self, rect=None):
+        """Blit the floor background over rect (whole screen when None)."""
+        if self._floor_bg is not None:
+            if rect is None:
+                self.screen.blit(self._floor_bg, (0, 0))
+            else:
+                self.screen.blit(self._floor_bg, rect, rect)
+        else:
+            self.screen.fill(BLACK, rect)
+
     def draw(self):
         """Draw the entire game screen"""
-        if self.floor_bg_raw:
-            key_bg = (self.width, self.height)
-            if key_bg not in self._floor_bg_cache:
-                self._floor_bg_cache[key_bg] = pygame.transform.smoothscale(self.floor_bg_raw, (self.width, self.height))
-            self.screen.blit(self._floor_bg_cache[key_bg], (0, 0))
+        # Intro overlay / Rules
+        if self.show_intro or self.show_rules:
+            self._restore_floor()
+            self._full_redraw = True
+            if self.show_intro:
+                return self.draw_intro_overlay()
+            return self.draw_rules_overlay()
+
+        if self._full_redraw or self.show_emr:
+            self._restore_floor()
+            # Delegate full scene draw to shared view
+            self.view.draw(background=False)
+            # The EMR overlay dims the whole window, so frames under it are always full flips;
+            # it must be drawn before the flip to ever reach the display
+            self._draw_emr_overlay()
+            pygame.display.flip()
+            self._full_redraw = False
         else:
-            self.screen.fill(BLACK)
-        
-         # Intro overlay / Rules
-         if getattr(self, "show_intro", False):
-             return self.draw_intro_overlay()
-         if getattr(self, "show_rules", False):
-             return self.draw_rules_overlay()
-
-        # Delegate full scene draw to shared view
-        self.view.draw()
-        
-        pygame.display.flip()
+            # Only erase what the scene drew last frame, then push old + new rects
+            for rect in self._dirty_rects:
+                self._restore_floor(rect)
+            self.view.draw(background=False)
+            pygame.display.update(merge_rects(self._dirty_rects + self.view.drawn_rects))
+        self._dirty_rects = self.view.drawn_rects
 
     def draw_intro_overlay(self):
-         if getattr(self, "start_bg_raw", None):
-             key = (self.width, self.height)
-             if key not in self._start_bg_cache:
-                 self._start_bg_cache[key] = pygame.transform.smoothscale(self.start_bg_raw, (self.width, self.height))
-             self.screen.blit(self._start_bg_cache[key], (0, 0))
-         else:
-             self.screen.fill(BLACK)
+        # Nothing on the intro changes: compose it once, then every frame is one blit
+        if self._intro_surface is None:
+            self._intro_surface = self._build_intro_surface()
+        self.screen.blit(self._intro_surface, (0, 0))
+        pygame.display.flip()
+
+    def _build_intro_surface(self):
+        """Compose the start screen over the floor, plus its buttons; also sets the button hitboxes."""
+        surface = pygame.Surface((self.width, self.height)).convert()
+        if self._floor_bg is not None:
+            surface.blit(self._floor_bg, (0, 0))
+        else:
+            surface.fill(BLACK)
+        if self._start_bg is not None:
+            surface.blit(self._start_bg, (0, 0))
+        else:
+            surface.fill(BLACK)
         # No intro text; background only with buttons
 
         # Anchor for button placement
@@ -538,44 +564,44 @@ class ModernSimICU:
         btn_w, btn_h = 240, 64
         btn_x = (self.width - btn_w) // 2
         btn_y = y + 430
-        pygame.draw.rect(self.screen, DARK_PINK, (btn_x, btn_y, btn_w, btn_h), border_radius=6)
-        pygame.draw.rect(self.screen, WHITE, (btn_x, btn_y, btn_w, btn_h), 2, border_radius=6)
-        btn_text = self.large_font.render("START GAME", self.retro_antialias, WHITE)
-        self.screen.blit(btn_text, (btn_x + (btn_w - btn_text.get_width()) // 2,
-                                    btn_y + (btn_h - btn_text.get_height()) // 2))
-        self._intro_button = (btn_x, btn_y, btn_w, btn_h)
+        pygame.draw.rect(surface, DARK_PINK, (btn_x, btn_y, btn_w, btn_h), border_radius=6)
+        pygame.draw.rect(surface, WHITE, (btn_x, btn_y, btn_w, btn_h), 2, border_radius=6)
+        btn_text = self._t_start
+        surface.blit(btn_text, (btn_x + (btn_w - btn_text.get_width()) // 2,
+                                btn_y + (btn_h - btn_text.get_height()) // 2))
+        self._intro_button = pygame.Rect(btn_x, btn_y, btn_w + 1, btn_h + 1)  # +1: edges inclusive
         # Rules button below
         r_w, r_h = 220, 48
         r_x = (self.width - r_w) // 2
         r_y = btn_y + btn_h + 16
-        pygame.draw.rect(self.screen, DARK_GRAY, (r_x, r_y, r_w, r_h), border_radius=6)
-        pygame.draw.rect(self.screen, WHITE, (r_x, r_y, r_w, r_h), 2, border_radius=6)
-        r_text = self.font.render("RULES", self.retro_antialias, WHITE)
-        self.screen.blit(r_text, (r_x + (r_w - r_text.get_width()) // 2,
-                                  r_y + (r_h - r_text.get_height()) // 2))
-        self._intro_rules_button = (r_x, r_y, r_w, r_h)
-        pygame.display.flip()
+        pygame.draw.rect(surface, DARK_GRAY, (r_x, r_y, r_w, r_h), border_radius=6)
+        pygame.draw.rect(surface, WHITE, (r_x, r_y, r_w, r_h), 2, border_radius=6)
+        r_text = self._t_rules
+        surface.blit(r_text, (r_x + (r_w - r_text.get_width()) // 2,
+                              r_y + (r_h - r_text.get_height()) // 2))
+        self._intro_rules_button = pygame.Rect(r_x, r_y, r_w + 1, r_h + 1)
+        return surface
  
-     def draw_rules_overlay(self):
-         # Rules page uses a solid black background for readability
-         self.screen.fill(BLACK)
-         title = self.large_font.render("RULES", self.retro_antialias, YELLOW)
-         self.screen.blit(title, ((self.width - title.get_width()) // 2, 100))
-         lines = [
-             "Goal: Save as many patients as possible with limited beds, nurses, and ventilators.",
-             "Patients worsen while waiting; treatment has setup delays; step-down beds cause ICU gridlock.",
-             "",
-             "How to Play:",
-             " - The AI selects actions automatically each step.",
-             " - You can pause with SPACE and reset with R.",
-             " - EMR overlay toggles with E.",
-             " - You lose when 10 patients die. Try to get the highest score.",
-             "",
-             "Patient Types:",
-             " - R (Respiratory): Recovers faster on ventilator; standard bed recovery.",
-             " - C (Cardiac): Responds best to bed care (faster bed recovery). Dies faster once health <= 25.",
-             " - T (Trauma): Slower recovery overall; prioritize resources to avoid long waits. Deteriorates ~3x faster than Respiratory while waiting."
-         ]
+    def draw_rules_overlay(self):
+        # Rules page uses a solid black background for readability
+        self.screen.fill(BLACK)
+        title = self._t_rules_title
+        self.screen.blit(title, ((self.width - title.get_width()) // 2, 100))
+        lines = [
+            "Goal: Save as many patients as possible with limited beds, nurses, and ventilators.",
+            "Patients worsen while waiting; treatment has setup delays; step-down beds cause ICU gridlock.",
+            "",
+            "How to Play:",
+            " - The AI selects actions automatically each step.",
+            " - You can pause with SPACE and reset with R.",
+            " - EMR overlay toggles with E.",
+            " - You lose when 10 patients die. Try to get the highest score.",
+            "",
+            "Patient Types:",
+            " - R (Respiratory): Recovers faster on ventilator; standard bed recovery.",
+            " - C (Cardiac): Responds best to bed care (faster bed recovery). Dies faster once health <= 25.",
+            " - T (Trauma): Slower recovery overall; prioritize resources to avoid long waits. Deteriorates ~3x faster than Respiratory while waiting."
+        ]
         y = 170
         # helper to wrap within screen while preserving simple bullet indentation
         def render_wrapped(text, color, y_pos, base_x=80):
@@ -604,17 +630,17 @@ class ModernSimICU:
         for line in lines:
             color = WHITE if line and line[0] != ' ' else LIGHT_GRAY
             y = render_wrapped(line, color, y)
-         # Back button
-         b_w, b_h = 200, 50
-         b_x = (self.width - b_w) // 2
-         b_y = y + 30
-         pygame.draw.rect(self.screen, BLUE, (b_x, b_y, b_w, b_h), border_radius=6)
-         pygame.draw.rect(self.screen, WHITE, (b_x, b_y, b_w, b_h), 2, border_radius=6)
-         b_text = self.large_font.render("BACK", self.retro_antialias, WHITE)
-         self.screen.blit(b_text, (b_x + (b_w - b_text.get_width()) // 2,
+        # Back button
+        b_w, b_h = 200, 50
+        b_x = (self.width - b_w) // 2
+        b_y = y + 30
+        pygame.draw.rect(self.screen, BLUE, (b_x, b_y, b_w, b_h), border_radius=6)
+        pygame.draw.rect(self.screen, WHITE, (b_x, b_y, b_w, b_h), 2, border_radius=6)
+        b_text = self._t_back
+        self.screen.blit(b_text, (b_x + (b_w - b_text.get_width()) // 2,
                                    b_y + (b_h - b_text.get_height()) // 2))
-         self._rules_back_button = (b_x, b_y, b_w, b_h)
-         pygame.display.flip()
+        self._rules_back_button = pygame.Rect(b_x, b_y, b_w + 1, b_h + 1)
+        pygame.display.flip()
 
     def _push_reco(self, text: str):
         self.reco_log.append(text)
@@ -623,7 +649,7 @@ class ModernSimICU:
 
     def _heuristic_reason(self, patient, action_type):
         crisis_score = patient.severity * max(1, patient.time_waiting)
-        typ = patient.patient_type.value if hasattr(patient, "patient_type") else "unknown"
+        typ = patient.patient_type.value
         if action_type == 1:
             return f"RECOMMENDING: Patient {patient.id} -> Vent | REASON: Crisis={crisis_score:.0f}, type={typ}"
         elif action_type == 0:
@@ -634,9 +660,10 @@ class ModernSimICU:
     def _draw_emr_overlay(self):
         if not self.show_emr:
             return
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        if self._emr_dim is None:
+            self._emr_dim = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._emr_dim.fill((0, 0, 0, 180))
+        self.screen.blit(self._emr_dim, (0, 0))
         # Mock EMR card
         card_w, card_h = 520, 300
         card_x, card_y = (self.width - card_w) // 2, (self.height - card_h) // 2
@@ -648,7 +675,7 @@ class ModernSimICU:
         if self.env.game.patients:
             p = max(self.env.game.patients, key=lambda q: q.severity * max(1, q.time_waiting))
             lines = [
-                f"Patient #{p.id} | Type: {getattr(p, 'patient_type', PatientType.RESPIRATORY).value}",
+                f"Patient #{p.id} | Type: {p.patient_type.value}",
                 f"Severity: {p.severity:.0f}   Waiting: {p.time_waiting}   Status: {p.status.value}",
                 "AI Suggests: " + ("Ventilator" if self.env.game.free_vents > 0 else "Bed" if self.env.game.free_beds > 0 else "Observe"),
                 "Reason: Max crisis score across cohort"
@@ -666,6 +693,11 @@ class ModernSimICU:
         
         while running:
             for event in pygame.event.get():
+                if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.WINDOWEXPOSED):
+                    # Any input or an uncovered window needs a redraw
+                    self._dirty = True
+                    if event.type == pygame.WINDOWEXPOSED:
+                        self._full_redraw = True
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
@@ -674,6 +706,7 @@ class ModernSimICU:
                             self.show_intro = False
                         else:
                             self.paused = not self.paused
+                            self._full_redraw = True
                     elif event.key == pygame.K_r:
                         if self.show_intro:
                             self.show_intro = False
@@ -689,31 +722,26 @@ class ModernSimICU:
                         running = False
                     elif event.key == pygame.K_e:
                         self.show_emr = not self.show_emr
+                        self._full_redraw = True
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:
-                        mx, my = event.pos
-                        if getattr(self, "show_intro", False):
-                            if hasattr(self, "_intro_button"):
-                                bx, by, bw, bh = self._intro_button
-                                if bx <= mx <= bx + bw and by <= my <= by + bh:
-                                    self.show_intro = False
-                                    continue
-                            if hasattr(self, "_intro_rules_button"):
-                                rx, ry, rw, rh = self._intro_rules_button
-                                if rx <= mx <= rx + rw and ry <= my <= ry + rh:
-                                    self.show_intro = False
-                                    self.show_rules = True
-                                    continue
-                        if getattr(self, "show_rules", False):
-                            if hasattr(self, "_rules_back_button"):
-                                bx, by, bw, bh = self._rules_back_button
-                                if bx <= mx <= bx + bw and by <= my <= by + bh:
-                                    self.show_rules = False
-                                    self.show_intro = True
-                                    continue
+                        if self.show_intro:
+                            if self._intro_button.collidepoint(event.pos):
+                                self.show_intro = False
+                                continue
+                            if self._intro_rules_button.collidepoint(event.pos):
+                                self.show_intro = False
+                                self.show_rules = True
+                                continue
+                        if self.show_rules:
+                            if self._rules_back_button.collidepoint(event.pos):
+                                self.show_rules = False
+                                self.show_intro = True
+                                continue
             
             # Do not run the AI or advance the env while on intro or rules screens
-            if not self.paused and not done and not getattr(self, "show_intro", False) and not getattr(self, "show_rules", False):
+            if not self.paused and not done and not self.show_intro and not self.show_rules:
+                self._dirty = True
                 # Let AI make decisions
                 for _ in range(self.speed):
                     terminated = False
@@ -722,26 +750,21 @@ class ModernSimICU:
                     # If a deferred assignment is ready (nurse arrived), apply it now via env.step
                     if self.view.ready_to_apply_deferred and self.view.deferred_action is not None:
                         pid, at = self.view.deferred_action
-                        self.obs, reward, terminated, truncated, self.info = self.env.step(np.array([pid, at], dtype=np.int64))
+                        self.obs, reward, terminated, truncated, self.info = self.env.step((pid, at))
                         self.view.deferred_action = None
                         self.view.ready_to_apply_deferred = False
                         done = terminated or truncated
                         if done:
                             break
 
-                    action, _ = self.model.predict(self.obs, deterministic=True)
+                    # Unbox both action components to Python ints in a single call
+                    pid, at = self._predict_action()
                     # If any patient is walking or a nurse is already en route, block new assignments
-                    try:
-                        if (len(self.view.patient_moves) > 0) or (len(self.view.pending_assignments) > 0):
-                            pid, at = int(action[0]), int(action[1])
-                            if at in (0, 1):
-                                # convert to no-op while movement in progress
-                                action = np.array([0, 2], dtype=np.int64)
-                                self._push_reco("Blocked: movement in progress -> NO-OP")
-                    except Exception:
-                        pass
+                    if at in (0, 1) and (self.view.patient_moves or self.view.pending_assignments):
+                        # convert to no-op while movement in progress
+                        pid, at = 0, 2
+                        self._push_reco("Blocked: movement in progress -> NO-OP")
                     # Convert RL action to controller calls; defer env step on assignments
-                    pid, at = int(action[0]), int(action[1])
                     applied = False
                     if at in (0, 1) and pid < len(self.env.game.patients):
                         p = self.env.game.patients[pid]
@@ -749,39 +772,40 @@ class ModernSimICU:
                             if self.view.select_patient(pid):
                                 if at == 0:
                                     # choose first available bed index
-                                    try:
-                                        bidx = next(i for i, b in enumerate(self.env.game.beds) if b.available)
-                                        applied = self.view.click_bed(bidx)
-                                    except StopIteration:
-                                        applied = False
+                                    free = np.flatnonzero(self.env.game.bed_available)
+                                    applied = bool(free.size) and self.view.click_bed(int(free[0]))
                                 else:
-                                    try:
-                                        vidx = next(i for i, v in enumerate(self.env.game.ventilators) if v.available)
-                                        applied = self.view.click_vent(vidx)
-                                    except StopIteration:
-                                        applied = False
+                                    free = np.flatnonzero(self.env.game.vent_available)
+                                    applied = bool(free.size) and self.view.click_vent(int(free[0]))
                     if not applied:
                         # fall back to stepping env (no-op or invalid)
-                        self.obs, reward, terminated, truncated, self.info = self.env.step(action)
+                        self.obs, reward, terminated, truncated, self.info = self.env.step((pid, at))
                     # XAI log: try to reconstruct which patient was acted on
-                    try:
-                        if pid < len(self.env.game.patients):
-                            p = self.env.game.patients[pid]
-                            self._push_reco(self._heuristic_reason(p, at))
-                    except Exception:
-                        pass
+                    if pid < len(self.env.game.patients):
+                        self._push_reco(self._heuristic_reason(self.env.game.patients[pid], at))
                     done = terminated or truncated
  
             # Update shared animations each frame
             self.view.update_animations()
-            self.draw()
-            # EMR overlay after drawing
-            self._draw_emr_overlay()
+            # Paused (or finished) with no input and nothing moving: the screen is already current
+            if self._dirty or self.view.animating:
+                self.draw()
+                self._dirty = False
             self.clock.tick(10)  # 10 FPS
         
         pygame.quit()
         sys.exit()
 
+    def _predict_action(self):
+        """Deterministic policy action for self.obs using the preallocated tensor."""
+        if self._obs_view is not None:
+            np.copyto(self._obs_view, self.obs)
+        else:
+            self._obs_tensor.copy_(torch.from_numpy(self.obs))
+        with torch.inference_mode():
+            action = self.model.policy.get_distribution(self._obs_batch).get_actions(deterministic=True)
+        return action[0].tolist()
+
     # --- Nurse animation helpers (parity with Retro) ---
     def _row_corridor_y(self):
         # Midline of the bed area as a simple corridor
@@ -802,31 +826,33 @@ class ModernSimICU:
             path.append((tx, ty))
         return path
 
-    def _get_nurse_target(self, nurse, size=None):
+    def _get_nurse_target(self, nurse, pending_by_nurse, size=None):
         # If there is a pending assignment for this nurse, go to that resource tile
-        for task in self.pending_assignments:
-            if task.get('nurse') == nurse:
-                if 'bed' in task and task['bed'] in self.bed_positions:
-                    bx, by, bw, bh = self.bed_positions[task['bed']]
-                    return bx + bw - (size or self.nurse_size), by
-                if 'vent' in task and task['vent'] in self.vent_positions:
-                    vx, vy, vw, vh = self.vent_positions[task['vent']]
-                    return vx + vw - (size or self.nurse_size), vy
+        task = pending_by_nurse.get(nurse)
+        if task is not None:
+            if 'bed' in task and task['bed'] in self.bed_positions:
+                bx, by, bw, bh = self.bed_positions[task['bed']]
+                return bx + bw - (size or self.nurse_size), by
+            if 'vent' in task and task['vent'] in self.vent_positions:
+                vx, vy, vw, vh = self.vent_positions[task['vent']]
+                return vx + vw - (size or self.nurse_size), vy
         # Otherwise go to station
         return self.nurse_stations.get(nurse, (850, self.bed_area_y + 50))
 
     def _update_nurse_positions(self, size=None):
         if size is None:
             size = self.nurse_size
+        # First pending task per nurse wins, matching the order tasks were queued
+        pending_by_nurse = {t['nurse']: t for t in reversed(self.pending_assignments)}
         for nurse in self.env.game.nurses:
-            target_x, target_y = self._get_nurse_target(nurse, size=size)
+            target_x, target_y = self._get_nurse_target(nurse, pending_by_nurse, size=size)
             if nurse not in self.nurse_positions:
                 self.nurse_positions[nurse] = self.nurse_stations.get(nurse, (850, self.bed_area_y + 50))
                 self.nurse_paths[nurse] = []
                 continue
             cur_x, cur_y = self.nurse_positions[nurse]
             # Idle if no pending assignment
-            has_pending = any(t.get('nurse') == nurse for t in self.pending_assignments)
+            has_pending = nurse in pending_by_nurse
             is_idle = not has_pending
             use_corridor = not is_idle
             if is_idle:
@@ -837,12 +863,13 @@ class ModernSimICU:
                     continue
             dx_t = target_x - cur_x
             dy_t = target_y - cur_y
-            dist_to_target = (dx_t * dx_t + dy_t * dy_t) ** 0.5
-            if dist_to_target <= 2:
+            # Thresholds only, so compare squared distances (2px snap, 20px direct approach)
+            dist2_to_target = dx_t * dx_t + dy_t * dy_t
+            if dist2_to_target <= 4:
                 self.nurse_positions[nurse] = (target_x, target_y)
                 self.nurse_paths[nurse] = []
                 continue
-            if dist_to_target <= 20:
+            if dist2_to_target <= 400:
                 use_corridor = False
             if nurse not in self.nurse_paths:
                 self.nurse_paths[nurse] = []
@@ -856,48 +883,44 @@ class ModernSimICU:
                 wx, wy = target_x, target_y
             dx = wx - cur_x
             dy = wy - cur_y
-            dist = (dx * dx + dy * dy) ** 0.5
-            if dist < 1:
+            if dx * dx + dy * dy < 1:
                 if self.nurse_paths[nurse]:
                     self.nurse_paths[nurse].pop(0)
-                if not self.nurse_paths[nurse] and dist_to_target <= 2:
+                if not self.nurse_paths[nurse] and dist2_to_target <= 4:
                     self.nurse_positions[nurse] = (target_x, target_y)
                     continue
                 self.nurse_positions[nurse] = (wx, wy)
                 continue
+            dist = math.hypot(dx, dy)
             step = min(self.nurse_speed, dist)
-            if dist > 0:
-                new_x = cur_x + dx / dist * step
-                new_y = cur_y + dy / dist * step
-            else:
-                new_x, new_y = wx, wy
-            self.nurse_positions[nurse] = (new_x, new_y)
+            self.nurse_positions[nurse] = (cur_x + dx / dist * step, cur_y + dy / dist * step)
 
         # Complete pending tasks when nurse reaches target tile (trigger deferred engine assignment)
         if self.pending_assignments:
-            remaining = []
-            for task in self.pending_assignments:
+            # Rotate the queue once: finished tasks drop out, the rest go back in order
+            pending = self.pending_assignments
+            for _ in range(len(pending)):
+                task = pending.popleft()
                 nurse = task['nurse']
                 nx, ny = self.nurse_positions.get(nurse, (None, None))
                 if nx is None:
-                    remaining.append(task)
+                    pending.append(task)
                     continue
                 if 'bed' in task and task['bed'] in self.bed_positions:
                     bx, by, bw, bh = self.bed_positions[task['bed']]
                     reached_rect = (bx - 4) <= nx <= (bx + bw + 4) and (by - 4) <= ny <= (by + bh + 4)
                     if not reached_rect:
-                        remaining.append(task)
+                        pending.append(task)
                         continue
                 if 'vent' in task and task['vent'] in self.vent_positions:
                     vx, vy, vw, vh = self.vent_positions[task['vent']]
                     reached_rect = (vx - 4) <= nx <= (vx + vw + 4) and (vy - 4) <= ny <= (vy + vh + 4)
                     if not reached_rect:
-                        remaining.append(task)
+                        pending.append(task)
                         continue
                 # reached -> apply deferred assignment at next loop iteration
                 self.view.ready_to_apply_deferred = True
                 # nurse will head back to station automatically when idle
-            self.pending_assignments = remaining
 
 
 if __name__ == "__main__":
@@ -7,7 +7,16 @@ import pygame
 import sys
 import os
 import math
+from collections import deque
+from functools import lru_cache
+import numpy as np
 from sim_icu_logic import SimICU, PatientStatus, PatientType
+from sim_icu_kernels import step_nurses
+from ui_shared import merge_rects, scaled_sprite
+try:
+    from retro_mode_core import NurseKinematics  # optional Cython build, see README
+except ImportError:
+    NurseKinematics = None
 
 
 # Colors (retro palette)
@@ -25,6 +34,20 @@ DARK_RED = (139, 0, 0)
 DARK_GREEN = (0, 100, 0)
 DARK_PINK = (199, 21, 133)
 
+TYPE_LETTERS = {PatientType.RESPIRATORY: "R", PatientType.CARDIAC: "C", PatientType.TRAUMA: "T"}
+
+# Life-bar color per whole severity point: green when high life, orange mid, red low
+LIFE_COLORS = tuple(GREEN if s >= 70 else ORANGE if s >= 40 else RED for s in range(101))
+
+# Fonts registered by RetroSimICU under short keys ("small", "font", "large", "title")
+_fonts = {}
+
+
+@lru_cache(maxsize=1024)
+def _render(font_key, text, color, antialias=False):
+    """Rendered text surface, cached: labels like "Saved: 3" or "#12" repeat across frames."""
+    return _fonts[font_key].render(text, antialias, color).convert_alpha()
+
 
 class RetroSimICU:
     """Pygame frontend for SimICU"""
@@ -60,6 +83,8 @@ class RetroSimICU:
         self.font = pygame.font.Font(base_font, 28)
         self.large_font = pygame.font.Font(base_font, 40)
         self.title_font = pygame.font.Font(base_font, 64)
+        _fonts.update(small=self.small_font, font=self.font, large=self.large_font, title=self.title_font)
+        _render.cache_clear()
         
         # Initialize game
         self.game = SimICU()
@@ -70,25 +95,30 @@ class RetroSimICU:
         self.update_every_n_frames = 2  # higher -> slower simulation
         self._frame_counter = 0
         self.paused = False
+        self.paused_fps = 2   # wake-ups per second while paused (input is still polled)
         self.show_intro = True
+        self.show_rules = False
+        # Overlay button hitboxes, placed when the overlay is drawn (empty Rects never collide)
+        self._intro_button = pygame.Rect(0, 0, 0, 0)
+        self._intro_rules_button = pygame.Rect(0, 0, 0, 0)
+        self._rules_back_button = pygame.Rect(0, 0, 0, 0)
         self.game_over = False
         self.final_score = None
 
-        # Sprites
+        # Sprites (loaded after set_mode so convert_alpha() can match the display format;
+        # every scaled copy below is converted again so blits never re-convert per frame)
         base_dir = os.path.dirname(__file__)
         bed_path = os.path.join(base_dir, "sprites", "bed.png")
         try:
             self.bed_sprite_raw = pygame.image.load(bed_path).convert_alpha()
         except Exception:
             self.bed_sprite_raw = None  # fallback to rects if not found
-        self._bed_sprite_cache = {}
 
         nurse_path = os.path.join(base_dir, "sprites", "nurse.png")
         try:
             self.nurse_sprite_raw = pygame.image.load(nurse_path).convert_alpha()
         except Exception:
             self.nurse_sprite_raw = None
-        self._nurse_sprite_cache = {}
 
         # Patient sprite (standing/selected) -> raised hand variant
         standing_path = os.path.join(base_dir, "sprites", "raised_hand.png")
@@ -97,6 +127,10 @@ class RetroSimICU:
         except Exception:
             self.patient_sprite_raw = None
         self._patient_sprite_cache = {}
+        if self.patient_sprite_raw:
+            # Walking (140x110) and standing-at-target (100x80) sizes used by draw_patient(bar_only=True)
+            self._fitted_patient_sprite(140, 110)
+            self._fitted_patient_sprite(100, 80)
 
         # Patient-in-bed sprite (bed occupied visual)
         bed_patient_path = os.path.join(base_dir, "sprites", "patient.png")
@@ -105,6 +139,7 @@ class RetroSimICU:
         except Exception:
             self.patient_in_bed_sprite_raw = None
         self._patient_in_bed_sprite_cache = {}
+        self._scale_cache = {}  # scaled_sprite() memo for art drawn at non-default sizes
         # Scale factor to draw patient-in-bed a bit larger than the bed tile
         self.patient_in_bed_scale = 1.2
         # Scale for standing sprite in waiting room
@@ -125,7 +160,6 @@ class RetroSimICU:
             self.waiting_bg_raw = pygame.image.load(wr_path).convert_alpha()
         except Exception:
             self.waiting_bg_raw = None
-        self._waiting_bg_cache = {}
 
         # Ventilator bed and occupied sprites
         vent_bed_path = os.path.join(base_dir, "sprites", "vent_bed.png")
@@ -148,7 +182,6 @@ class RetroSimICU:
             self.start_bg_raw = pygame.image.load(start_bg_path).convert_alpha()
         except Exception:
             self.start_bg_raw = None
-        self._start_bg_cache = {}
 
         # Global hospital floor background
         floor_path = os.path.join(base_dir, "sprites", "hospital_floor.png")
@@ -156,7 +189,6 @@ class RetroSimICU:
             self.floor_bg_raw = pygame.image.load(floor_path).convert()
         except Exception:
             self.floor_bg_raw = None
-        self._floor_bg_cache = {}
 
         # Divider sprite (privacy curtain) to draw near ventilators
         divider_path = os.path.join(base_dir, "sprites", "divider.png")
@@ -164,23 +196,37 @@ class RetroSimICU:
             self.divider_sprite_raw = pygame.image.load(divider_path).convert_alpha()
         except Exception:
             self.divider_sprite_raw = None
-        self._divider_cache_by_height = {}
         # Make dividers larger
         self.divider_width_scale = 1.5
         self.divider_height_scale = 1.5
         self.divider_left_shift = -40  # move further left toward ventilators
 
-        # Object position maps for animation targets
-        self.bed_positions = {}   # bed -> (x, y, w, h)
-        self.vent_positions = {}  # vent -> (x, y, w, h)
+        # Position tables for animation targets, indexed by bed.id / vent.id (filled by _build_layout)
+        self.bed_positions = []   # (x, y, w, h)
+        self.vent_positions = []  # (x, y, w, h)
 
-        # Nurse movement state
-        self.nurse_positions = {}  # nurse -> (x, y)
-        self.nurse_stations = {}   # nurse -> (x, y)
+        # Nurse movement state, indexed by nurse.id (SimICU numbers nurses 0..n-1)
+        self.nurse_positions = []  # [x, y]
+        self.nurse_stations = []   # (x, y), filled in _ensure_nurse_arrays
         self.nurse_speed = 60      # pixels per tick
         self.nurse_size = 72       # draw size (slightly bigger nurse)
-        self.nurse_paths = {}      # nurse -> [(x, y), ...] waypoints
-        self.pending_assignments = []  # [{'nurse': Nurse, 'patient': Patient, 'bed': Bed}]
+        # Beds are always drawn 120x120 and nurses at nurse_size: scale once up-front
+        self.bed_sprite = None
+        if self.bed_sprite_raw:
+            self.bed_sprite = pygame.transform.scale(self.bed_sprite_raw, (120, 120)).convert_alpha()
+        self.nurse_sprite = None
+        if self.nurse_sprite_raw:
+            self.nurse_sprite = pygame.transform.scale(self.nurse_sprite_raw, (self.nurse_size, self.nurse_size)).convert_alpha()
+        # SoA nurse motion state, one row per nurse.id (allocated in _ensure_nurse_arrays)
+        self._nurse_roster = None
+        self._nurse_pos = np.zeros((0, 2), dtype=np.float32)
+        self._nurse_target = np.zeros_like(self._nurse_pos)
+        self._nurse_waypoint = np.zeros_like(self._nurse_pos)
+        self._nurse_path = np.zeros((0, 3, 2), dtype=np.float32)  # 2-turn Manhattan waypoints
+        self._nurse_path_len = np.zeros(0, dtype=np.int8)
+        self._nurse_placed = np.zeros(0, dtype=bool)
+        self._kin = NurseKinematics(self.nurse_speed) if NurseKinematics is not None else None
+        self.pending_assignments = deque()  # [{'nurse': Nurse, 'patient': Patient, 'bed': Bed}], in queue order
         self.input_cooldown_ticks = 0  # limit human action rate
 
         # Patient walking/reservations
@@ -196,253 +242,416 @@ class RetroSimICU:
         self.bed_area_height = 400
         self.ui_panel_x = 900
         self.ui_panel_width = 300
-    
-    def draw_patient(self, patient, x, y, width=100, height=80, minimal=False, bar_only=False):
-        """Draw a patient.
-        minimal=True renders only the life bar (used for waiting room).
+
+        # Pre-composed cards: (kind, state...) -> (Surface, (dx, dy)) holding the
+        # parts of a patient/bed/vent tile that only change with its state
+        self._card_cache = {}
+        # Per-update reverse index (rebuilt in _update_nurse_positions); bed/vent occupants come from the game
+        self._nurse_to_patient = {}
+        self._build_backgrounds()
+        self._instructions_surface = self._build_instructions_surface()
+        self._intro_surface = None  # composed on first draw_intro_overlay()
+        self._static_panel = self._build_static_panel()
+        # Composed panel (static art + counters), recomposed only when a displayed value changes
+        self._panel_surface = self._static_panel.copy()
+        self._panel_state = None
+        self._panel_rect = self._panel_surface.get_rect(topleft=(self.ui_panel_x, 50))
+        # Tile layout and click hitboxes (rebuilt by _build_layout when bed/vent counts change)
+        self._layout_counts = None
+        self._bed_layout = []   # (x, y) per bed
+        self._vent_layout = []  # (x, y) per vent
+        self._bed_rects = []
+        self._vent_rects = []
+        self._waiting_patient_rects = []
+        self._build_layout()
+        # Waiting list, recomputed only when the game re-syncs its status array (ticks/assignments)
+        self._waiting_list = []
+        self._waiting_status_ref = None
+        # Composed waiting room (background, border, visible patients) and the state it shows
+        self._waiting_surface = None
+        self._waiting_pos = (0, 0)
+        self._waiting_key = None
+        # Redraw request for run(): set by ticks and input, cleared after each draw()
+        self._dirty = True
+        self._bar_cache = {}       # (bar_width, color) -> filled Surface
+        # Blits queued during draw(), flushed in batches via Surface.blits()
+        self._frame_blits = []
+        # Screen areas drawn this frame; the next frame restores the floor under them
+        # and only those areas (old and new) are pushed to the display
+        self._dirty_rects = []
+        self._full_redraw = True
+
+    def _build_backgrounds(self):
         """
-        # Bar-only mode: show ONLY the health bar (used while walking to bed)
-        if bar_only:
-            # Draw sprite (no box/labels) if available
-            if self.patient_sprite_raw:
-                key = (width, height, "bar_only")
-                if key not in self._patient_sprite_cache:
-                    src_w, src_h = self.patient_sprite_raw.get_size()
-                    scale = min(width / src_w, height / src_h)
-                    scaled = (max(1, int(src_w * scale)), max(1, int(src_h * scale)))
-                    self._patient_sprite_cache[key] = pygame.transform.smoothscale(self.patient_sprite_raw, scaled)
-                sprite = self._patient_sprite_cache[key]
-                draw_x = x + (width - sprite.get_width()) // 2
-                draw_y = y + (height - sprite.get_height()) // 2
-                self.screen.blit(sprite, (draw_x, draw_y))
-            bar_width = int((patient.severity / 100.0) * width)
-            bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-            pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
-            return
+        Scale the fixed-size art once into plain attributes (None when the sprite is missing):
+        floor and start screen at window size, waiting room at its panel size, divider at tile height.
+        The floor, waiting-room and start-screen art is fully opaque, so convert() (no per-pixel
+        alpha) makes those large blits and the floor restores plain copies instead of blends.
+        """
+        size = (self.width, self.height)
+        self._floor_bg = pygame.transform.smoothscale(self.floor_bg_raw, size).convert() if self.floor_bg_raw else None
+        self._start_bg = pygame.transform.smoothscale(self.start_bg_raw, size).convert() if self.start_bg_raw else None
+        self._waiting_bg = None
+        if self.waiting_bg_raw:
+            self._waiting_bg = pygame.transform.smoothscale(self.waiting_bg_raw, (800, self.waiting_room_height)).convert()
+        self._divider = None
+        if self.divider_sprite_raw:
+            base_w, base_h = self.divider_sprite_raw.get_size()
+            sh = int(120 * self.divider_height_scale)
+            sw = int(base_w * (sh / base_h) * self.divider_width_scale)
+            self._divider = pygame.transform.smoothscale(self.divider_sprite_raw, (max(1, sw), max(1, sh))).convert_alpha()
 
-        if minimal:
-            # Waiting room: show standing sprite (if available) + life bar + number only.
-            # Pick which sprite to show: sitting by default, standing when selected
-            sprite_raw = None
-            cache = None
-            if self.selected_patient == patient and self.patient_sprite_raw:
-                sprite_raw = self.patient_sprite_raw
-                cache = self._patient_sprite_cache
-            elif self.sitting_sprite_raw:
-                sprite_raw = self.sitting_sprite_raw
-                cache = self._sitting_sprite_cache
-            elif self.patient_sprite_raw:
-                sprite_raw = self.patient_sprite_raw
-                cache = self._patient_sprite_cache
-            if sprite_raw is not None:
-                tw = max(1, int(width * self.waiting_sprite_scale_w))
-                th = max(1, int(height * self.waiting_sprite_scale_h))
-                key = (tw, th, "waiting")
-                if key not in cache:
-                    cache[key] = pygame.transform.smoothscale(sprite_raw, (tw, th))
-                sprite = cache[key]
-                draw_x = x + (width - tw) // 2
-                draw_y = y + (height - th) // 2
-                self.screen.blit(sprite, (draw_x, draw_y))
-            # Life bar and value
-            bar_width = int((patient.severity / 100.0) * width)
-            bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-            pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
-            life_value = int(round(patient.severity))
-            value_text = self.small_font.render(f"{life_value}", True, WHITE)
-            self.screen.blit(value_text, (x + 5, y + 5))
-            # Type badge (top-right)
-            try:
-                t = patient.patient_type
-                t_letter = "R" if t == PatientType.RESPIRATORY else "C" if t == PatientType.CARDIAC else "T"
-                badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
-                bw, bh = badge.get_size()
-                pad = 4
-                bx = x + width - bw - pad - 2
-                by = y + 2
-                pygame.draw.rect(self.screen, YELLOW, (bx - 2, by - 2, bw + 4, bh + 4))
-                self.screen.blit(badge, (bx, by))
-            except Exception:
-                pass
+    def _build_instructions_surface(self):
+        """Compose the six static instruction lines of the UI panel into one surface."""
+        instructions = [
+            "INSTRUCTIONS:",
+            "1. Click patient to select",
+            "2. Click bed to assign",
+            "3. Click vent for critical",
+            "SPACE: Pause/Resume",
+            "R: Reset game"
+        ]
+        lines = [_render("small", line, YELLOW, self.retro_antialias) for line in instructions]
+        width = max(line.get_width() for line in lines)
+        height = 20 * (len(lines) - 1) + lines[-1].get_height()
+        strip = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, line in enumerate(lines):
+            strip.blit(line, (0, i * 20))
+        return strip.convert_alpha()
+
+    def _build_static_panel(self):
+        """Pre-render the UI panel background, title, resources header and instructions."""
+        panel = pygame.Surface((self.ui_panel_width, self.height - 100))
+        panel.fill(DARK_GRAY)
+        pygame.draw.rect(panel, BLACK, panel.get_rect(), 2)
+        panel.blit(_render("large", "SIMICU", WHITE, self.retro_antialias), (20, 20))
+        panel.blit(_render("font", "Resources:", WHITE, self.retro_antialias), (20, 225))
+        panel.blit(self._instructions_surface, (20, 345))
+        return panel.convert()
+
+    def _build_layout(self):
+        """
+        Precompute bed/vent tile positions, the nurse targeting tables and the click Rects
+        for beds, vents and waiting-room slots (edges inclusive). The grid only depends on
+        the resource counts, so draw() and handle_click() share it instead of recomputing it.
+        """
+        counts = (len(self.game.beds), len(self.game.ventilators))
+        if counts == self._layout_counts:
             return
-        # If we have a sprite, draw it scaled; otherwise fallback to colored box
-        drew_sprite = False
+        self._layout_counts = counts
+        self._bed_layout = [(200 + (i % 4) * 150, self.bed_area_y + (i // 4) * 120) for i in range(counts[0])]
+        self._vent_layout = [(50, self.bed_area_y + i * 120) for i in range(counts[1])]
+        self.bed_positions = [(x, y, 120, 120) for x, y in self._bed_layout]
+        self.vent_positions = [(x, y, 120, 120) for x, y in self._vent_layout]
+        self._bed_rects = [pygame.Rect(x, y, 121, 121) for x, y in self._bed_layout]
+        self._vent_rects = [pygame.Rect(x, y, 121, 121) for x, y in self._vent_layout]
+        self._waiting_patient_rects = []
+
+    def _waiting_slot_rects(self, count):
+        """Waiting-room slot Rects for the first `count` waiting patients."""
+        rects = self._waiting_patient_rects
+        for i in range(len(rects), count):
+            rects.append(pygame.Rect(50 + i * 120, self.waiting_room_y + 20, 101, 81))
+        return rects[:count]
+
+    def _card(self, key, build):
+        card = self._card_cache.get(key)
+        if card is None:
+            card = self._card_cache[key] = build()
+        return card
+
+    def _compose_card(self, width, height, layers):
+        """
+        Flatten (surface, (x, y)) layers positioned relative to a width x height
+        tile into one alpha surface. Returns (surface, (dx, dy)) where (dx, dy)
+        is the card's offset from the tile origin.
+        """
+        bounds = pygame.Rect(0, 0, width, height)
+        for surf, pos in layers:
+            bounds.union_ip(surf.get_rect(topleft=pos))
+        card = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for surf, pos in layers:
+            card.blit(surf, (pos[0] - bounds.x, pos[1] - bounds.y))
+        return card.convert_alpha(), (bounds.x, bounds.y)
+
+    def _badge_layers(self, patient_type, width):
+        """Yellow type badge in the top-right corner of a tile."""
+        badge = _render("small", TYPE_LETTERS[patient_type], BLACK, self.retro_antialias)
+        bw, bh = badge.get_size()
+        bx = width - bw - 6
+        by = 2
+        box = pygame.Surface((bw + 4, bh + 4))
+        box.fill(YELLOW)
+        return [(box, (bx - 2, by - 2)), (badge, (bx, by))]
+
+    def _rect_layer(self, color, size, border=0):
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, surf.get_rect(), border)
+        return surf
+
+    def _build_waiting_card(self, selected, patient_type, width, height):
+        # Pick which sprite to show: sitting by default, standing when selected
+        sprite_raw = None
+        cache = None
+        if selected and self.patient_sprite_raw:
+            sprite_raw = self.patient_sprite_raw
+            cache = self._patient_sprite_cache
+        elif self.sitting_sprite_raw:
+            sprite_raw = self.sitting_sprite_raw
+            cache = self._sitting_sprite_cache
+        elif self.patient_sprite_raw:
+            sprite_raw = self.patient_sprite_raw
+            cache = self._patient_sprite_cache
+        layers = []
+        if sprite_raw is not None:
+            tw = max(1, int(width * self.waiting_sprite_scale_w))
+            th = max(1, int(height * self.waiting_sprite_scale_h))
+            key = (tw, th, "waiting")
+            if key not in cache:
+                cache[key] = pygame.transform.smoothscale(sprite_raw, (tw, th)).convert_alpha()
+            layers.append((cache[key], ((width - tw) // 2, (height - th) // 2)))
+        layers.extend(self._badge_layers(patient_type, width))
+        return self._compose_card(width, height, layers)
+
+    def _fitted_patient_sprite(self, width, height):
+        """(sprite, (dx, dy)): standing sprite fitted inside width x height (aspect kept) and its centering offset."""
+        key = (width, height, "fit")
+        entry = self._patient_sprite_cache.get(key)
+        if entry is None:
+            src_w, src_h = self.patient_sprite_raw.get_size()
+            scale = min(width / src_w, height / src_h)
+            scaled = (max(1, int(src_w * scale)), max(1, int(src_h * scale)))
+            sprite = pygame.transform.smoothscale(self.patient_sprite_raw, scaled).convert_alpha()
+            entry = self._patient_sprite_cache[key] = (sprite, ((width - scaled[0]) // 2, (height - scaled[1]) // 2))
+        return entry
+
+    def _build_patient_card(self, status, patient_type, selected, width, height):
+        layers = []
         if self.patient_sprite_raw:
-            key = (width, height)
-            if key not in self._patient_sprite_cache:
-                # Keep aspect ratio while fitting inside the target rect
-                src_w, src_h = self.patient_sprite_raw.get_size()
-                scale = min(width / src_w, height / src_h)
-                scaled = (max(1, int(src_w * scale)), max(1, int(src_h * scale)))
-                self._patient_sprite_cache[key] = pygame.transform.smoothscale(self.patient_sprite_raw, scaled)
-            sprite = self._patient_sprite_cache[key]
-            # center inside the box area
-            draw_x = x + (width - sprite.get_width()) // 2
-            draw_y = y + (height - sprite.get_height()) // 2
-            self.screen.blit(sprite, (draw_x, draw_y))
-            # outline the box for selection clarity
-            pygame.draw.rect(self.screen, BLACK, (x, y, width, height), 2)
-            drew_sprite = True
-        if not drew_sprite:
+            layers.append(self._fitted_patient_sprite(width, height))
+        else:
             # Patient body (rectangle)
-            color = RED if patient.status == PatientStatus.WAITING else GREEN
-            if patient.status == PatientStatus.ON_VENTILATOR:
+            color = RED if status == PatientStatus.WAITING else GREEN
+            if status == PatientStatus.ON_VENTILATOR:
                 color = BLUE
-            elif patient.status in [PatientStatus.CURED, PatientStatus.LOST]:
+            elif status in [PatientStatus.CURED, PatientStatus.LOST]:
                 color = GRAY
-            pygame.draw.rect(self.screen, color, (x, y, width, height))
-            pygame.draw.rect(self.screen, BLACK, (x, y, width, height), 2)
-        
-        # Severity bar
-        bar_width = int((patient.severity / 100.0) * width)
-        # Life bar: green when high life, orange mid, red low
-        bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-        pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
-        
-        # Patient ID
-        id_text = self.small_font.render(f"#{patient.id}", True, WHITE)
-        self.screen.blit(id_text, (x + 5, y + 5))
-        
-        # Status text
-        status_text = self.small_font.render(patient.status.value, True, WHITE)
-        self.screen.blit(status_text, (x + 5, y + 20))
-        
-        # Severity number (rounded to whole number)
-        life_value = int(round(patient.severity))
-        severity_text = self.small_font.render(f"{life_value}", True, WHITE)
-        self.screen.blit(severity_text, (x + 5, y + 35))
+            layers.append((self._rect_layer(color, (width, height)), (0, 0)))
+        # outline the box for selection clarity
+        layers.append((self._rect_layer(BLACK, (width, height), 2), (0, 0)))
+        layers.extend(self._badge_layers(patient_type, width))
+        if selected:
+            layers.append((self._rect_layer(YELLOW, (width + 4, height + 4), 3), (-2, -2)))
+        return self._compose_card(width, height, layers)
 
-        # Patient type badge (top-right)
-        try:
-            t = patient.patient_type
-            t_letter = "R" if t == PatientType.RESPIRATORY else "C" if t == PatientType.CARDIAC else "T"
-            badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
-            bw, bh = badge.get_size()
-            pad = 4
-            bx = x + width - bw - pad - 2
-            by = y + 2
-            pygame.draw.rect(self.screen, YELLOW, (bx - 2, by - 2, bw + 4, bh + 4))
-            self.screen.blit(badge, (bx, by))
-        except Exception:
-            pass
-        
-        # Highlight if selected
-        if self.selected_patient == patient:
-            pygame.draw.rect(self.screen, YELLOW, (x - 2, y - 2, width + 4, height + 4), 3)
-    
-    def draw_bed(self, bed, x, y, width=120, height=120):
-        """Draw a bed icon"""
-        # Record for nurse animation targeting
-        self.bed_positions[bed] = (x, y, width, height)
-        # Try to draw sprite; fallback to rectangle if missing
+    def _build_bed_card(self, available, patient_type, width, height):
+        layers = []
         if self.bed_sprite_raw or self.patient_in_bed_sprite_raw:
-            if bed.available:
+            if available:
                 # draw empty bed
-                if self.bed_sprite_raw:
-                    key = (width, height)
-                    if key not in self._bed_sprite_cache:
-                        self._bed_sprite_cache[key] = pygame.transform.smoothscale(self.bed_sprite_raw, (width, height))
-                    sprite = self._bed_sprite_cache[key]
-                    self.screen.blit(sprite, (x, y))
+                if self.bed_sprite:
+                    sprite = self.bed_sprite
+                    if sprite.get_size() != (width, height):
+                        sprite = scaled_sprite(self._scale_cache, self.bed_sprite_raw, (width, height), smooth=False)
+                    layers.append((sprite, (0, 0)))
                 else:
-                    pygame.draw.rect(self.screen, LIGHT_GRAY, (x, y, width, height))
+                    layers.append((self._rect_layer(LIGHT_GRAY, (width, height)), (0, 0)))
             else:
-                # occupied bed -> draw patient-in-bed sprite if available
+                # occupied bed -> patient-in-bed sprite, a bit larger than the bed and centered
                 if self.patient_in_bed_sprite_raw:
-                    # Scale a bit larger than bed and center
                     sw = max(1, int(width * self.patient_in_bed_scale))
                     sh = max(1, int(height * self.patient_in_bed_scale))
                     key2 = (sw, sh)
                     if key2 not in self._patient_in_bed_sprite_cache:
-                        self._patient_in_bed_sprite_cache[key2] = pygame.transform.smoothscale(self.patient_in_bed_sprite_raw, (sw, sh))
-                    occ_sprite = self._patient_in_bed_sprite_cache[key2]
-                    draw_x = x + (width - sw) // 2
-                    draw_y = y + (height - sh) // 2
-                    self.screen.blit(occ_sprite, (draw_x, draw_y))
+                        self._patient_in_bed_sprite_cache[key2] = pygame.transform.smoothscale(self.patient_in_bed_sprite_raw, (sw, sh)).convert_alpha()
+                    layers.append((self._patient_in_bed_sprite_cache[key2], ((width - sw) // 2, (height - sh) // 2)))
                 else:
                     # fallback rectangle for occupied
-                    pygame.draw.rect(self.screen, DARK_GRAY, (x, y, width, height))
+                    layers.append((self._rect_layer(DARK_GRAY, (width, height)), (0, 0)))
         else:
-            if bed.available:
-                color = LIGHT_GRAY
-            else:
-                color = DARK_GRAY
-            pygame.draw.rect(self.screen, color, (x, y, width, height))
+            layers.append((self._rect_layer(LIGHT_GRAY if available else DARK_GRAY, (width, height)), (0, 0)))
             # Bed label
-            label = "BED" if bed.available else "OCCUPIED"
-            label_text = self.small_font.render(label, True, BLACK if bed.available else WHITE)
-            text_rect = label_text.get_rect(center=(x + width // 2, y + height // 2))
-            self.screen.blit(label_text, text_rect)
-        # If bed is occupied, draw the patient's life bar on top of the bed
+            label = "BED" if available else "OCCUPIED"
+            label_text = _render("small", label, BLACK if available else WHITE, self.retro_antialias)
+            text_rect = label_text.get_rect(center=(width // 2, height // 2))
+            layers.append((label_text, text_rect.topleft))
+        if patient_type is not None:
+            layers.extend(self._badge_layers(patient_type, width))
+        return self._compose_card(width, height, layers)
+
+    def _build_vent_card(self, occupied, patient_type, width, height):
+        layers = []
+        raw, cache, fallback = ((self.vent_patient_raw, self._vent_patient_cache, DARK_GRAY) if occupied
+                                else (self.vent_bed_raw, self._vent_bed_cache, LIGHT_GRAY))
+        if raw is not None:
+            key = (width, height)
+            if key not in cache:
+                cache[key] = pygame.transform.smoothscale(raw, (width, height)).convert_alpha()
+            layers.append((cache[key], (0, 0)))
+        else:
+            layers.append((self._rect_layer(fallback, (width, height)), (0, 0)))
+        if patient_type is not None:
+            layers.extend(self._badge_layers(patient_type, width))
+        return self._compose_card(width, height, layers)
+
+    def _blit(self, surf, pos):
+        """Queue a blit for this frame; flushed in one Surface.blits() call."""
+        self._frame_blits.append((surf, pos))
+        self._dirty_rects.append(pygame.Rect(pos[0], pos[1], *surf.get_size()))
+
+    def _flush_blits(self):
+        """Draw queued blits now (before any direct pygame.draw that must layer on top)."""
+        if self._frame_blits:
+            self.screen.blits(self._frame_blits, doreturn=0)
+            self._frame_blits = []
+
+    def _life_bar(self, severity, width):
+        bar_width = int((severity / 100.0) * width)
+        bar_color = LIFE_COLORS[min(100, max(0, int(severity)))]
+        key = (bar_width, bar_color)
+        bar = self._bar_cache.get(key)
+        if bar is None:
+            bar = self._bar_cache[key] = pygame.Surface((bar_width, 10))
+            bar.fill(bar_color)
+        return bar
+
+    def _draw_life_bar(self, severity, x, y, width, height):
+        self._blit(self._life_bar(severity, width), (x, y + height - 10))
+
+    def _waiting_patient_layers(self, patient, x, y, width=100, height=80):
+        """(surface, pos) layers for a waiting-room tile: sitting/standing card, life bar, value."""
+        selected = self.selected_patient == patient
+        key = ("waiting", selected, patient.patient_type, width, height)
+        card, (dx, dy) = self._card(key, lambda: self._build_waiting_card(selected, patient.patient_type, width, height))
+        return [
+            (card, (x + dx, y + dy)),
+            (self._life_bar(patient.severity, width), (x, y + height - 10)),
+            (_render("small", f"{int(round(patient.severity))}", WHITE, self.retro_antialias), (x + 5, y + 5)),
+        ]
+
+    def _waiting_patients(self):
+        """game.get_waiting_patients(), cached until the game next re-syncs patient statuses."""
+        status_ref = self.game.patient_status_id
+        if status_ref is not self._waiting_status_ref:
+            self._waiting_status_ref = status_ref
+            self._waiting_list = self.game.get_waiting_patients()
+        return self._waiting_list
+
+    def _compose_waiting_room(self, patients):
+        """
+        Flatten the waiting-room background, border and patient tiles into one opaque
+        surface. Returns (surface, topleft); sprites overhanging the room carry the
+        floor beneath them so the composite can be blitted as-is.
+        """
+        room = pygame.Rect(50, self.waiting_room_y, 800, self.waiting_room_height)
+        layers = []
+        for i, patient in enumerate(patients):
+            layers.extend(self._waiting_patient_layers(patient, 50 + i * 120, self.waiting_room_y + 20))
+        bounds = room.unionall([surf.get_rect(topleft=pos) for surf, pos in layers])
+        surf = pygame.Surface(bounds.size)
+        if self._floor_bg:
+            surf.blit(self._floor_bg, (0, 0), bounds)
+        else:
+            surf.fill(BLACK)
+        local = room.move(-bounds.x, -bounds.y)
+        if self._waiting_bg is not None:
+            surf.blit(self._waiting_bg, local)
+        else:
+            pygame.draw.rect(surf, DARK_GRAY, local)
+        pygame.draw.rect(surf, WHITE, local, 2)
+        surf.blits([(layer, (x - bounds.x, y - bounds.y)) for layer, (x, y) in layers], doreturn=0)
+        return surf, bounds.topleft
+    
+    def draw_patient(self, patient, x, y, width=100, height=80, minimal=False, bar_only=False):
+        """Draw a patient.
+        minimal=True renders only the life bar (used for waiting room).
+        """
+        # Bar-only mode: show ONLY the health bar (used while walking to bed)
+        if bar_only:
+            # Draw sprite (no box/labels) if available
+            if self.patient_sprite_raw:
+                sprite, (dx, dy) = self._fitted_patient_sprite(width, height)
+                self._blit(sprite, (x + dx, y + dy))
+            self._draw_life_bar(patient.severity, x, y, width, height)
+            return
+
+        if minimal:
+            # Waiting room: sprite (sitting, standing when selected) + badge card, then bar and value
+            for surf, pos in self._waiting_patient_layers(patient, x, y, width, height):
+                self._blit(surf, pos)
+            return
+        selected = self.selected_patient == patient
+        # Sprite/box, outline, type badge and selection highlight come from the card
+        key = ("patient", patient.status, patient.patient_type, selected, width, height)
+        card, (dx, dy) = self._card(key, lambda: self._build_patient_card(patient.status, patient.patient_type, selected, width, height))
+        self._blit(card, (x + dx, y + dy))
+        
+        # Severity bar
+        self._draw_life_bar(patient.severity, x, y, width, height)
+        
+        # Patient ID, status text and severity number (rounded to whole number)
+        self._blit(_render("small", f"#{patient.id}", WHITE, self.retro_antialias), (x + 5, y + 5))
+        self._blit(_render("small", patient.status.value, WHITE, self.retro_antialias), (x + 5, y + 20))
+        self._blit(_render("small", f"{int(round(patient.severity))}", WHITE, self.retro_antialias), (x + 5, y + 35))
+    
+    def draw_bed(self, bed, x, y, width=120, height=120):
+        """Draw a bed icon"""
+        patient = None
         if not bed.available:
-            try:
-                patient = next(p for p in self.game.patients if p.assigned_bed == bed)
-                bar_width = int((patient.severity / 100.0) * width)
-                bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-                pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
-                # Optional: small id tag in corner
-                id_text = self.small_font.render(f"#{patient.id}", self.retro_antialias, WHITE)
-                self.screen.blit(id_text, (x + 4, y + 4))
-                # Type badge
-                t = patient.patient_type
-                t_letter = "R" if t == PatientType.RESPIRATORY else "C" if t == PatientType.CARDIAC else "T"
-                badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
-                bw, bh = badge.get_size()
-                pad = 4
-                bx = x + width - bw - pad - 2
-                by = y + 2
-                pygame.draw.rect(self.screen, YELLOW, (bx - 2, by - 2, bw + 4, bh + 4))
-                self.screen.blit(badge, (bx, by))
-            except StopIteration:
-                pass
+            patient = self.game.patient_in_bed(bed.id)
+        patient_type = patient.patient_type if patient is not None else None
+        key = ("bed", bed.available, patient_type, width, height)
+        card, (dx, dy) = self._card(key, lambda: self._build_bed_card(bed.available, patient_type, width, height))
+        self._blit(card, (x + dx, y + dy))
+        # If bed is occupied, draw the patient's life bar and id tag on top of the bed
+        if patient is not None:
+            self._draw_life_bar(patient.severity, x, y, width, height)
+            self._blit(_render("small", f"#{patient.id}", WHITE, self.retro_antialias), (x + 4, y + 4))
     
     def draw_nurse(self, nurse, x, y, size=40):
         """Draw a nurse icon at the given coordinates."""
         draw_x, draw_y = x, y
         # Draw sprite if available, else fallback circle
-        if self.nurse_sprite_raw:
-            key = (size, size)
-            if key not in self._nurse_sprite_cache:
-                self._nurse_sprite_cache[key] = pygame.transform.smoothscale(self.nurse_sprite_raw, (size, size))
-            sprite = self._nurse_sprite_cache[key]
-            self.screen.blit(sprite, (draw_x, draw_y))
+        if self.nurse_sprite:
+            sprite = self.nurse_sprite
+            if size != self.nurse_size:
+                sprite = scaled_sprite(self._scale_cache, self.nurse_sprite_raw, (size, size), smooth=False)
+            self._blit(sprite, (draw_x, draw_y))
         else:
+            self._flush_blits()
             color = GREEN if nurse.available else RED
-            pygame.draw.circle(self.screen, color, (draw_x + size // 2, draw_y + size // 2), size // 2)
+            self._dirty_rects.append(
+                pygame.draw.circle(self.screen, color, (draw_x + size // 2, draw_y + size // 2), size // 2))
             pygame.draw.circle(self.screen, BLACK, (draw_x + size // 2, draw_y + size // 2), size // 2, 2)
 
-    def _get_nurse_target(self, nurse, size=None):
+    def _get_nurse_target(self, nurse, pending_by_nurse, size=None):
+        """Compute the target (x, y) for a nurse: patient location if assigned, else station."""
         if size is None:
             size = self.nurse_size
-        """Compute the target (x, y) for a nurse: patient location if assigned, else station."""
         # If a pending assignment exists for this nurse, head to that bed/vent
-        for task in self.pending_assignments:
-            if task.get('nurse') == nurse:
-                if 'bed' in task and task['bed'] in self.bed_positions:
-                    tx, ty, tw, th = self.bed_positions[task['bed']]
-                    return tx + tw - size, ty
-                if 'vent' in task and task['vent'] in self.vent_positions:
-                    vx, vy, vw, vh = self.vent_positions[task['vent']]
-                    return vx, vy
+        task = pending_by_nurse.get(nurse)
+        if task is not None:
+            if 'bed' in task:
+                tx, ty, tw, th = self.bed_positions[task['bed'].id]
+                return tx + tw - size, ty
+            if 'vent' in task:
+                vx, vy, vw, vh = self.vent_positions[task['vent'].id]
+                return vx, vy
         # If assigned, target the patient's bed/vent center
         if not nurse.available:
-            assigned_patient = None
-            for p in self.game.patients:
-                if p.assigned_nurse == nurse:
-                    assigned_patient = p
-                    break
+            assigned_patient = self._nurse_to_patient.get(nurse)
             if assigned_patient is not None:
                 target_rect = None
-                if assigned_patient.assigned_ventilator and assigned_patient.assigned_ventilator in self.vent_positions:
-                    target_rect = self.vent_positions[assigned_patient.assigned_ventilator]
-                elif assigned_patient.assigned_bed and assigned_patient.assigned_bed in self.bed_positions:
-                    target_rect = self.bed_positions[assigned_patient.assigned_bed]
+                if assigned_patient.assigned_ventilator:
+                    target_rect = self.vent_positions[assigned_patient.assigned_ventilator.id]
+                elif assigned_patient.assigned_bed:
+                    target_rect = self.bed_positions[assigned_patient.assigned_bed.id]
                 if target_rect:
                     tx, ty, tw, th = target_rect
                     # Aim near top-right corner
                     return tx + tw - size, ty
         # Otherwise, go to station
-        return self.nurse_stations.get(nurse, (830, self.bed_area_y + 0))
+        return self.nurse_stations[nurse.id]
 
     def _row_corridor_y(self):
         """
@@ -478,142 +687,162 @@ class RetroSimICU:
             path.append((tx, ty))
         return path
 
+    def _ensure_nurse_arrays(self):
+        """(Re)allocate the nurse motion arrays when the game's nurse roster changes."""
+        nurses = self.game.nurses
+        if self._nurse_roster is nurses and self._nurse_pos.shape[0] == len(nurses):
+            return
+        n = len(nurses)
+        self._nurse_roster = nurses
+        # Stations end where the UI panel starts, so idle nurses never force a panel re-blit
+        self.nurse_stations = [(self.ui_panel_x - self.nurse_size, self.bed_area_y + i * 56) for i in range(n)]
+        self._nurse_pos = np.zeros((n, 2), dtype=np.float32)
+        self._nurse_target = np.zeros_like(self._nurse_pos)
+        self._nurse_waypoint = np.zeros_like(self._nurse_pos)
+        self._nurse_path = np.zeros((n, 3, 2), dtype=np.float32)
+        self._nurse_path_len = np.zeros(n, dtype=np.int8)
+        self._nurse_placed = np.zeros(n, dtype=bool)
+
+    def _nearest_available_nurse(self, target_x, target_y):
+        """Available nurse closest (by current animated position) to a target point, or None."""
+        self._ensure_nurse_arrays()
+        available = np.flatnonzero(self.game.nurse_available)
+        if not available.size:
+            return None
+        # Unplaced nurses still stand at their station
+        stations = np.asarray(self.nurse_stations, dtype=np.float64)
+        xy = np.where(self._nurse_placed[:, None], self._nurse_pos, stations)[available]
+        d = xy - (target_x, target_y)
+        # argmin keeps the first of equally near nurses, like min() over the roster did
+        return self.game.nurses[available[np.argmin((d * d).sum(axis=1))]]
+
     def _update_nurse_positions(self, size=None):
         """Move nurses toward their targets each tick with simple corridor pathfinding."""
         if size is None:
             size = self.nurse_size
-        for nurse in self.game.nurses:
-            target_x, target_y = self._get_nurse_target(nurse, size=size)
+        self._ensure_nurse_arrays()
+        nurses = self.game.nurses
+        pos = self._nurse_pos
+        waypoint = self._nurse_waypoint
+        path = self._nurse_path
+        path_len = self._nurse_path_len
+        placed = self._nurse_placed
+        moving = np.zeros(len(nurses), dtype=bool)
+        # Reverse index built once per update instead of scanning patients per nurse
+        self._nurse_to_patient = {p.assigned_nurse: p for p in self.game.patients if p.assigned_nurse is not None}
+        # First pending task per nurse wins, matching the order tasks were queued
+        pending_by_nurse = {t['nurse']: t for t in reversed(self.pending_assignments)}
+
+        # Waypoint planning is branchy, so it stays a Python loop; the motion itself is vectorized below
+        for i, nurse in enumerate(nurses):
+            target_x, target_y = self._get_nurse_target(nurse, pending_by_nurse, size=size)
             # Initialize position at station if unknown
-            if nurse not in self.nurse_positions:
+            if not placed[i]:
                 # Start idle nurses at their station
-                station_pos = self.nurse_stations.get(nurse, (830, self.bed_area_y + 0))
-                self.nurse_positions[nurse] = station_pos
-                self.nurse_paths[nurse] = []
+                pos[i] = self.nurse_stations[i]
+                path_len[i] = 0
+                placed[i] = True
                 continue
-            cur_x, cur_y = self.nurse_positions[nurse]
+            cur_x, cur_y = pos[i].tolist()
 
             # Determine if nurse is idle (no pending task and not assigned)
-            has_pending = any(t.get('nurse') == nurse for t in self.pending_assignments)
-            is_assigned = any(p.assigned_nurse == nurse for p in self.game.patients)
-            is_idle = (not has_pending) and (not is_assigned)
+            is_idle = nurse not in pending_by_nurse and nurse not in self._nurse_to_patient
             # If idle, target should be station and avoid corridor to prevent oscillation
             use_corridor = not is_idle
             if is_idle:
-                target_x, target_y = self.nurse_stations.get(nurse, (830, self.bed_area_y + 0))
+                target_x, target_y = self.nurse_stations[i]
                 # Snap to station if already very close
                 if abs(cur_x - target_x) <= 1 and abs(cur_y - target_y) <= 1:
-                    self.nurse_positions[nurse] = (target_x, target_y)
-                    self.nurse_paths[nurse] = []
+                    pos[i] = (target_x, target_y)
+                    path_len[i] = 0
                     continue
+            self._nurse_target[i] = (target_x, target_y)
 
             # Hysteresis near final targets to avoid oscillation:
             # When within a small radius, avoid corridor routing and snap to target.
             dx_t = target_x - cur_x
             dy_t = target_y - cur_y
-            dist_to_target = (dx_t * dx_t + dy_t * dy_t) ** 0.5
-            if dist_to_target <= 2:
+            dist2_to_target = dx_t * dx_t + dy_t * dy_t  # squared: only compared against thresholds
+            if dist2_to_target <= 4:
                 # Snap to exact target and clear path
-                self.nurse_positions[nurse] = (target_x, target_y)
-                self.nurse_paths[nurse] = []
+                pos[i] = (target_x, target_y)
+                path_len[i] = 0
                 continue
             # If close to final, don't use corridor (go direct)
-            if dist_to_target <= 20:
+            if dist2_to_target <= 400:
                 use_corridor = False
 
-            # Recompute path if target changed significantly or path empty
-            if nurse not in self.nurse_paths:
-                self.nurse_paths[nurse] = []
             # Only rebuild if last waypoint is far from the target to reduce re-path jitter
-            if (not self.nurse_paths[nurse]
-                or (abs(self.nurse_paths[nurse][-1][0] - target_x) > 3
-                    and abs(self.nurse_paths[nurse][-1][1] - target_y) > 3)):
-                self.nurse_paths[nurse] = self._plan_path((cur_x, cur_y), (target_x, target_y), use_corridor=use_corridor)
+            n_wp = path_len[i]
+            if (not n_wp
+                or (abs(path[i, n_wp - 1, 0] - target_x) > 3
+                    and abs(path[i, n_wp - 1, 1] - target_y) > 3)):
+                planned = self._plan_path((cur_x, cur_y), (target_x, target_y), use_corridor=use_corridor)
+                n_wp = path_len[i] = len(planned)
+                if planned:
+                    path[i, :n_wp] = planned
 
             # Advance toward next waypoint
-            if self.nurse_paths[nurse]:
-                wx, wy = self.nurse_paths[nurse][0]
-            else:
-                wx, wy = target_x, target_y
-
-            dx = wx - cur_x
-            dy = wy - cur_y
-            dist = (dx * dx + dy * dy) ** 0.5
-            if dist < 1:
-                # Reached waypoint
-                if self.nurse_paths[nurse]:
-                    self.nurse_paths[nurse].pop(0)
-                # If next waypoint is final target and we are close, snap to it
-                if not self.nurse_paths[nurse] and dist_to_target <= 2:
-                    self.nurse_positions[nurse] = (target_x, target_y)
-                    continue
-                self.nurse_positions[nurse] = (wx, wy)
-                continue
-            step = min(self.nurse_speed, dist)
-            if dist > 0:
-                new_x = cur_x + dx / dist * step
-                new_y = cur_y + dy / dist * step
+            waypoint[i] = path[i, 0] if n_wp else (target_x, target_y)
+            moving[i] = True
+
+        rows = np.flatnonzero(moving)
+        if rows.size:
+            if self._kin is not None:
+                pos[rows], arrived = self._kin.step(pos[rows], waypoint[rows])
             else:
-                new_x, new_y = wx, wy
-            self.nurse_positions[nurse] = (new_x, new_y)
+                pos[rows], arrived = step_nurses(pos[rows], waypoint[rows], self.nurse_speed)
+            # Reached waypoint: pop it off the path
+            for i in rows[arrived].tolist():
+                if path_len[i]:
+                    path[i, :-1] = path[i, 1:]
+                    path_len[i] -= 1
+
+        # Publish positions for drawing and hit-testing
+        self.nurse_positions = pos.tolist()
 
         # Check pending assignments: if nurse reached target (bed or vent), perform assignment now
         if self.pending_assignments:
-            remaining = []
-            for task in self.pending_assignments:
+            # Rotate the queue once: finished tasks drop out, the rest go back in order
+            pending = self.pending_assignments
+            for _ in range(len(pending)):
+                task = pending.popleft()
                 nurse = task['nurse']
                 patient = task['patient']
-                nx, ny = self.nurse_positions.get(nurse, (None, None))
-                if nx is None:
-                    remaining.append(task)
+                if not self._nurse_placed[nurse.id]:
+                    pending.append(task)
                     continue
+                nx, ny = self.nurse_positions[nurse.id]
                 # Bed-targeted task
                 if 'bed' in task:
                     bed = task['bed']
-                    if bed in self.bed_positions:
-                        bx, by, bw, bh = self.bed_positions[bed]
-                        reached_rect = (bx - 4) <= nx <= (bx + bw + 4) and (by - 4) <= ny <= (by + bh + 4)
-                        target_x = bx + bw - size
-                        target_y = by
-                        dx_t = nx - target_x
-                        dy_t = ny - target_y
-                        reached_target = (dx_t * dx_t + dy_t * dy_t) ** 0.5 <= 8
-                        if reached_rect or reached_target:
-                            try:
-                                if hasattr(self.game, "assign_patient_to_specific_bed"):
-                                    self.game.assign_patient_to_specific_bed(patient, bed, nurse)
-                                else:
-                                    self.game.assign_patient_to_bed(patient)
-                            except Exception:
-                                self.game.assign_patient_to_bed(patient)
-                            # Clear standing-at-target placeholder now that assignment finalized
-                            if hasattr(self, "patients_waiting_at_target") and patient in self.patients_waiting_at_target:
-                                self.patients_waiting_at_target.pop(patient, None)
-                            # Do not clear walking/reservation here (walking cleared on arrival)
-                            continue  # completed
-                    remaining.append(task)
+                    bx, by, bw, bh = self.bed_positions[bed.id]
+                    reached_rect = (bx - 4) <= nx <= (bx + bw + 4) and (by - 4) <= ny <= (by + bh + 4)
+                    target_x = bx + bw - size
+                    target_y = by
+                    dx_t = nx - target_x
+                    dy_t = ny - target_y
+                    reached_target = dx_t * dx_t + dy_t * dy_t <= 64
+                    if reached_rect or reached_target:
+                        self.game.assign_patient_to_specific_bed(patient, bed, nurse)
+                        # Clear standing-at-target placeholder now that assignment finalized
+                        self.patients_waiting_at_target.pop(patient, None)
+                        # Do not clear walking/reservation here (walking cleared on arrival)
+                        continue  # completed
+                    pending.append(task)
                     continue
                 # Vent-targeted task
                 if 'vent' in task:
                     vent = task['vent']
-                    if vent in self.vent_positions:
-                        vx, vy, vw, vh = self.vent_positions[vent]
-                        reached_rect = (vx - 4) <= nx <= (vx + vw + 4) and (vy - 4) <= ny <= (vy + vh + 4)
-                        if reached_rect:
-                            try:
-                                if hasattr(self.game, "assign_patient_to_specific_ventilator"):
-                                    self.game.assign_patient_to_specific_ventilator(patient, vent, nurse)
-                                else:
-                                    self.game.assign_patient_to_ventilator(patient)
-                            except Exception:
-                                self.game.assign_patient_to_ventilator(patient)
-                            # Clear standing-at-target placeholder now that assignment finalized
-                            if hasattr(self, "patients_waiting_at_target") and patient in self.patients_waiting_at_target:
-                                self.patients_waiting_at_target.pop(patient, None)
-                            continue  # completed
-                    remaining.append(task)
+                    vx, vy, vw, vh = self.vent_positions[vent.id]
+                    reached_rect = (vx - 4) <= nx <= (vx + vw + 4) and (vy - 4) <= ny <= (vy + vh + 4)
+                    if reached_rect:
+                        self.game.assign_patient_to_specific_ventilator(patient, vent, nurse)
+                        # Clear standing-at-target placeholder now that assignment finalized
+                        self.patients_waiting_at_target.pop(patient, None)
+                        continue  # completed
+                    pending.append(task)
                     continue
-            self.pending_assignments = remaining
 
     def _update_patient_moves(self):
         """Animate patients walking from waiting room to reserved beds."""
@@ -625,350 +854,271 @@ class RetroSimICU:
             cx, cy = move['x'], move['y']
             tx, ty = move['tx'], move['ty']
             dx, dy = tx - cx, ty - cy
-            dist = (dx * dx + dy * dy) ** 0.5
-            if dist < 1.0:
+            if dx * dx + dy * dy < 1.0:
                 # Arrived at bed tile; mark as visually present (reservation already set)
                 move['x'], move['y'] = float(tx), float(ty)
                 # Keep a standing placeholder at target until nurse assignment finalizes
-                try:
-                    self.patients_waiting_at_target[patient] = (float(tx), float(ty))
-                except Exception:
-                    pass
+                self.patients_waiting_at_target[patient] = (float(tx), float(ty))
                 finished.append(patient)
                 continue
+            dist = math.hypot(dx, dy)
             step = min(move['speed'], dist)
-            if dist > 0:
-                move['x'] = cx + dx / dist * step
-                move['y'] = cy + dy / dist * step
+            move['x'] = cx + dx / dist * step
+            move['y'] = cy + dy / dist * step
         # Clear finished moves and keep standing markers
         for p in finished:
             self.patient_moves.pop(p, None)
-            for b, pf in list(getattr(self, "reserved_bed_to_patient", {}).items()):
+            for b, pf in list(self.reserved_bed_to_patient.items()):
                 if pf is p:
                     self.reserved_bed_to_patient.pop(b, None)
-                    if hasattr(self, "reserved_beds"):
-                        self.reserved_beds.discard(b)
+                    self.reserved_beds.discard(b)
     
     def draw_ventilator(self, vent, x, y, width=120, height=120):
         """Draw a ventilator bed. If occupied, show vent_patient sprite; else vent_bed sprite.
         Always overlay the patient's health bar when occupied.
         """
         occupied = not vent.available
-        # Background sprite
-        if not occupied:
-            if getattr(self, "vent_bed_raw", None):
-                key = (width, height)
-                if key not in self._vent_bed_cache:
-                    self._vent_bed_cache[key] = pygame.transform.smoothscale(self.vent_bed_raw, (width, height))
-                self.screen.blit(self._vent_bed_cache[key], (x, y))
-            else:
-                pygame.draw.rect(self.screen, LIGHT_GRAY, (x, y, width, height))
-        else:
-            if getattr(self, "vent_patient_raw", None):
-                key = (width, height)
-                if key not in self._vent_patient_cache:
-                    self._vent_patient_cache[key] = pygame.transform.smoothscale(self.vent_patient_raw, (width, height))
-                self.screen.blit(self._vent_patient_cache[key], (x, y))
-            else:
-                pygame.draw.rect(self.screen, DARK_GRAY, (x, y, width, height))
-            # Overlay health bar for the patient on this ventilator
-            try:
-                from sim_icu_logic import PatientStatus, PatientType  # local import to avoid circulars at top
-                patient = next(p for p in self.game.patients if p.assigned_ventilator == vent and p.status == PatientStatus.ON_VENTILATOR)
-                bar_width = int((patient.severity / 100.0) * width)
-                bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-                pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
-                # Type badge in top-right corner
-                t_letter = "R" if patient.patient_type == PatientType.RESPIRATORY else "C" if patient.patient_type == PatientType.CARDIAC else "T"
-                badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
-                bw, bh = badge.get_size()
-                px, py = x + width - bw - 6, y + 2
-                pygame.draw.rect(self.screen, YELLOW, (px - 2, py - 2, bw + 4, bh + 4))
-                self.screen.blit(badge, (px, py))
-            except StopIteration:
-                pass
-        # Record for nurse animation targeting
-        self.vent_positions[vent] = (x, y, width, height)
+        patient = None
+        if occupied:
+            patient = self.game.patient_on_ventilator(vent.id)
+        patient_type = patient.patient_type if patient is not None else None
+        key = ("vent", occupied, patient_type, width, height)
+        card, (dx, dy) = self._card(key, lambda: self._build_vent_card(occupied, patient_type, width, height))
+        self._blit(card, (x + dx, y + dy))
+        # Overlay health bar for the patient on this ventilator
+        if patient is not None:
+            self._draw_life_bar(patient.severity, x, y, width, height)
 
         # Draw divider to the right of each ventilator if sprite available
-        if self.divider_sprite_raw:
-            h = height
-            key_h = (height, self.divider_width_scale, self.divider_height_scale)
-            if key_h not in self._divider_cache_by_height:
-                base_w = self.divider_sprite_raw.get_width()
-                base_h = self.divider_sprite_raw.get_height()
-                sh = int(h * self.divider_height_scale)
-                sw = int(base_w * (sh / base_h) * self.divider_width_scale)
-                self._divider_cache_by_height[key_h] = pygame.transform.smoothscale(self.divider_sprite_raw, (max(1, sw), max(1, sh)))
-            divider_surf = self._divider_cache_by_height[key_h]
+        if self._divider is not None:
+            divider_surf = self._divider
             # Place divider between ventilators and beds, a bit left and closer
             pad = 8
-            self.screen.blit(divider_surf, (x + width + pad + self.divider_left_shift, y + (h - divider_surf.get_height()) // 2))
+            self._blit(divider_surf, (x + width + pad + self.divider_left_shift, y + (height - divider_surf.get_height()) // 2))
     
-    def draw_ui_panel(self):
-        """Draw the UI information panel"""
-        panel_x = self.ui_panel_x
-        panel_y = 50
-        
-        # Background
-        pygame.draw.rect(self.screen, DARK_GRAY, (panel_x, panel_y, self.ui_panel_width, self.height - 100))
-        pygame.draw.rect(self.screen, BLACK, (panel_x, panel_y, self.ui_panel_width, self.height - 100), 2)
-        
-        y_offset = panel_y + 20
-        
-        # Title
-        title = self.large_font.render("SIMICU", self.retro_antialias, WHITE)
-        self.screen.blit(title, (panel_x + 20, y_offset))
-        y_offset += 50
-        
+    def draw_ui_panel(self, force=False):
+        """
+        Draw the UI information panel.
+
+        The panel is opaque and the scene (nurse stations included) stays left of it, so it
+        stays on screen between frames: it is only re-blitted when a displayed value changed
+        or force is set (full repaint, or last frame's drawing overlapped it, as the PAUSED
+        indicator and the restored floor under it do). Returns the blitted Rect or None.
+        """
+        game = self.game
+        score = game.get_score()
+        state = (score['patients_saved'], score['patients_lost'], game.tick, self.fps, self.update_every_n_frames,
+                 game.free_nurses, game.free_beds, game.free_vents)
+        rect = None
+        if state != self._panel_state:
+            self._panel_state = state
+            self._compose_panel(score)
+            force = True
+        if force:
+            rect = self.screen.blit(self._panel_surface, self._panel_rect)
+
+        # Pause indicator, drawn every paused frame whether or not the panel was re-blitted
+        # (it hangs below the panel, so it goes through the per-frame dirty rects)
+        if self.paused:
+            pause_text = _render("large", "PAUSED", YELLOW, self.retro_antialias)
+            text_rect = pause_text.get_rect(center=(self.ui_panel_x + self.ui_panel_width // 2, self.height - 50))
+            self._blit(pause_text, text_rect)
+        return rect
+
+    def _compose_panel(self, score):
+        """Redraw the counters onto a fresh copy of the static panel."""
+        panel = self._panel_surface
+        panel.blit(self._static_panel, (0, 0))
+        font = _fonts["font"]
+        aa = self.retro_antialias
+        game = self.game
+        y_offset = 70
+
         # Score
-        score = self.game.get_score()
-        score_text = self.font.render(f"Saved: {score['patients_saved']}", self.retro_antialias, GREEN)
-        self.screen.blit(score_text, (panel_x + 20, y_offset))
+        panel.blit(font.render(f"Saved: {score['patients_saved']}", aa, GREEN), (20, y_offset))
         y_offset += 30
-        
-        lost_text = self.font.render(f"Lost: {score['patients_lost']}", self.retro_antialias, RED)
-        self.screen.blit(lost_text, (panel_x + 20, y_offset))
+        panel.blit(font.render(f"Lost: {score['patients_lost']}", aa, RED), (20, y_offset))
         y_offset += 30
-        
+
         # Tick
-        tick_text = self.font.render(f"Tick: {self.game.tick}", self.retro_antialias, WHITE)
-        self.screen.blit(tick_text, (panel_x + 20, y_offset))
+        panel.blit(font.render(f"Tick: {game.tick}", aa, WHITE), (20, y_offset))
         y_offset += 40
-        
+
         # Speed/FPS display
-        speed_text = self.font.render(f"FPS: {self.fps}", self.retro_antialias, WHITE)
-        self.screen.blit(speed_text, (panel_x + 20, y_offset))
+        panel.blit(_render("font", f"FPS: {self.fps}", WHITE, aa), (20, y_offset))
         y_offset += 30
-        rate_text = self.small_font.render(f"Tick every {self.update_every_n_frames} frame(s)", self.retro_antialias, WHITE)
-        self.screen.blit(rate_text, (panel_x + 20, y_offset))
-        y_offset += 25
-        
+        panel.blit(_render("small", f"Tick every {self.update_every_n_frames} frame(s)", WHITE, aa), (20, y_offset))
+        y_offset += 55
+
         # Resources
-        resources_title = self.font.render("Resources:", self.retro_antialias, WHITE)
-        self.screen.blit(resources_title, (panel_x + 20, y_offset))
-        y_offset += 30
-        
-        nurses_text = self.font.render(f"Nurses: {self.game.free_nurses}/{self.game.num_nurses}", self.retro_antialias, WHITE)
-        self.screen.blit(nurses_text, (panel_x + 20, y_offset))
+        panel.blit(font.render(f"Nurses: {game.free_nurses}/{game.num_nurses}", aa, WHITE), (20, y_offset))
         y_offset += 25
-        
-        beds_text = self.font.render(f"Beds: {self.game.free_beds}/{self.game.num_beds}", self.retro_antialias, WHITE)
-        self.screen.blit(beds_text, (panel_x + 20, y_offset))
+        panel.blit(font.render(f"Beds: {game.free_beds}/{game.num_beds}", aa, WHITE), (20, y_offset))
         y_offset += 25
-        
-        vents_text = self.font.render(f"Vents: {self.game.free_vents}/{self.game.num_ventilators}", self.retro_antialias, WHITE)
-        self.screen.blit(vents_text, (panel_x + 20, y_offset))
-        y_offset += 40
-        
-        # Instructions
-        instructions = [
-            "INSTRUCTIONS:",
-            "1. Click patient to select",
-            "2. Click bed to assign",
-            "3. Click vent for critical",
-            "SPACE: Pause/Resume",
-            "R: Reset game"
-        ]
-        
-        for instruction in instructions:
-            inst_text = self.small_font.render(instruction, self.retro_antialias, YELLOW)
-            self.screen.blit(inst_text, (panel_x + 20, y_offset))
-            y_offset += 20
-        
-        # Pause indicator
-        if self.paused:
-            pause_text = self.large_font.render("PAUSED", self.retro_antialias, YELLOW)
-            text_rect = pause_text.get_rect(center=(panel_x + self.ui_panel_width // 2, self.height - 50))
-            self.screen.blit(pause_text, text_rect)
-    
+        panel.blit(font.render(f"Vents: {game.free_vents}/{game.num_ventilators}", aa, WHITE), (20, y_offset))
+
     def handle_click(self, pos):
         """Handle mouse click"""
         if self.game_over:
             return
         x, y = pos
+        self._build_layout()
+        point = pygame.Rect(pos, (1, 1))
         
         # Check if clicking in waiting room
         if y >= self.waiting_room_y and y <= self.waiting_room_y + self.waiting_room_height:
-            waiting_patients = self.game.get_waiting_patients()
-            for i, patient in enumerate(waiting_patients):
-                patient_x = 50 + i * 120
-                patient_y = self.waiting_room_y + 20
-                if (patient_x <= x <= patient_x + 100 and 
-                    patient_y <= y <= patient_y + 80):
-                    self.selected_patient = patient
-                    return
+            waiting_patients = self._waiting_patients()
+            i = point.collidelist(self._waiting_slot_rects(len(waiting_patients)))
+            if i != -1:
+                self.selected_patient = waiting_patients[i]
+                return
         # If we are rate-limited, do not process bed/vent clicks
         if self.input_cooldown_ticks > 0:
             return
         
         # Check if clicking on beds
         if y >= self.bed_area_y and y <= self.bed_area_y + self.bed_area_height:
-            bed_x_start = 200
-            bed_y = self.bed_area_y + 0
-            for i, bed in enumerate(self.game.beds):
-                bed_x = bed_x_start + (i % 4) * 150
-                bed_y_offset = (i // 4) * 120
-                if (bed_x <= x <= bed_x + 120 and 
-                    bed_y + bed_y_offset <= y <= bed_y + bed_y_offset + 120):
-                    if self.selected_patient and bed.available:
-                        # Find nearest available nurse (by current animated position), else ignore
-                        available_nurses = [n for n in self.game.nurses if n.available]
-                        if not available_nurses:
-                            return
-                        # Compute bed target point
-                        bx, by, bw, bh = bed_x, bed_y + bed_y_offset, 120, 120
-                        target_x = bx + bw - self.nurse_size
-                        target_y = by
-                        # Ensure nurse positions initialized
-                        for n in available_nurses:
-                            if n not in self.nurse_positions:
-                                self.nurse_positions[n] = self.nurse_stations.get(n, (830, self.bed_area_y + 0))
-                        # Pick nearest
-                        def dist2(n):
-                            nx, ny = self.nurse_positions.get(n, (target_x, target_y))
-                            dx = nx - target_x
-                            dy = ny - target_y
-                            return dx * dx + dy * dy
-                        nearest = min(available_nurses, key=dist2)
-                        # Queue assignment: nurse will run to bed, then we assign
-                        self.pending_assignments.append({'nurse': nearest, 'patient': self.selected_patient, 'bed': bed})
-                        # Start patient walking from their waiting slot
-                        waiting_patients = self.game.get_waiting_patients()
-                        try:
-                            idx = waiting_patients.index(self.selected_patient)
-                        except ValueError:
-                            idx = 0
-                        start_x = 50 + idx * 120
-                        start_y = self.waiting_room_y + 20
-                        self.patient_moves[self.selected_patient] = {
-                            'x': float(start_x),
-                            'y': float(start_y),
-                            'tx': bx + 10,
-                            'ty': by - 20,
-                            'speed': 40.0
-                        }
-                        # Reserve bed
-                        self.reserved_beds.add(bed)
-                        self.reserved_bed_to_patient[bed] = self.selected_patient
-                        # Small input cooldown to simulate human latency
-                        self.input_cooldown_ticks = 8
-                        self.selected_patient = None
-                    return
+            i = point.collidelist(self._bed_rects)
+            if i != -1:
+                bed = self.game.beds[i]
+                bx, by = self._bed_rects[i].topleft
+                if self.selected_patient and bed.available:
+                    # Find nearest available nurse to the bed target point, else ignore
+                    bw, bh = 120, 120
+                    nearest = self._nearest_available_nurse(bx + bw - self.nurse_size, by)
+                    if nearest is None:
+                        return
+                    # Queue assignment: nurse will run to bed, then we assign
+                    self.pending_assignments.append({'nurse': nearest, 'patient': self.selected_patient, 'bed': bed})
+                    # Start patient walking from their waiting slot
+                    waiting_patients = self._waiting_patients()
+                    try:
+                        idx = waiting_patients.index(self.selected_patient)
+                    except ValueError:
+                        idx = 0
+                    start_x = 50 + idx * 120
+                    start_y = self.waiting_room_y + 20
+                    self.patient_moves[self.selected_patient] = {
+                        'x': float(start_x),
+                        'y': float(start_y),
+                        'tx': bx + 10,
+                        'ty': by - 20,
+                        'speed': 40.0
+                    }
+                    # Reserve bed
+                    self.reserved_beds.add(bed)
+                    self.reserved_bed_to_patient[bed] = self.selected_patient
+                    # Small input cooldown to simulate human latency
+                    self.input_cooldown_ticks = 8
+                    self.selected_patient = None
+                return
             
             # Check ventilators (now on the left side)
-            vent_x_start = 50
-            for i, vent in enumerate(self.game.ventilators):
-                vent_x = vent_x_start
-                vent_y = self.bed_area_y + 0 + i * 120
-                if (vent_x <= x <= vent_x + 120 and 
-                    vent_y <= y <= vent_y + 120):
-                    if self.selected_patient and vent.available:
-                        # Queue ventilator assignment: nurse must attend, so send nearest available nurse
-                        available_nurses = [n for n in self.game.nurses if n.available]
-                        if not available_nurses:
-                            return
-                        for n in available_nurses:
-                            if n not in self.nurse_positions:
-                                self.nurse_positions[n] = self.nurse_stations.get(n, (830, self.bed_area_y + 0))
-                        def dist2(n):
-                            nx, ny = self.nurse_positions.get(n, (vent_x, vent_y))
-                            dx = nx - vent_x
-                            dy = ny - vent_y
-                            return dx * dx + dy * dy
-                        nearest = min(available_nurses, key=dist2)
-                        self.pending_assignments.append({'nurse': nearest, 'patient': self.selected_patient, 'vent': vent})
-                        # Start patient walk animation toward ventilator panel (visual only)
-                        waiting_patients = self.game.get_waiting_patients()
-                        try:
-                            idx = waiting_patients.index(self.selected_patient)
-                        except ValueError:
-                            idx = 0
-                        start_x = 50 + idx * 120
-                        start_y = self.waiting_room_y + 20
-                        self.patient_moves[self.selected_patient] = {
-                            'x': float(start_x),
-                            'y': float(start_y),
-                            'tx': vent_x + 10,
-                            'ty': vent_y - 20,
-                            'speed': 40.0
-                        }
-                        self.input_cooldown_ticks = 6
-                        self.selected_patient = None
-                    return
+            i = point.collidelist(self._vent_rects)
+            if i != -1:
+                vent = self.game.ventilators[i]
+                vent_x, vent_y = self._vent_rects[i].topleft
+                if self.selected_patient and vent.available:
+                    # Queue ventilator assignment: nurse must attend, so send nearest available nurse
+                    nearest = self._nearest_available_nurse(vent_x, vent_y)
+                    if nearest is None:
+                        return
+                    self.pending_assignments.append({'nurse': nearest, 'patient': self.selected_patient, 'vent': vent})
+                    # Start patient walk animation toward ventilator panel (visual only)
+                    waiting_patients = self._waiting_patients()
+                    try:
+                        idx = waiting_patients.index(self.selected_patient)
+                    except ValueError:
+                        idx = 0
+                    start_x = 50 + idx * 120
+                    start_y = self.waiting_room_y + 20
+                    self.patient_moves[self.selected_patient] = {
+                        'x': float(start_x),
+                        'y': float(start_y),
+                        'tx': vent_x + 10,
+                        'ty': vent_y - 20,
+                        'speed': 40.0
+                    }
+                    self.input_cooldown_ticks = 6
+                    self.selected_patient = None
+                return
     
     def draw(self):
         """Draw the entire game screen"""
-        # Draw global background
-        if self.floor_bg_raw:
-            key_bg = (self.width, self.height)
-            if key_bg not in self._floor_bg_cache:
-                self._floor_bg_cache[key_bg] = pygame.transform.smoothscale(self.floor_bg_raw, (self.width, self.height))
-            self.screen.blit(self._floor_bg_cache[key_bg], (0, 0))
+        self._frame_blits = []
+        prev_rects = self._dirty_rects
+        self._dirty_rects = []
+        overlay = self.show_intro or self.game_over or self.show_rules
+        full = self._full_redraw or overlay
+        # Restoring the floor under last frame's drawing wipes any part of the panel it covered
+        panel_exposed = full or self._panel_rect.collidelist(prev_rects) != -1
+        # Draw global background (only under last frame's drawing when doing a partial update;
+        # everywhere else the screen already shows bare floor)
+        floor = self._floor_bg
+        if full:
+            if floor:
+                self.screen.blit(floor, (0, 0))
+            else:
+                self.screen.fill(BLACK)
+        elif floor:
+            self.screen.blits([(floor, r, r) for r in prev_rects], doreturn=0)
         else:
-            self.screen.fill(BLACK)
+            for r in prev_rects:
+                self.screen.fill(BLACK, r)
+        # Overlays flip the whole screen; the next game frame must repaint everything
+        self._full_redraw = overlay
         if self.show_intro:
             return self.draw_intro_overlay()
         if self.game_over:
             return self.draw_game_over_overlay()
-        if getattr(self, "show_rules", False):
+        if self.show_rules:
             return self.draw_rules_overlay()
 
         # Update actor positions first so rendering reflects latest arrivals/assignments
         # (e.g., remove waiting-room sprite the instant a nurse reaches bed/vent)
         self._update_nurse_positions(size=self.nurse_size)
         self._update_patient_moves()
-        
-        # Draw waiting room
-        waiting_title = self.font.render("WAITING ROOM", self.retro_antialias, WHITE)
-        self.screen.blit(waiting_title, (50, 20))
-        # Background image for waiting room
-        wr_x, wr_y, wr_w, wr_h = 50, self.waiting_room_y, 800, self.waiting_room_height
-        if self.waiting_bg_raw:
-            key = (wr_w, wr_h)
-            if key not in self._waiting_bg_cache:
-                self._waiting_bg_cache[key] = pygame.transform.smoothscale(self.waiting_bg_raw, (wr_w, wr_h))
-            self.screen.blit(self._waiting_bg_cache[key], (wr_x, wr_y))
-        else:
-            pygame.draw.rect(self.screen, DARK_GRAY, (wr_x, wr_y, wr_w, wr_h))
-        pygame.draw.rect(self.screen, WHITE, (wr_x, wr_y, wr_w, wr_h), 2)
-        
-        # Draw waiting patients (exclude those currently walking to beds/vents)
-        waiting_patients = self.game.get_waiting_patients()
-        moving_set = set(self.patient_moves.keys()) if hasattr(self, "patient_moves") else set()
-        visible_waiting = [p for p in waiting_patients if p not in moving_set]
-        for i, patient in enumerate(visible_waiting[:6]):  # Show up to 6
-            # In waiting room show only health bar (no box/id/status)
-            self.draw_patient(patient, 50 + i * 120, self.waiting_room_y + 20, minimal=True)
+
+        # Draw waiting room: background, border and waiting patients (excluding those walking
+        # to beds/vents, up to 6) come from one composite, rebuilt only when what it shows
+        # changes -- between simulation ticks it is a single blit
+        moving_set = set(self.patient_moves)
+        visible_waiting = [p for p in self._waiting_patients() if p not in moving_set][:6]
+        selected = self.selected_patient
+        waiting_key = tuple((p.id, p.severity, p is selected) for p in visible_waiting)
+        if waiting_key != self._waiting_key:
+            self._waiting_key = waiting_key
+            self._waiting_surface, self._waiting_pos = self._compose_waiting_room(visible_waiting)
+        self._blit(self._waiting_surface, self._waiting_pos)
+        # Title after the composite: the floor it carries may reach up under the title
+        waiting_title = _render("font", "WAITING ROOM", WHITE, self.retro_antialias)
+        self._blit(waiting_title, (50, 20))
         
         # Draw bed area (shifted right to make room for ventilators on the left)
         
-        for i, bed in enumerate(self.game.beds):
-            bed_x = 200 + (i % 4) * 150
-            bed_y = self.bed_area_y + 0 + (i // 4) * 120
+        self._build_layout()
+        for bed, (bed_x, bed_y) in zip(self.game.beds, self._bed_layout):
             self.draw_bed(bed, bed_x, bed_y)
             
             # Draw patient in bed if occupied
             # If we have a patient-in-bed sprite, the bed already shows patient;
             # otherwise, overlay a smaller patient icon.
-            if not getattr(self, "patient_in_bed_sprite_raw", None):
-                for patient in self.game.patients:
-                    if patient.assigned_bed == bed:
-                        # Render a slightly narrower patient sprite when in a non-vent bed
-                        self.draw_patient(patient, bed_x + 20, bed_y - 20, 80, 60)
+            if self.patient_in_bed_sprite_raw is None:
+                patient = self.game.patient_in_bed(bed.id)
+                if patient is not None:
+                    # Render a slightly narrower patient sprite when in a non-vent bed
+                    self.draw_patient(patient, bed_x + 20, bed_y - 20, 80, 60)
         
         # Draw ventilators (moved to the left side)
         
-        for i, vent in enumerate(self.game.ventilators):
-            vent_x = 50
-            vent_y = self.bed_area_y + 0 + i * 120
+        for vent, (vent_x, vent_y) in zip(self.game.ventilators, self._vent_layout):
             self.draw_ventilator(vent, vent_x, vent_y)
             
             # If no vent_patient sprite is available, fall back to drawing the patient overlay.
-            if not getattr(self, "vent_patient_raw", None):
-                for patient in self.game.patients:
-                    if patient.assigned_ventilator == vent and patient.status == PatientStatus.ON_VENTILATOR:
-                        self.draw_patient(patient, vent_x + 10, vent_y - 20, 100, 60)
+            if self.vent_patient_raw is None:
+                patient = self.game.patient_on_ventilator(vent.id)
+                if patient is not None:
+                    self.draw_patient(patient, vent_x + 10, vent_y - 20, 100, 60)
  
         # Draw moving patients (walking to assigned bed/vent) using bar-only mode (no box/labels)
         if self.patient_moves:
@@ -983,38 +1133,58 @@ class RetroSimICU:
                 )
 
         # Draw standing placeholders at targets (waiting for nurse)
-        if getattr(self, "patients_waiting_at_target", None):
+        if self.patients_waiting_at_target:
             for patient, (px, py) in list(self.patients_waiting_at_target.items()):
                 # If patient got assigned (bed/vent) and is no longer waiting, keep hidden
                 # Otherwise render a standing sprite + bar at target location
                 if patient.status == PatientStatus.WAITING:
                     self.draw_patient(patient, int(px), int(py), width=100, height=80, bar_only=True)
 
-        # Draw nurses (animated between station and patient)
-        # Define stations (positions already updated above)
-        for i, nurse in enumerate(self.game.nurses):
-            station_x = 830
-            station_y = self.bed_area_y + 0 + i * 56
-            self.nurse_stations[nurse] = (station_x, station_y)
-        # Draw nurses at current positions
-        for nurse in self.game.nurses:
-            nx, ny = self.nurse_positions.get(nurse, self.nurse_stations[nurse])
-            self.draw_nurse(nurse, int(nx), int(ny), self.nurse_size)
+        # Draw nurses at their current animated positions (updated above)
+        if self.nurse_sprite:
+            # Same sprite for every nurse: queue them straight onto the batched blit list
+            sprite = self.nurse_sprite
+            for nx, ny in self.nurse_positions:
+                self._blit(sprite, (int(nx), int(ny)))
+        else:
+            # Fallback circles are all pygame.draw calls: hold one screen lock for the lot
+            # (blits can't run on a locked surface, so the queue is flushed first)
+            self._flush_blits()
+            self.screen.lock()
+            try:
+                for nurse, (nx, ny) in zip(self.game.nurses, self.nurse_positions):
+                    self.draw_nurse(nurse, int(nx), int(ny), self.nurse_size)
+            finally:
+                self.screen.unlock()
         
         # Draw UI panel
-        self.draw_ui_panel()
+        self._flush_blits()
+        panel_rect = self.draw_ui_panel(force=panel_exposed)
         
-        pygame.display.flip()
+        self._flush_blits()
+        if full:
+            pygame.display.flip()
+        else:
+            update_rects = prev_rects + self._dirty_rects
+            if panel_rect is not None:
+                update_rects.append(panel_rect)
+            pygame.display.update(merge_rects(update_rects))
 
     def draw_intro_overlay(self):
         """Intro screen with title, description, and Play button."""
-        if getattr(self, "start_bg_raw", None):
-            key = (self.width, self.height)
-            if key not in self._start_bg_cache:
-                self._start_bg_cache[key] = pygame.transform.smoothscale(self.start_bg_raw, (self.width, self.height))
-            self.screen.blit(self._start_bg_cache[key], (0, 0))
+        # Nothing on the intro changes: compose it once, then every frame is one blit
+        if self._intro_surface is None:
+            self._intro_surface = self._build_intro_surface()
+        self.screen.blit(self._intro_surface, (0, 0))
+        pygame.display.flip()
+
+    def _build_intro_surface(self):
+        """Compose the start screen and its buttons; also sets the button hitboxes."""
+        surface = pygame.Surface((self.width, self.height)).convert()
+        if self._start_bg is not None:
+            surface.blit(self._start_bg, (0, 0))
         else:
-            self.screen.fill(BLACK)
+            surface.fill(BLACK)
         # No intro text; background only with buttons
 
         # Spacing anchor for buttons
@@ -1023,29 +1193,29 @@ class RetroSimICU:
         btn_w, btn_h = 240, 64
         btn_x = (self.width - btn_w) // 2
         btn_y = y + 430
-        pygame.draw.rect(self.screen, DARK_PINK, (btn_x, btn_y, btn_w, btn_h), border_radius=6)
-        pygame.draw.rect(self.screen, WHITE, (btn_x, btn_y, btn_w, btn_h), 2, border_radius=6)
-        btn_text = self.large_font.render("START GAME", self.retro_antialias, WHITE)
-        self.screen.blit(btn_text, (btn_x + (btn_w - btn_text.get_width()) // 2,
-                                    btn_y + (btn_h - btn_text.get_height()) // 2))
-        self._intro_button = (btn_x, btn_y, btn_w, btn_h)
+        pygame.draw.rect(surface, DARK_PINK, (btn_x, btn_y, btn_w, btn_h), border_radius=6)
+        pygame.draw.rect(surface, WHITE, (btn_x, btn_y, btn_w, btn_h), 2, border_radius=6)
+        btn_text = _render("large", "START GAME", WHITE, self.retro_antialias)
+        surface.blit(btn_text, (btn_x + (btn_w - btn_text.get_width()) // 2,
+                                btn_y + (btn_h - btn_text.get_height()) // 2))
+        self._intro_button = pygame.Rect(btn_x, btn_y, btn_w + 1, btn_h + 1)  # +1: edges inclusive
 
         # Rules button under start
         r_w, r_h = 220, 48
         r_x = (self.width - r_w) // 2
         r_y = btn_y + btn_h + 16
-        pygame.draw.rect(self.screen, DARK_GRAY, (r_x, r_y, r_w, r_h), border_radius=6)
-        pygame.draw.rect(self.screen, WHITE, (r_x, r_y, r_w, r_h), 2, border_radius=6)
-        r_text = self.font.render("RULES", self.retro_antialias, WHITE)
-        self.screen.blit(r_text, (r_x + (r_w - r_text.get_width()) // 2,
-                                  r_y + (r_h - r_text.get_height()) // 2))
-        self._intro_rules_button = (r_x, r_y, r_w, r_h)
-        pygame.display.flip()
+        pygame.draw.rect(surface, DARK_GRAY, (r_x, r_y, r_w, r_h), border_radius=6)
+        pygame.draw.rect(surface, WHITE, (r_x, r_y, r_w, r_h), 2, border_radius=6)
+        r_text = _render("font", "RULES", WHITE, self.retro_antialias)
+        surface.blit(r_text, (r_x + (r_w - r_text.get_width()) // 2,
+                              r_y + (r_h - r_text.get_height()) // 2))
+        self._intro_rules_button = pygame.Rect(r_x, r_y, r_w + 1, r_h + 1)
+        return surface
 
     def draw_rules_overlay(self):
         # Rules page uses a solid black background for readability
         self.screen.fill(BLACK)
-        title = self.title_font.render("RULES", self.retro_antialias, YELLOW)
+        title = _render("title", "RULES", YELLOW, self.retro_antialias)
         self.screen.blit(title, ((self.width - title.get_width()) // 2, 100))
         lines = [
             "Goal: Save as many patients as possible with limited beds, nurses, and ventilators.",
@@ -1079,12 +1249,12 @@ class RetroSimICU:
                 if self.font.size(candidate)[0] <= max_width - (20 if indent else 0):
                     line_buf = candidate
                 else:
-                    t = self.font.render(line_buf, self.retro_antialias, color)
+                    t = _render("font", line_buf, color, self.retro_antialias)
                     self.screen.blit(t, (x, y_pos))
                     y_pos += 28
                     line_buf = nxt
             if line_buf:
-                t = self.font.render(line_buf, self.retro_antialias, color)
+                t = _render("font", line_buf, color, self.retro_antialias)
                 self.screen.blit(t, (x, y_pos))
                 y_pos += 28
             return y_pos
@@ -1097,16 +1267,16 @@ class RetroSimICU:
         b_y = y + 30
         pygame.draw.rect(self.screen, BLUE, (b_x, b_y, b_w, b_h), border_radius=6)
         pygame.draw.rect(self.screen, WHITE, (b_x, b_y, b_w, b_h), 2, border_radius=6)
-        b_text = self.large_font.render("BACK", self.retro_antialias, WHITE)
+        b_text = _render("large", "BACK", WHITE, self.retro_antialias)
         self.screen.blit(b_text, (b_x + (b_w - b_text.get_width()) // 2,
                                   b_y + (b_h - b_text.get_height()) // 2))
-        self._rules_back_button = (b_x, b_y, b_w, b_h)
+        self._rules_back_button = pygame.Rect(b_x, b_y, b_w + 1, b_h + 1)
         pygame.display.flip()
 
     # --- AI Controller Helpers (non-intrusive; reuse existing click logic) ---
     def ai_select_patient(self, patient_id: int) -> bool:
         """Programmatically select a waiting patient by id (simulates a click in waiting room)."""
-        waiting = self.game.get_waiting_patients()
+        waiting = self._waiting_patients()
         for i, p in enumerate(waiting):
             if p.id == patient_id:
                 px = 50 + i * 120 + 50  # center of waiting tile
@@ -1152,38 +1322,31 @@ class RetroSimICU:
         
         while running:
             for event in pygame.event.get():
+                if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.WINDOWEXPOSED):
+                    # Any input (selection, pause, reset, speed) or an uncovered window needs a redraw
+                    self._dirty = True
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Left click
                         if self.show_intro:
-                            mx, my = event.pos
-                            if hasattr(self, "_intro_button"):
-                                bx, by, bw, bh = self._intro_button
-                                if bx <= mx <= bx + bw and by <= my <= by + bh:
-                                    self.show_intro = False
-                                    continue
-                            if hasattr(self, "_intro_rules_button"):
-                                rx, ry, rw, rh = self._intro_rules_button
-                                if rx <= mx <= rx + rw and ry <= my <= ry + rh:
-                                    self.show_intro = False
-                                    self.show_rules = True
-                                    continue
+                            if self._intro_button.collidepoint(event.pos):
+                                self.show_intro = False
+                            elif self._intro_rules_button.collidepoint(event.pos):
+                                self.show_intro = False
+                                self.show_rules = True
                             continue
-                        if getattr(self, "show_rules", False):
-                            mx, my = event.pos
-                            if hasattr(self, "_rules_back_button"):
-                                bx, by, bw, bh = self._rules_back_button
-                                if bx <= mx <= bx + bw and by <= my <= by + bh:
-                                    self.show_rules = False
-                                    self.show_intro = True
-                                    continue
+                        if self.show_rules:
+                            if self._rules_back_button.collidepoint(event.pos):
+                                self.show_rules = False
+                                self.show_intro = True
+                                continue
                         self.handle_click(event.pos)
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         if self.show_intro:
                             self.show_intro = False
-                        elif getattr(self, "show_rules", False):
+                        elif self.show_rules:
                             self.show_rules = False
                             self.show_intro = True
                         else:
@@ -1204,9 +1367,13 @@ class RetroSimICU:
                     elif event.key == pygame.K_RIGHTBRACKET:
                         self.update_every_n_frames = max(1, self.update_every_n_frames - 1)
             
+            # Intro/rules/game-over screens are static, like a paused board
+            in_play = (not self.show_intro) and (not self.show_rules) and (not self.game_over)
             if not self.paused:
                 # Update game only when not on intro or rules screens
-                if (not self.show_intro) and (not getattr(self, "show_rules", False)) and (not self.game_over):
+                if in_play:
+                    # Nurses and walking patients animate every frame while playing
+                    self._dirty = True
                     self._frame_counter = (self._frame_counter + 1) % self.update_every_n_frames
                     if self._frame_counter == 0:
                         for _ in range(self.tick_speed):
@@ -1220,8 +1387,11 @@ class RetroSimICU:
                 if self.input_cooldown_ticks > 0:
                     self.input_cooldown_ticks -= 1
             
-            self.draw()
-            self.clock.tick(self.fps)  # Lower FPS for slower, retro feel
+            if self._dirty:
+                self.draw()
+                self._dirty = False
+            # Lower FPS for slower, retro feel; nothing moves while paused, so wake up rarely
+            self.clock.tick(self.paused_fps if self.paused else self.fps)
         
         pygame.quit()
         sys.exit()
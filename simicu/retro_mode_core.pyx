@@ -0,0 +1,50 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Optional compiled nurse motion kernel for retro_mode.py.
+
+Build in place with ``cythonize -i retro_mode_core.pyx``; when the extension is
+not built, retro_mode.py uses sim_icu_kernels.step_nurses() instead.
+"""
+
+import numpy as np
+from libc.math cimport sqrtf, fabsf, copysignf
+
+
+cdef class NurseKinematics:
+    """Advance nurse rows toward their waypoints (same contract as sim_icu_kernels.step_nurses)."""
+
+    cdef public float speed
+
+    def __init__(self, float speed):
+        self.speed = speed
+
+    cpdef tuple step(self, float[:, ::1] pos, float[:, ::1] waypoint):
+        cdef Py_ssize_t i, n = pos.shape[0]
+        cdef float dx, dy, dist, step
+        out_arr = np.empty((n, 2), dtype=np.float32)
+        arrived_arr = np.zeros(n, dtype=np.bool_)
+        cdef float[:, ::1] out = out_arr
+        cdef unsigned char[::1] arrived = arrived_arr.view(np.uint8)
+        for i in range(n):
+            dx = waypoint[i, 0] - pos[i, 0]
+            dy = waypoint[i, 1] - pos[i, 1]
+            if dx == 0 or dy == 0:
+                dist = fabsf(dx) + fabsf(dy)
+            else:
+                dist = sqrtf(dx * dx + dy * dy)
+            if dist < 1:
+                out[i, 0] = waypoint[i, 0]
+                out[i, 1] = waypoint[i, 1]
+                arrived[i] = 1
+                continue
+            step = self.speed if self.speed < dist else dist
+            if dx == 0:
+                out[i, 0] = pos[i, 0]
+                out[i, 1] = pos[i, 1] + copysignf(step, dy)
+            elif dy == 0:
+                out[i, 0] = pos[i, 0] + copysignf(step, dx)
+                out[i, 1] = pos[i, 1]
+            else:
+                out[i, 0] = pos[i, 0] + dx / dist * step
+                out[i, 1] = pos[i, 1] + dy / dist * step
+        return out_arr, arrived_arr
@@ -1,32 +1,40 @@
 from stable_baselines3 import PPO
+from stable_baselines3.common.vec_env import DummyVecEnv
 from sim_icu_env import SimICUEnv
 from stable_baselines3.common.monitor import Monitor
 
 
-def main(model_path: str = "models/best_model/best_model.zip"):
+def main(model_path: str = "models/best_model/best_model.zip", n_envs: int = 1):
     print("Running 'Modern' AI Agent with human render...")
-    env = SimICUEnv(max_patients=10, max_ticks=1000, render_mode="human")
-    env = Monitor(env)
+    # Only env 0 renders; the others just add rows to each batched predict() call
+    env = DummyVecEnv([
+        lambda i=i: Monitor(SimICUEnv(max_patients=10, max_ticks=1000, render_mode="human" if i == 0 else None))
+        for i in range(n_envs)
+    ])
 
     model = PPO.load(model_path)
 
-    obs, info = env.reset()
-    done = False
-    while not done:
+    # VecEnv auto-resets finished envs, so each env's score is taken from its terminal step's info
+    obs = env.reset()
+    scores = [None] * n_envs
+    while any(score is None for score in scores):
         action, _ = model.predict(obs, deterministic=True)
-        obs, reward, terminated, truncated, info = env.step(action)
-        done = terminated or truncated
-        env.render()
+        obs, rewards, dones, infos = env.step(action)
+        for i, done in enumerate(dones):
+            if done and scores[i] is None:
+                scores[i] = infos[i]['score']
+        if scores[0] is None:
+            env.env_method("render", indices=0)
 
-    score = env.game.get_score()
-    print(f"Final Score: Saved={score['patients_saved']}, Lost={score['patients_lost']}")
+    for i, score in enumerate(scores):
+        label = "Final Score" if n_envs == 1 else f"Env {i} Final Score"
+        print(f"{label}: Saved={score['patients_saved']}, Lost={score['patients_lost']}")
 
 
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Run trained PPO model with human render")
     parser.add_argument("--model", type=str, default="models/best_model/best_model.zip", help="Path to model zip")
+    parser.add_argument("--n-envs", type=int, default=1, help="Episodes to run side by side (batched inference)")
     args = parser.parse_args()
-    main(model_path=args.model)
-
-
+    main(model_path=args.model, n_envs=args.n_envs)
@@ -7,7 +7,29 @@ for reinforcement learning.
 import gymnasium as gym
 from gymnasium import spaces
 import numpy as np
-from sim_icu_logic import SimICU, PatientStatus, PatientType
+from sim_icu_logic import (SimICU, PatientStatus, PatientType, WAITING_ID, IN_BED_ID, ON_VENTILATOR_ID,
+                           PENDING_DISCHARGE_ID, RESPIRATORY_ID, CARDIAC_ID)
+from sim_icu_kernels import fill_patient_block, shaping_counts
+
+# Observation encoding per patient type
+_TYPE_ENCODING = {
+    PatientType.RESPIRATORY: 0.0,
+    PatientType.CARDIAC: 0.5,
+    PatientType.TRAUMA: 1.0,
+}
+# Normalized status/type encodings indexed by the game's status/type ids, gathered
+# straight into the observation by fill_patient_block
+_STATUS_NORM_LUT = np.array([s.code for s in PatientStatus], dtype=np.float32) / 4.0
+_TYPE_NORM_LUT = np.array([_TYPE_ENCODING[t] for t in PatientType], dtype=np.float32)
+
+# Action validation tables for step(). Penalty per [status id][action type]: acting on a
+# patient who is done with ICU treatment (cured, lost or pending discharge) is invalid.
+_ACTION_PENALTY = tuple(
+    (-5.0,) * 3 if status in (PatientStatus.CURED, PatientStatus.LOST, PatientStatus.PENDING_DISCHARGE)
+    else (0.0,) * 3
+    for status in PatientStatus)
+# (free beds, free nurses, free vents) each action type needs, else it costs -2
+_ACTION_NEEDS = ((1, 1, 0), (0, 2, 1), (0, 0, 0))
 
 
 class SimICUEnv(gym.Env):
@@ -57,70 +79,70 @@ class SimICUEnv(gym.Env):
             shape=(state_size,),
             dtype=np.float32
         )
+
+        # Observation buffer reused by every _get_state()
+        self._state_buf = np.zeros(state_size, dtype=np.float32)
+        # Patient slots of the buffer (4 values each), filled in place by fill_patient_block
+        self._patient_block = self._state_buf[:max_patients * 4]
+        # Normalization constants: resource counts are fixed for the env's lifetime.
+        # _inv_tail scales the trailing [free_beds, free_nurses, free_vents, free_step_down, tick] slots
+        game = self.game
+        self._inv_max_ticks = 1.0 / max_ticks
+        self._inv_tail = np.array([
+            1.0 / game.num_beds if game.num_beds > 0 else 0.0,
+            1.0 / game.num_nurses if game.num_nurses > 0 else 0.0,
+            1.0 / game.num_ventilators if game.num_ventilators > 0 else 0.0,
+            1.0 / float(game.num_step_down_beds or 1),
+            self._inv_max_ticks,
+        ], dtype=np.float32)
+        self._tail = self._state_buf[-5:]
+        # Leading patient slots that hold a cured/lost patient's final encoding, and the
+        # game.patients list (one per episode) they were written for; see _get_state
+        self._frozen_slots = 0
+        self._frozen_for = None
+        # Waiting patients as counted by the last _calculate_reward(), reused by step()
+        self._waiting_count = 0
     
     def _encode_status(self, status: PatientStatus) -> float:
         """Encode patient status as a number"""
-        status_map = {
-            PatientStatus.WAITING: 0.0,
-            PatientStatus.IN_BED: 1.0,
-            PatientStatus.ON_VENTILATOR: 2.0,
-            PatientStatus.PENDING_DISCHARGE: 3.0,
-            PatientStatus.CURED: 3.0,
-            PatientStatus.LOST: 4.0
-        }
-        return status_map.get(status, 0.0)
+        return status.code
     
     def _encode_type(self, t: PatientType) -> float:
-        type_map = {
-            PatientType.RESPIRATORY: 0.0,
-            PatientType.CARDIAC: 0.5,
-            PatientType.TRAUMA: 1.0,
-        }
-        return type_map.get(t, 0.0)
+        return _TYPE_ENCODING.get(t, 0.0)
 
     def _get_state(self) -> np.ndarray:
         """
         Build the state array from the current game state.
         This is what the AI "sees" about the environment.
         All values are normalized to [0, 1] range.
+
+        Patient slots are filled from the game's SoA arrays (patient ids are
+        sequential, so slot i is patient i). The array is built in a buffer
+        reused by every call, in which slots of cured/lost patients are
+        encoded once and left in place; reset() and step() return copies.
         """
-        state = np.zeros(self.observation_space.shape, dtype=np.float32)
-        
-        # Get max values for normalization
-        max_beds = self.game.num_beds
-        max_nurses = self.game.num_nurses
-        max_vents = self.game.num_ventilators
+        state = self._state_buf
+        game = self.game
         
-        # Get all patients (active and inactive)
-        all_patients = self.game.patients[:self.max_patients]
-        
-        # Pad with zeros if we have fewer patients than max_patients
-        for i in range(self.max_patients):
-            if i < len(all_patients):
-                patient = all_patients[i]
-                # Normalize patient data to [0, 1]
-                base = i * 4
-                state[base] = float(patient.severity) / 100.0  # Max severity is 100
-                state[base + 1] = float(patient.time_waiting) / self.max_ticks  # Max time is max_ticks
-                state[base + 2] = self._encode_status(patient.status) / 4.0  # Max status code is 4
-                state[base + 3] = self._encode_type(patient.patient_type)  # [0,1]
-            else:
-                # No patient in this slot - use default values
-                base = i * 4
-                state[base] = 0.0  # severity
-                state[base + 1] = 0.0  # time_waiting
-                state[base + 2] = 1.0  # status = lost (invalid slot, normalized to 1.0)
-                state[base + 3] = 0.0  # type
+        # Patients before game.live_start are cured or lost and never change again, so slots
+        # that were already final when last written are skipped (all of them on a new episode)
+        if self._frozen_for is not game.patients:
+            self._frozen_for = game.patients
+            self._frozen_slots = 0
+        lo = min(self._frozen_slots, game.live_start)
+        self._frozen_slots = min(game.live_start, self.max_patients)
+
+        # Normalize patient data to [0, 1]: severity (max 100), time waiting (max max_ticks),
+        # status code (max 4) and type; slots without a patient read as lost
+        fill_patient_block(self._patient_block[4 * lo:], game.patient_severity[lo:],
+                           game.patient_time_waiting[lo:], game.patient_status_id[lo:],
+                           game.patient_type_id[lo:], _STATUS_NORM_LUT, _TYPE_NORM_LUT, self._inv_max_ticks)
         
-        # Normalize resource counts and tick
-        state[-5] = float(self.game.free_beds) / max_beds if max_beds > 0 else 0.0
-        state[-4] = float(self.game.free_nurses) / max_nurses if max_nurses > 0 else 0.0
-        state[-3] = float(self.game.free_vents) / max_vents if max_vents > 0 else 0.0
-        # Step-down beds (normalized)
-        max_step = getattr(self.game, "num_step_down_beds", 1) or 1
-        free_step = getattr(self.game, "_free_step_down_beds", 0)
-        state[-2] = float(free_step) / float(max_step)
-        state[-1] = float(self.game.tick) / self.max_ticks
+        # Normalize resource counts (incl. step-down beds) and tick in one vector op
+        tail = self._tail
+        tail[:] = (game.free_beds, game.free_nurses, game.free_vents,
+                   game.free_step_down_beds, game.tick)
+        tail *= self._inv_tail
         
         return state
     
@@ -128,16 +150,14 @@ class SimICUEnv(gym.Env):
         """Reset the environment to initial state"""
         super().reset(seed=seed)
         
-        if seed is not None:
-            np.random.seed(seed)
-        
-        self.game.reset()
+        # The game owns its generator; a seed makes the episode reproducible per env
+        self.game.reset(seed=seed)
         
         # Run a few ticks to get some initial patients
         for _ in range(5):
             self.game.update_tick()
         
-        initial_state = self._get_state()
+        initial_state = self._get_state().copy()
         info = {}
         
         return initial_state, info
@@ -145,59 +165,53 @@ class SimICUEnv(gym.Env):
     def step(self, action):
         patient_slot_id, action_type = action
 
-        step_penalty = 0.0
-
-        # 1) Validate action
-        if patient_slot_id >= len(self.game.patients):
+        # 1) Validate action: table lookups by status id and action type
+        game = self.game
+        patient = None
+        if patient_slot_id >= len(game.patients):
             step_penalty = -5.0
-            patient = None
         else:
-            patient = self.game.patients[patient_slot_id]
-
-        if patient and patient.status in [PatientStatus.CURED, PatientStatus.LOST, PatientStatus.PENDING_DISCHARGE]:
-            step_penalty = -5.0
-            patient = None
-
-        if patient and action_type == 0:
-            if self.game.free_beds == 0 or self.game.free_nurses == 0:
-                step_penalty = -2.0
-                patient = None
-        elif patient and action_type == 1:
-            if self.game.free_vents == 0 or self.game.free_nurses < 2:
-                step_penalty = -2.0
+            patient = game.patients[patient_slot_id]
+            step_penalty = _ACTION_PENALTY[patient.status.id][action_type]
+            if not step_penalty:
+                beds, nurses, vents = _ACTION_NEEDS[action_type]
+                if game.free_beds < beds or game.free_nurses < nurses or game.free_vents < vents:
+                    step_penalty = -2.0
+            if step_penalty:
                 patient = None
 
         # Severity before
-        prev_total_severity = sum(p.severity for p in self.game.patients if p.status not in [PatientStatus.CURED, PatientStatus.LOST])
+        prev_total_severity = game.active_severity
 
         # 2) Apply immediately
         if patient and action_type != 2:
-            self.game.perform_action(patient.id, action_type)
+            game.perform_action(patient.id, action_type)
 
         # 3) Advance game
-        self.game.update_tick()
+        game.update_tick()
 
         # 4) New state and reward
-        new_state = self._get_state()
-        new_total_severity = sum(p.severity for p in self.game.patients if p.status not in [PatientStatus.CURED, PatientStatus.LOST])
+        new_state = self._get_state().copy()
+        new_total_severity = game.active_severity
 
         reward = self._calculate_reward() + step_penalty
         delta_severity = new_total_severity - prev_total_severity
         reward += 0.1 * delta_severity
 
-        if self.game.just_incurred_setup_delay:
+        if game.just_incurred_setup_delay:
             reward -= 5.0
 
         if action_type == 2:
-            if self.game.total_waiting_patients > 0 and self.game.free_nurses > 0:
+            # Nothing changes the game between _calculate_reward() and here, so its count still holds
+            if self._waiting_count > 0 and game.free_nurses > 0:
                 reward -= 0.5
 
-        terminated = self.game.is_game_over(self.max_ticks)
+        terminated = game.is_game_over(self.max_ticks)
         truncated = False
         info = {
-            'patients_saved': self.game.patients_saved,
-            'patients_lost': self.game.patients_lost,
-            'score': self.game.get_score()
+            'patients_saved': game.patients_saved,
+            'patients_lost': game.patients_lost,
+            'score': game.get_score()
         }
 
         return new_state, reward, terminated, truncated, info
@@ -210,31 +224,28 @@ class SimICUEnv(gym.Env):
         reward = 0.0
 
         # Large sparse rewards for terminal outcomes
-        if self.game.just_saved_a_patient:
+        game = self.game
+        if game.just_saved_a_patient:
             reward += 100.0
-        if self.game.just_lost_a_patient:
+        if game.just_lost_a_patient:
             reward -= 100.0
 
-        # Dense shaping rewards per step (tuned)
-        waiting = self.game.total_waiting_patients
-        # Count treated patients only when setup is done and a nurse is attending
-        treated = 0
-        waiting_patients = []
-        for p in self.game.patients:
-            if p.status == PatientStatus.IN_BED and getattr(p, 'bed_setup_ticks', 0) <= 0 and getattr(p, 'assigned_nurse', None) is not None:
-                treated += 1
-            elif p.status == PatientStatus.ON_VENTILATOR and getattr(p, 'vent_setup_ticks', 0) <= 0 and getattr(p, 'assigned_nurse', None) is not None:
-                treated += 1
-            elif p.status == PatientStatus.WAITING:
-                waiting_patients.append(p)
-        pending = len([p for p in self.game.patients if p.status == PatientStatus.PENDING_DISCHARGE])
+        # Dense shaping rewards per step (tuned), counted over the game's SoA arrays.
+        # Treated patients: setup is done and a nurse is attending. Cured/lost patients add
+        # nothing to any term, so rows before the first one still in the ICU are skipped
+        lo = game.live_start
+        (waiting, treated, pending, sum_waiting_severity,
+         vent_treated, vent_respiratory, bed_cardiac) = shaping_counts(
+            game.patient_status_id[lo:], game.patient_type_id[lo:], game.patient_severity[lo:],
+            game.patient_treated[lo:], WAITING_ID, IN_BED_ID, ON_VENTILATOR_ID, PENDING_DISCHARGE_ID,
+            RESPIRATORY_ID, CARDIAC_ID)
+        self._waiting_count = waiting
 
         # Encourage treatment
         reward += 0.8 * treated
 
         # Stronger penalty for patients waiting: count and aggregate severity
         reward -= 0.15 * waiting
-        sum_waiting_severity = sum(p.severity for p in waiting_patients)
         reward -= 0.01 * sum_waiting_severity
 
         # ICU gridlock penalties (non-linear)
@@ -242,18 +253,12 @@ class SimICUEnv(gym.Env):
         reward -= 0.05 * (pending * pending)
 
         # Archetype-aware treatment shaping
-        for p in self.game.patients:
-            if p.status == PatientStatus.ON_VENTILATOR and getattr(p, 'vent_setup_ticks', 0) <= 0 and getattr(p, 'assigned_nurse', None) is not None:
-                if getattr(p, 'patient_type', None) == PatientType.RESPIRATORY:
-                    reward += 0.3
-                else:
-                    reward -= 0.3
-            if p.status == PatientStatus.IN_BED and getattr(p, 'bed_setup_ticks', 0) <= 0 and getattr(p, 'assigned_nurse', None) is not None:
-                if getattr(p, 'patient_type', None) == PatientType.CARDIAC:
-                    reward += 0.2
+        reward += 0.3 * vent_respiratory
+        reward -= 0.3 * (vent_treated - vent_respiratory)
+        reward += 0.2 * bed_cardiac
 
         # Opportunity cost: nurses bound to ongoing treatments reduce flexibility
-        nurses_in_use = self.game.num_nurses - self.game.free_nurses
+        nurses_in_use = game.num_nurses - game.free_nurses
         reward -= 0.2 * nurses_in_use
 
         return reward
@@ -272,3 +277,28 @@ class SimICUEnv(gym.Env):
          return np.zeros((100, 100, 3), dtype=np.uint8)
       
       return None
+
+
+# Registered so gym.make("SimICU-v0", ...) works once this module is imported
+gym.register(id="SimICU-v0", entry_point="sim_icu_env:SimICUEnv")
+
+
+def make_simicu(**kwargs) -> SimICUEnv:
+    """Factory for a single SimICUEnv; kwargs are passed to the constructor."""
+    return SimICUEnv(**kwargs)
+
+
+def make_simicu_vec(num_envs: int, asynchronous: bool = True, **kwargs) -> gym.vector.VectorEnv:
+    """
+    Run num_envs SimICUEnv instances as one Gymnasium vector env.
+
+    With asynchronous=True each env steps in its own worker process and observations
+    come back through a shared-memory float32 buffer, stacked as (num_envs, state_size)
+    without pickling. Batch the policy's inference over that array rather than calling
+    it once per env.
+    """
+    env_fns = [lambda: make_simicu(**kwargs) for _ in range(num_envs)]
+    if asynchronous:
+        return gym.vector.AsyncVectorEnv(env_fns, shared_memory=True)
+    return gym.vector.SyncVectorEnv(env_fns)
+
@@ -0,0 +1,269 @@
+"""
+Small numeric kernels shared by the SimICU front-ends and the RL environment.
+
+Numba is optional: when it is installed the kernels are JIT-compiled
+(and cached on disk), otherwise equivalent NumPy implementations are used.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+
+
+def _step_nurses_numpy(pos, waypoint, speed):
+    """Vectorized fallback for step_nurses()."""
+    delta = waypoint - pos
+    dist = np.linalg.norm(delta, axis=1)
+    arrived = dist < 1
+    out = waypoint.copy()
+    go = ~arrived
+    step = np.minimum(speed, dist[go])
+    out[go] = pos[go] + delta[go] / dist[go, None] * step[:, None]
+    return out, arrived
+
+
+if HAVE_NUMBA:
+    # Eager signature: compiled (or loaded from the on-disk cache) at import time rather
+    # than on the first animated frame, where a lazy JIT compile shows up as a stall.
+    # Callers pass C-contiguous float32 (N, 2) arrays and a float32 speed.
+    @njit("Tuple((float32[:, ::1], boolean[::1]))(float32[:, ::1], float32[:, ::1], float32)",
+          cache=True, fastmath=True)
+    def _step_nurses_jit(pos, waypoint, speed):
+        n = pos.shape[0]
+        out = np.empty_like(pos)
+        arrived = np.zeros(n, dtype=np.bool_)
+        for i in range(n):
+            dx = waypoint[i, 0] - pos[i, 0]
+            dy = waypoint[i, 1] - pos[i, 1]
+            # Corridor paths are axis-aligned, so most segments need no sqrt
+            axis_aligned = dx == 0.0 or dy == 0.0
+            if axis_aligned:
+                dist = abs(dx) + abs(dy)
+            else:
+                dist = np.sqrt(dx * dx + dy * dy)
+            if dist < 1.0:
+                out[i, 0] = waypoint[i, 0]
+                out[i, 1] = waypoint[i, 1]
+                arrived[i] = True
+            elif axis_aligned:
+                step = min(speed, dist)
+                out[i, 0] = pos[i, 0] + math.copysign(step, dx) if dx != 0.0 else pos[i, 0]
+                out[i, 1] = pos[i, 1] + math.copysign(step, dy) if dy != 0.0 else pos[i, 1]
+            else:
+                step = min(speed, dist)
+                out[i, 0] = pos[i, 0] + dx / dist * step
+                out[i, 1] = pos[i, 1] + dy / dist * step
+        return out, arrived
+
+
+def step_nurses(pos, waypoint, speed):
+    """
+    Advance each row of pos (N, 2) toward waypoint (N, 2) by at most speed pixels.
+
+    Rows within 1px of their waypoint snap onto it. Returns (new_pos, arrived)
+    where arrived flags the snapped rows.
+    """
+    if HAVE_NUMBA:
+        return _step_nurses_jit(pos, waypoint, np.float32(speed))
+    return _step_nurses_numpy(pos, waypoint, np.float32(speed))
+
+
+# Observation slot with no patient behind it: zero severity, wait and type, status 1.0 (lost)
+_EMPTY_SLOT = np.array([0.0, 0.0, 1.0, 0.0], dtype=np.float32)
+
+
+def _fill_patient_block_numpy(out, severity, time_waiting, status_id, type_id, status_code, type_code, inv_ticks):
+    """Vectorized fallback for fill_patient_block()."""
+    n = min(severity.shape[0], out.shape[0] // 4)
+    np.copyto(out[4 * n:].reshape(-1, 4), _EMPTY_SLOT)
+    np.multiply(severity[:n], 0.01, out=out[0:4 * n:4])
+    np.multiply(time_waiting[:n], inv_ticks, out=out[1:4 * n:4])
+    # mode='clip' lets take() write straight into the strided slots (ids are always in range)
+    np.take(status_code, status_id[:n], out=out[2:4 * n:4], mode='clip')
+    np.take(type_code, type_id[:n], out=out[3:4 * n:4], mode='clip')
+
+
+def _shaping_counts_numpy(status_id, type_id, severity, treated, waiting_id, in_bed_id, on_vent_id,
+                          pending_id, respiratory_id, cardiac_id):
+    """Vectorized fallback for shaping_counts()."""
+    # Status totals from one bincount; the type-aware terms only look at the treated rows
+    by_status = np.bincount(status_id.astype(np.intp), minlength=max(waiting_id, pending_id) + 1)
+    treated_status = status_id[treated]
+    treated_type = type_id[treated]
+    vent_treated = treated_status == on_vent_id
+    return (int(by_status[waiting_id]),
+            int(treated_status.shape[0]),
+            int(by_status[pending_id]),
+            float(severity[status_id == waiting_id].sum()),
+            int(np.count_nonzero(vent_treated)),
+            int(np.count_nonzero(vent_treated & (treated_type == respiratory_id))),
+            int(np.count_nonzero((treated_status == in_bed_id) & (treated_type == cardiac_id))))
+
+
+if HAVE_NUMBA:
+    # Same eager-compile convention as _step_nurses_jit; argument dtypes match SimICU's SoA arrays
+    @njit("void(float32[::1], float64[::1], int32[::1], int8[::1], int8[::1], float32[::1], float32[::1], float64)",
+          cache=True)
+    def _fill_patient_block_jit(out, severity, time_waiting, status_id, type_id, status_code, type_code, inv_ticks):
+        n = min(severity.shape[0], out.shape[0] // 4)
+        for i in range(n):
+            out[4 * i] = severity[i] * 0.01
+            out[4 * i + 1] = time_waiting[i] * inv_ticks
+            out[4 * i + 2] = status_code[status_id[i]]
+            out[4 * i + 3] = type_code[type_id[i]]
+        for i in range(n, out.shape[0] // 4):
+            out[4 * i] = 0.0
+            out[4 * i + 1] = 0.0
+            out[4 * i + 2] = 1.0
+            out[4 * i + 3] = 0.0
+
+    @njit("Tuple((int64, int64, int64, float64, int64, int64, int64))"
+          "(int8[::1], int8[::1], float64[::1], boolean[::1], int64, int64, int64, int64, int64, int64)",
+          cache=True)
+    def _shaping_counts_jit(status_id, type_id, severity, treated, waiting_id, in_bed_id, on_vent_id,
+                            pending_id, respiratory_id, cardiac_id):
+        waiting = 0
+        n_treated = 0
+        pending = 0
+        waiting_severity = 0.0
+        vent_treated = 0
+        vent_respiratory = 0
+        bed_cardiac = 0
+        # One pass over the patient columns instead of a mask per shaping term
+        for i in range(status_id.shape[0]):
+            status = status_id[i]
+            if status == waiting_id:
+                waiting += 1
+                waiting_severity += severity[i]
+            elif status == pending_id:
+                pending += 1
+            if treated[i]:
+                n_treated += 1
+                if status == on_vent_id:
+                    vent_treated += 1
+                    if type_id[i] == respiratory_id:
+                        vent_respiratory += 1
+                elif status == in_bed_id and type_id[i] == cardiac_id:
+                    bed_cardiac += 1
+        return waiting, n_treated, pending, waiting_severity, vent_treated, vent_respiratory, bed_cardiac
+
+
+def _tick_patients_numpy(severity, status_id, type_id, time_waiting, setup, attended,
+                         wait_decline, bed_gain, vent_gain, crash_type, crash_severity, crash_decline,
+                         waiting_id, in_bed_id, on_vent_id, pending_id, lost_id):
+    """Vectorized fallback for tick_patients()."""
+    waiting = status_id == waiting_id
+    in_bed = status_id == in_bed_id
+    on_vent = status_id == on_vent_id
+    setting = setup > 0
+    bed_setting = in_bed & setting
+    vent_setting = on_vent & setting
+    time_waiting += waiting
+    setup -= bed_setting | vent_setting
+    # One severity delta per row from masked arithmetic, then a single clip: declines never
+    # start above 100 and gains never start below 0, so the clip matches each branch's bound
+    decline = np.where((type_id == crash_type) & (severity < crash_severity), crash_decline, wait_decline[type_id])
+    delta = np.where(waiting, -(decline + (time_waiting // 20) * 0.1), 0.0)
+    delta -= 0.5 * bed_setting + 1.0 * vent_setting
+    delta += bed_gain[type_id] * (in_bed & ~bed_setting & attended)
+    delta += vent_gain[type_id] * (on_vent & ~vent_setting & attended)
+    np.clip(severity + delta, 0.0, 100.0, out=severity)
+    recovered = (severity >= 100.0) & (status_id != pending_id)
+    lost = ~recovered & (severity <= 0.0) & (status_id != lost_id)
+    status_id[:] = np.where(recovered, pending_id, np.where(lost, lost_id, status_id))
+    return int(np.count_nonzero(status_id == waiting_id))
+
+
+if HAVE_NUMBA:
+    @njit("int64(float64[::1], int8[::1], int8[::1], int32[::1], int32[::1], boolean[::1], "
+          "float64[::1], float64[::1], float64[::1], int64, float64, float64, int64, int64, int64, int64, int64)",
+          cache=True)
+    def _tick_patients_jit(severity, status_id, type_id, time_waiting, setup, attended,
+                           wait_decline, bed_gain, vent_gain, crash_type, crash_severity, crash_decline,
+                           waiting_id, in_bed_id, on_vent_id, pending_id, lost_id):
+        n_waiting = 0
+        for i in range(severity.shape[0]):
+            status = status_id[i]
+            kind = type_id[i]
+            sev = severity[i]
+            if status == waiting_id:
+                time_waiting[i] += 1
+                decline = crash_decline if kind == crash_type and sev < crash_severity else wait_decline[kind]
+                sev = max(0.0, sev - (decline + (time_waiting[i] // 20) * 0.1))
+            elif status == in_bed_id:
+                if setup[i] > 0:
+                    setup[i] -= 1
+                    sev = max(0.0, sev - 0.5)
+                elif attended[i]:
+                    sev = min(100.0, sev + bed_gain[kind])
+            elif status == on_vent_id:
+                if setup[i] > 0:
+                    setup[i] -= 1
+                    sev = max(0.0, sev - 1.0)
+                elif attended[i]:
+                    sev = min(100.0, sev + vent_gain[kind])
+            severity[i] = sev
+            if sev >= 100.0 and status != pending_id:
+                status_id[i] = pending_id
+            elif sev <= 0.0 and status != lost_id:
+                status_id[i] = lost_id
+            elif status == waiting_id:
+                n_waiting += 1
+        return n_waiting
+
+
+def fill_patient_block(out, severity, time_waiting, status_id, type_id, status_code, type_code, inv_ticks):
+    """
+    Write the normalized patient slots of an observation into out (float32, 4 values per slot).
+
+    Slot i holds patient i: severity / 100, time waiting * inv_ticks, and the status and type
+    codes looked up by id. Slots past the last patient are zeros with status 1.0 (lost).
+    """
+    if HAVE_NUMBA:
+        _fill_patient_block_jit(out, severity, time_waiting, status_id, type_id, status_code, type_code,
+                                float(inv_ticks))
+    else:
+        _fill_patient_block_numpy(out, severity, time_waiting, status_id, type_id, status_code, type_code,
+                                  inv_ticks)
+
+
+def shaping_counts(status_id, type_id, severity, treated, waiting_id, in_bed_id, on_vent_id,
+                   pending_id, respiratory_id, cardiac_id):
+    """
+    Counts behind the dense reward terms, from the patient SoA columns.
+
+    Returns (waiting, treated, pending, waiting_severity, vent_treated, vent_respiratory,
+    bed_cardiac); the last three only count treated patients.
+    """
+    if HAVE_NUMBA:
+        return _shaping_counts_jit(status_id, type_id, severity, treated, waiting_id, in_bed_id, on_vent_id,
+                                   pending_id, respiratory_id, cardiac_id)
+    return _shaping_counts_numpy(status_id, type_id, severity, treated, waiting_id, in_bed_id, on_vent_id,
+                                 pending_id, respiratory_id, cardiac_id)
+
+
+def tick_patients(severity, status_id, type_id, time_waiting, setup, attended,
+                  wait_decline, bed_gain, vent_gain, crash_type, crash_severity, crash_decline,
+                  waiting_id, in_bed_id, on_vent_id, pending_id, lost_id):
+    """
+    Advance one tick of patient state, in place, for rows of patients still in the ICU.
+
+    Waiting rows count up their wait and lose wait_decline[type] plus 0.1 per 20 ticks waited
+    (crash_decline instead for crash_type rows below crash_severity). Bed and ventilator rows
+    lose 0.5 / 1.0 per tick while their setup countdown (bed or ventilator, whichever the
+    status uses) runs down, then gain bed_gain / vent_gain[type] while attended.
+    Rows reaching 100 move to pending_id, rows reaching 0 to lost_id. Returns the number
+    of rows still waiting afterwards.
+    """
+    args = (severity, status_id, type_id, time_waiting, setup, attended,
+            wait_decline, bed_gain, vent_gain, crash_type, crash_severity, crash_decline,
+            waiting_id, in_bed_id, on_vent_id, pending_id, lost_id)
+    if HAVE_NUMBA:
+        return _tick_patients_jit(*args)
+    return _tick_patients_numpy(*args)
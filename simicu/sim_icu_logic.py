@@ -3,11 +3,14 @@ Core Simulation Engine for SimICU
 This is the shared backend logic that both the player and AI interact with.
 """
 
+import heapq
 import numpy as np
 from enum import Enum
 from typing import List, Optional
 import random
 
+from sim_icu_kernels import tick_patients
+
 
 class PatientStatus(Enum):
     """Patient status states"""
@@ -18,22 +21,90 @@ class PatientStatus(Enum):
     CURED = "cured"
     LOST = "lost"
 
+# Observation code per status (0=waiting .. 4=lost), stored on the member as status.code.
+# Pending discharge shares the cured code: the patient is done with ICU treatment.
+for _status, _code in ((PatientStatus.WAITING, 0.0), (PatientStatus.IN_BED, 1.0),
+                       (PatientStatus.ON_VENTILATOR, 2.0), (PatientStatus.PENDING_DISCHARGE, 3.0),
+                       (PatientStatus.CURED, 3.0), (PatientStatus.LOST, 4.0)):
+    _status.code = _code
+del _status, _code
+
+# Dense integer ids for PatientStatus, in declaration order (used by the SoA arrays).
+# Also stored on the member as status.id: reading an attribute skips Enum's Python-level __hash__.
+STATUS_IDS = {status: i for i, status in enumerate(PatientStatus)}
+for _status, _id in STATUS_IDS.items():
+    _status.id = _id
+del _status, _id
+WAITING_ID = PatientStatus.WAITING.id
+IN_BED_ID = PatientStatus.IN_BED.id
+ON_VENTILATOR_ID = PatientStatus.ON_VENTILATOR.id
+PENDING_DISCHARGE_ID = PatientStatus.PENDING_DISCHARGE.id
+CURED_ID = PatientStatus.CURED.id
+LOST_ID = PatientStatus.LOST.id
+# Per status id: is the patient still in the ICU (not cured or lost)
+ACTIVE_STATUS = np.array([s not in (PatientStatus.CURED, PatientStatus.LOST) for s in PatientStatus])
+
+
 class PatientType(Enum):
     RESPIRATORY = "respiratory"
     CARDIAC = "cardiac"
     TRAUMA = "trauma"
 
+# Dense integer ids for PatientType, in declaration order (used by the SoA arrays), also as type.id
+TYPE_IDS = {patient_type: i for i, patient_type in enumerate(PatientType)}
+for _type, _id in TYPE_IDS.items():
+    _type.id = _id
+del _type, _id
+RESPIRATORY_ID = PatientType.RESPIRATORY.id
+CARDIAC_ID = PatientType.CARDIAC.id
+TRAUMA_ID = PatientType.TRAUMA.id
+
+# Module-level aliases for the per-tick code: a global load instead of a global plus an Enum
+# class attribute lookup on every comparison
+_WAITING = PatientStatus.WAITING
+_IN_BED = PatientStatus.IN_BED
+_ON_VENTILATOR = PatientStatus.ON_VENTILATOR
+_PENDING_DISCHARGE = PatientStatus.PENDING_DISCHARGE
+_CURED = PatientStatus.CURED
+_LOST = PatientStatus.LOST
+_RESPIRATORY = PatientType.RESPIRATORY
+_CARDIAC = PatientType.CARDIAC
+_TRAUMA = PatientType.TRAUMA
+# Statuses a patient can be put on a ventilator from, and statuses that have left the ICU
+_VENTILATABLE = (_WAITING, _IN_BED, _PENDING_DISCHARGE)
+_DISCHARGED = (_CURED, _LOST)
+# Archetypes a new patient is drawn from (built once, not per Patient)
+_PATIENT_TYPES = (_RESPIRATORY, _CARDIAC, _TRAUMA)
+# Inter-arrival gaps drawn per np.random call (see SimICU._generate_next_arrival)
+ARRIVAL_BATCH = 1024
+
+# PatientStatus member per status id
+_STATUS_BY_ID = tuple(PatientStatus)
+
+# Per-tick severity rates by type id, as applied in Patient.update: waiting decline
+# (0.5 * type rate), and bed / ventilator gains once setup is done and a nurse attends.
+# Cardiac patients below CARDIAC_CRASH_SEVERITY decline at CARDIAC_CRASH_DECLINE instead.
+WAIT_DECLINE = np.array([{_RESPIRATORY: 0.5, _CARDIAC: 0.25, _TRAUMA: 1.5}[t] for t in PatientType])
+CARDIAC_CRASH_SEVERITY = 30.0
+CARDIAC_CRASH_DECLINE = 1.25
+BED_GAIN = np.array([{_RESPIRATORY: 0.5, _CARDIAC: 3.0, _TRAUMA: 2.0}[t] for t in PatientType])
+VENT_GAIN = np.array([{_RESPIRATORY: 6.0, _CARDIAC: 0.4, _TRAUMA: 3.0}[t] for t in PatientType])
+
 
 class Patient:
     """Represents a patient in the ICU simulation"""
+
+    # Fixed attribute set: slot access is faster than a per-instance __dict__ in the UI loops
+    __slots__ = ('id', 'severity', 'status', 'time_waiting', 'assigned_nurse', 'assigned_nurse2',
+                 'assigned_bed', 'assigned_ventilator', 'bed_setup_ticks', 'vent_setup_ticks', 'patient_type')
     
-    def __init__(self, patient_id: int, initial_severity: int = 50):
+    def __init__(self, patient_id: int, initial_severity: int = 50, patient_type: Optional[PatientType] = None):
         self.id = patient_id
         # Interpret 'severity' as LIFE from 0..100 where:
         #   0  = death, 100 = full recovery.
         # Patients lose life while waiting and gain life when treated.
         self.severity = float(initial_severity)
-        self.status = PatientStatus.WAITING
+        self.status = _WAITING
         self.time_waiting = 0
         self.assigned_nurse = None
         self.assigned_nurse2 = None
@@ -42,26 +113,26 @@ class Patient:
         # Setup times: when (re)assigned, treatment is delayed during setup
         self.bed_setup_ticks = 0
         self.vent_setup_ticks = 0
-        # Archetype
-        self.patient_type = random.choice([PatientType.RESPIRATORY, PatientType.CARDIAC, PatientType.TRAUMA])
+        # Archetype (SimICU draws it from its own generator; random pick otherwise)
+        self.patient_type = patient_type if patient_type is not None else random.choice(_PATIENT_TYPES)
         
     def update(self):
-        """Update patient state each tick"""
-        if self.status == PatientStatus.WAITING:
+        """Update patient state each tick (SimICU.update_tick applies the same rules in batch via tick_patients)"""
+        if self.status == _WAITING:
             self.time_waiting += 1
             # Type-dependent deterioration (ticking time bomb behavior)
             base_decline = 0.5
             rate = 1.0
-            if self.patient_type == PatientType.TRAUMA:
+            if self.patient_type == _TRAUMA:
                 rate = 3.0  # Trauma declines much faster
-            elif self.patient_type == PatientType.CARDIAC:
+            elif self.patient_type == _CARDIAC:
                 rate = 2.5 if self.severity < 30 else 0.5
-            elif self.patient_type == PatientType.RESPIRATORY:
+            elif self.patient_type == _RESPIRATORY:
                 rate = 1.0
             extra = (self.time_waiting // 20) * 0.1
             self.severity = max(0.0, self.severity - ((base_decline * rate) + extra))
             
-        elif self.status == PatientStatus.IN_BED:
+        elif self.status == _IN_BED:
             # Gain life with bed + nurse care (slower, steady)
             if self.bed_setup_ticks > 0:
                 self.bed_setup_ticks -= 1
@@ -72,15 +143,15 @@ class Patient:
                 if self.assigned_nurse is not None:
                     # Exaggerated, archetype-aware bed effects
                     base = 2.0
-                    if self.patient_type == PatientType.RESPIRATORY:
+                    if self.patient_type == _RESPIRATORY:
                         eff = base * 0.25   # +0.5, beds are poor for respiratory
-                    elif self.patient_type == PatientType.CARDIAC:
+                    elif self.patient_type == _CARDIAC:
                         eff = base * 1.5    # +3.0, beds are primary for cardiac
                     else:  # TRAUMA or other
                         eff = base * 1.0    # +2.0, beds are solid for general/trauma
                     self.severity = min(100.0, self.severity + eff)
             
-        elif self.status == PatientStatus.ON_VENTILATOR:
+        elif self.status == _ON_VENTILATOR:
             # Gain life faster with ventilator
             if self.vent_setup_ticks > 0:
                 self.vent_setup_ticks -= 1
@@ -91,20 +162,20 @@ class Patient:
                 if self.assigned_nurse is not None:
                     # Exaggerated, archetype-aware vent effects
                     base = 4.0
-                    if self.patient_type == PatientType.RESPIRATORY:
+                    if self.patient_type == _RESPIRATORY:
                         eff = base * 1.5    # +6.0, vents are critical here
-                    elif self.patient_type == PatientType.CARDIAC:
+                    elif self.patient_type == _CARDIAC:
                         eff = base * 0.1    # +0.4, vents are wasteful here
                     else:  # TRAUMA or other
                         eff = base * 0.75   # +3.0, decent but not as vital
                     self.severity = min(100.0, self.severity + eff)
         
         # Check for state transitions
-        if self.severity >= 100.0 and self.status not in [PatientStatus.CURED, PatientStatus.PENDING_DISCHARGE]:
+        if self.severity >= 100.0 and self.status not in (_CURED, _PENDING_DISCHARGE):
             # Do NOT cure immediately: move to pending discharge, keep ICU resources
-            self.status = PatientStatus.PENDING_DISCHARGE
-        elif self.severity <= 0.0 and self.status != PatientStatus.LOST:
-            self.status = PatientStatus.LOST
+            self.status = _PENDING_DISCHARGE
+        elif self.severity <= 0.0 and self.status != _LOST:
+            self.status = _LOST
             self._release_resources()
     
     def _release_resources(self):
@@ -113,7 +184,7 @@ class Patient:
             self.assigned_nurse.available = True
             self.assigned_nurse = None
         # Release second nurse if present (used for ventilator patients)
-        if hasattr(self, 'assigned_nurse2') and self.assigned_nurse2:
+        if self.assigned_nurse2:
             self.assigned_nurse2.available = True
             self.assigned_nurse2 = None
         if self.assigned_bed:
@@ -126,6 +197,8 @@ class Patient:
 
 class Nurse:
     """Represents a nurse resource"""
+    __slots__ = ('id', 'available')
+
     def __init__(self, nurse_id: int):
         self.id = nurse_id
         self.available = True
@@ -133,6 +206,8 @@ class Nurse:
 
 class Bed:
     """Represents a bed resource"""
+    __slots__ = ('id', 'available')
+
     def __init__(self, bed_id: int):
         self.id = bed_id
         self.available = True
@@ -140,6 +215,8 @@ class Bed:
 
 class Ventilator:
     """Represents a ventilator resource"""
+    __slots__ = ('id', 'available')
+
     def __init__(self, ventilator_id: int):
         self.id = ventilator_id
         self.available = True
@@ -148,7 +225,10 @@ class Ventilator:
 class SimICU:
     """Core ICU simulation engine"""
     
-    def __init__(self, num_nurses: int = 6, num_beds: int = 10, num_ventilators: int = 3, max_patients_on_arrival=3, arrival_rate=0.10, num_step_down_beds: int = 8):
+    def __init__(self, num_nurses: int = 6, num_beds: int = 10, num_ventilators: int = 3, max_patients_on_arrival=3, arrival_rate=0.10, num_step_down_beds: int = 8, seed: Optional[int] = None):
+        # Every random draw of the simulation (arrivals, severities, archetypes, step-down
+        # stays) comes from this generator, so each instance is reproducible on its own
+        self.rng = np.random.default_rng(seed)
         self.num_nurses = num_nurses
         self.num_beds = num_beds
         self.num_ventilators = num_ventilators
@@ -162,6 +242,8 @@ class SimICU:
         # Patient management
         self.patients: List[Patient] = []
         self.next_patient_id = 0
+        # Patients currently WAITING, kept in step with every status change
+        self._n_waiting = 0
         
         # Game state
         self.tick = 0
@@ -172,6 +254,8 @@ class SimICU:
         # Patient arrival parameters (Poisson distribution)
         self.max_patients_on_arrival = max_patients_on_arrival
         self.arrival_rate = arrival_rate
+        self._arrival_gaps: List[int] = []
+        self._arrival_idx = 0
         self.next_arrival = self._generate_next_arrival()
         
         # Track state changes for reward calculation
@@ -185,23 +269,79 @@ class SimICU:
         self._free_vents = num_ventilators
         self._free_step_down_beds = num_step_down_beds
         self._step_down_occupancies: List[int] = []
+        # Free-resource id heaps (see _first_free); smallest free id first, like the old scans
+        self._free_nurse_ids: List[int] = []
+        self._free_bed_ids: List[int] = []
+        self._free_vent_ids: List[int] = []
+        # Whether an id is currently in its heap, so releases never queue it twice
+        self._nurse_queued = np.zeros(num_nurses, dtype=bool)
+        self._bed_queued = np.zeros(num_beds, dtype=bool)
+        self._vent_queued = np.zeros(num_ventilators, dtype=bool)
+
+        # SoA shadow arrays (see _sync_arrays); patient arrays are indexed by patient id
+        self.bed_available = np.ones(num_beds, dtype=bool)
+        self.vent_available = np.ones(num_ventilators, dtype=bool)
+        self.nurse_available = np.ones(num_nurses, dtype=bool)
+        # Patient rows live in growable buffers; the patient_* attributes are views of the first
+        # len(patients) rows. _live_rows lists the rows still in the ICU (the only ones that change).
+        self._severity_buf = np.zeros(0, dtype=np.float64)
+        self._status_buf = np.zeros(0, dtype=np.int8)
+        self._type_buf = np.zeros(0, dtype=np.int8)
+        self._time_waiting_buf = np.zeros(0, dtype=np.int32)
+        self._treated_buf = np.zeros(0, dtype=bool)
+        # Tick-kernel inputs: the setup countdown for the current status, and nurse attending
+        self._setup_buf = np.zeros(0, dtype=np.int32)
+        self._attended_buf = np.zeros(0, dtype=bool)
+        self._bed_id_buf = np.zeros(0, dtype=np.int16)
+        self._vent_id_buf = np.zeros(0, dtype=np.int16)
+        self._synced_patients = 0
+        self._live_rows: List[int] = []
+        # First row still in the ICU: every row before it is cured or lost
+        self.live_start = 0
+        self.patient_severity = self._severity_buf
+        self.patient_status_id = self._status_buf
+        self.patient_type_id = self._type_buf
+        self.patient_time_waiting = self._time_waiting_buf
+        self.patient_treated = self._treated_buf
+        self.patient_bed_id = self._bed_id_buf
+        self.patient_vent_id = self._vent_id_buf
+        # Reverse indexes: patient index per bed id / vent id (-1 = no occupant)
+        self.bed_patient = np.full(num_beds, -1, dtype=np.int32)
+        self.vent_patient = np.full(num_ventilators, -1, dtype=np.int32)
+        # Total severity of patients still in the ICU, refreshed with the arrays
+        self._active_severity = 0.0
         
         self.reset()
          
     def _generate_next_arrival(self) -> int:
         """Generate next patient arrival time using Poisson distribution"""
+        # Inter-arrival gaps are drawn ARRIVAL_BATCH at a time
+        if self._arrival_idx >= len(self._arrival_gaps):
+            self._refill_arrival_gaps()
+        gap = self._arrival_gaps[self._arrival_idx]
+        self._arrival_idx += 1
         # Ensure at least 1-tick gap to guarantee arrivals within episodes
-        gap = int(np.random.exponential(1.0 / self.arrival_rate))
         return max(1, gap)
+
+    def _refill_arrival_gaps(self):
+        """Draw the next batch of integer inter-arrival gaps"""
+        gaps = self.rng.exponential(1.0 / self.arrival_rate, size=ARRIVAL_BATCH)
+        self._arrival_gaps = gaps.astype(np.int64).tolist()
+        self._arrival_idx = 0
     
-    def reset(self):
-        """Reset the simulation to initial state"""
+    def reset(self, seed: Optional[int] = None):
+        """Reset the simulation to initial state, reseeding the generator if a seed is given"""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
         self.patients = []
         self.next_patient_id = 0
+        self._n_waiting = 0
         self.tick = 0
         self.patients_saved = 0
         self.patients_lost = 0
         self.total_wait_time = 0
+        # Redraw the gap batch so a seeded reset() fully determines the episode
+        self._refill_arrival_gaps()
         self.next_arrival = self._generate_next_arrival()
         
         # Reset private resource counters
@@ -210,6 +350,10 @@ class SimICU:
         self._free_vents = self.num_ventilators
         self._free_step_down_beds = self.num_step_down_beds
         self._step_down_occupancies = []
+        # Patient rows are rewritten from scratch as the new cohort arrives
+        self._synced_patients = 0
+        self._live_rows = []
+        self.live_start = 0
 
         # Reset resources
         for nurse in self.nurses:
@@ -218,46 +362,183 @@ class SimICU:
             bed.available = True
         for ventilator in self.ventilators:
             ventilator.available = True
+        # An ascending list is already a valid heap
+        self._free_nurse_ids = list(range(self.num_nurses))
+        self._free_bed_ids = list(range(self.num_beds))
+        self._free_vent_ids = list(range(self.num_ventilators))
+        self._nurse_queued[:] = True
+        self._bed_queued[:] = True
+        self._vent_queued[:] = True
 
         # Seed a small initial cohort so evaluations never run empty
-        initial_patients = random.randint(1, 3)
+        initial_patients = int(self.rng.integers(1, 4))
         for _ in range(initial_patients):
-            self.add_patient(initial_severity=random.randint(45, 70))
+            self.add_patient(initial_severity=int(self.rng.integers(45, 71)))
+        self._sync_arrays()
+
+    def _sync_arrays(self):
+        """
+        Refresh the SoA shadow arrays from the resource/patient objects.
+        Called at the end of every public mutation (reset, assignments, ticks).
+        Patient ids are handed out sequentially and patients are never removed,
+        so patient arrays are indexed by patient id. Cured and lost patients never
+        change again, so only rows of patients still in the ICU are rewritten.
+        The severity, time-waiting and type columns are maintained directly by
+        add_patient and update_tick instead.
+        """
+        self.bed_available[:] = [b.available for b in self.beds]
+        self.vent_available[:] = [v.available for v in self.ventilators]
+        self.nurse_available[:] = [n.available for n in self.nurses]
+        patients = self.patients
+        n = len(patients)
+        if n > self._synced_patients:
+            self._reserve_patient_rows(n)
+            self._live_rows.extend(range(self._synced_patients, n))
+            self._synced_patients = n
+        live = self._live_rows
+        rows = [patients[i] for i in live]
+        # Severity, wait and type rows are written where they change (add_patient, update_tick);
+        # status and assignments also change through the assign_* methods, so they are re-read
+        self._status_buf[live] = [p.status.id for p in rows]
+        # A patient counts down a bed or a ventilator setup, never both
+        self._setup_buf[live] = [p.bed_setup_ticks if p.status is _IN_BED else p.vent_setup_ticks for p in rows]
+        self._attended_buf[live] = [p.assigned_nurse is not None for p in rows]
+        # Receiving care this tick: in a bed or on a vent, setup finished, nurse attending
+        live_idx = np.array(live, dtype=np.intp)
+        live_status = self._status_buf[live_idx]
+        self._treated_buf[live_idx] = (self._attended_buf[live_idx] & (self._setup_buf[live_idx] <= 0)
+                                       & ((live_status == IN_BED_ID) | (live_status == ON_VENTILATOR_ID)))
+        self._bed_id_buf[live] = [p.assigned_bed.id if p.assigned_bed is not None else -1 for p in rows]
+        self._vent_id_buf[live] = [p.assigned_ventilator.id if p.assigned_ventilator is not None else -1 for p in rows]
+        # Published views over the first n rows (fresh objects each sync, so callers can
+        # tell a re-sync happened by identity)
+        self.patient_severity = self._severity_buf[:n]
+        self.patient_status_id = self._status_buf[:n]
+        self.patient_type_id = self._type_buf[:n]
+        self.patient_time_waiting = self._time_waiting_buf[:n]
+        self.patient_treated = self._treated_buf[:n]
+        self.patient_bed_id = self._bed_id_buf[:n]
+        self.patient_vent_id = self._vent_id_buf[:n]
+        # Patients released from the ICU hold no bed or vent; drop them from the live set
+        live_idx = live_idx[ACTIVE_STATUS[live_status]]
+        self._live_rows = live_idx.tolist()
+        self.live_start = int(live_idx[0]) if live_idx.size else n
+        # Bed occupants include pending discharges still holding the bed; a vent only
+        # counts the patient actively ventilated on it
+        in_bed = live_idx[self._bed_id_buf[live_idx] >= 0]
+        self.bed_patient.fill(-1)
+        self.bed_patient[self._bed_id_buf[in_bed]] = in_bed
+        on_vent = live_idx[(self._vent_id_buf[live_idx] >= 0) & (self._status_buf[live_idx] == ON_VENTILATOR_ID)]
+        self.vent_patient.fill(-1)
+        self.vent_patient[self._vent_id_buf[on_vent]] = on_vent
+        self._active_severity = float(self._severity_buf[live_idx].sum())
+
+    def _reserve_patient_rows(self, n: int):
+        """Grow the patient row buffers (doubling) so they hold at least n rows."""
+        capacity = self._severity_buf.shape[0]
+        if n <= capacity:
+            return
+        capacity = max(n, 2 * capacity, 64)
+        for name in ('_severity_buf', '_status_buf', '_type_buf', '_time_waiting_buf',
+                     '_treated_buf', '_setup_buf', '_attended_buf', '_bed_id_buf', '_vent_id_buf'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:old.shape[0]] = old
+            setattr(self, name, new)
+
+    def get_patient(self, patient_id: int) -> Optional[Patient]:
+        """Patient with the given id, or None (ids are sequential, so the id is the list index)"""
+        if 0 <= patient_id < len(self.patients):
+            return self.patients[patient_id]
+        return None
+
+    def patient_in_bed(self, bed_id: int) -> Optional[Patient]:
+        """Patient occupying the given bed, or None"""
+        idx = self.bed_patient[bed_id]
+        return self.patients[idx] if idx >= 0 else None
+
+    def patient_on_ventilator(self, vent_id: int) -> Optional[Patient]:
+        """Patient being ventilated on the given ventilator, or None"""
+        idx = self.vent_patient[vent_id]
+        return self.patients[idx] if idx >= 0 else None
     
     def add_patient(self, initial_severity: Optional[int] = None) -> Patient:
         """Add a new patient to the simulation"""
         if initial_severity is None:
-            initial_severity = random.randint(40, 60)
+            initial_severity = int(self.rng.integers(40, 61))
         
-        patient = Patient(self.next_patient_id, initial_severity)
+        patient = Patient(self.next_patient_id, initial_severity,
+                          _PATIENT_TYPES[self.rng.integers(len(_PATIENT_TYPES))])
         self.next_patient_id += 1
+        # Patient id == row: its SoA row starts here (status is re-read at the next sync)
+        row = len(self.patients)
+        self._reserve_patient_rows(row + 1)
+        self._severity_buf[row] = patient.severity
+        self._time_waiting_buf[row] = 0
+        self._type_buf[row] = patient.patient_type.id
+        self._status_buf[row] = WAITING_ID
+        self._setup_buf[row] = 0
+        self._attended_buf[row] = False
         self.patients.append(patient)
+        self._n_waiting += 1
         return patient
     
+    @staticmethod
+    def _first_free(free_ids: List[int], queued: np.ndarray, resources: list):
+        """
+        Lowest-id available resource from a free-id heap, or None.
+        Claiming a resource only clears its available flag; its id is dropped here lazily
+        on the next lookup, and released resources are pushed back with _push_free.
+        """
+        while free_ids:
+            resource = resources[free_ids[0]]
+            if resource.available:
+                return resource
+            queued[heapq.heappop(free_ids)] = False
+        return None
+
+    @staticmethod
+    def _push_free(free_ids: List[int], queued: np.ndarray, resource_id: int):
+        """Return an id to its free-id heap unless it is still queued there."""
+        if not queued[resource_id]:
+            queued[resource_id] = True
+            heapq.heappush(free_ids, resource_id)
+
+    @classmethod
+    def _mark_free(cls, free_ids: List[int], queued: np.ndarray, resource):
+        """Make a resource available again and return its id to the free-id heap."""
+        resource.available = True
+        cls._push_free(free_ids, queued, resource.id)
+
     def get_available_nurse(self) -> Optional[Nurse]:
         """Get an available nurse"""
-        for nurse in self.nurses:
-            if nurse.available:
-                return nurse
-        return None
+        return self._first_free(self._free_nurse_ids, self._nurse_queued, self.nurses)
     
     def get_available_bed(self) -> Optional[Bed]:
         """Get an available bed"""
-        for bed in self.beds:
-            if bed.available:
-                return bed
-        return None
+        return self._first_free(self._free_bed_ids, self._bed_queued, self.beds)
     
     def get_available_ventilator(self) -> Optional[Ventilator]:
         """Get an available ventilator"""
-        for ventilator in self.ventilators:
-            if ventilator.available:
-                return ventilator
-        return None
+        return self._first_free(self._free_vent_ids, self._vent_queued, self.ventilators)
+
+    def _release_patient(self, patient: Patient):
+        """Release a patient's resources (objects, free-id heaps and counters) as they leave the ICU"""
+        had_bed = patient.assigned_bed is not None
+        had_nurse = patient.assigned_nurse is not None
+        had_vent = patient.assigned_ventilator is not None
+        for free_ids, queued, resource in ((self._free_nurse_ids, self._nurse_queued, patient.assigned_nurse),
+                                           (self._free_nurse_ids, self._nurse_queued, patient.assigned_nurse2),
+                                           (self._free_bed_ids, self._bed_queued, patient.assigned_bed),
+                                           (self._free_vent_ids, self._vent_queued, patient.assigned_ventilator)):
+            if resource is not None:
+                self._push_free(free_ids, queued, resource.id)
+        patient._release_resources()
+        self._release_patient_resources_counters(had_bed, had_nurse, had_vent)
     
     def assign_patient_to_bed(self, patient: Patient) -> bool:
         """Assign a patient to a bed with a nurse"""
-        if patient.status != PatientStatus.WAITING:
+        if patient.status != _WAITING:
             return False
         
         # Check if resources are available using counters
@@ -272,12 +553,14 @@ class SimICU:
             patient.assigned_nurse = nurse
             bed.available = False
             nurse.available = False
-            patient.status = PatientStatus.IN_BED
+            patient.status = _IN_BED
+            self._n_waiting -= 1
             # Setup delay before treatment starts
             patient.bed_setup_ticks = 3
             # Decrement counters
             self._free_beds -= 1
             self._free_nurses -= 1
+            self._sync_arrays()
             return True
         return False
     
@@ -286,7 +569,7 @@ class SimICU:
         Assign the given patient to a specific bed (and nurse).
         This is used by the UI when the player clicks a particular bed.
         """
-        if patient.status != PatientStatus.WAITING:
+        if patient.status != _WAITING:
             return False
         if bed is None or not bed.available:
             return False
@@ -303,16 +586,18 @@ class SimICU:
         patient.assigned_nurse = chosen_nurse
         bed.available = False
         chosen_nurse.available = False
-        patient.status = PatientStatus.IN_BED
+        patient.status = _IN_BED
+        self._n_waiting -= 1
         patient.bed_setup_ticks = 3
         # Decrement counters
         self._free_beds -= 1
         self._free_nurses -= 1
+        self._sync_arrays()
         return True
     
     def assign_patient_to_ventilator(self, patient: Patient) -> bool:
         """Assign a patient to a ventilator. Requires an attending nurse; no ICU bed reservation needed."""
-        if patient.status not in [PatientStatus.WAITING, PatientStatus.IN_BED, PatientStatus.PENDING_DISCHARGE]:
+        if patient.status not in _VENTILATABLE:
             return False
         
         # Check if ventilator is available using counter
@@ -329,7 +614,7 @@ class SimICU:
         if ventilator and nurse:
             # If upgrading from bed to ventilator, release the bed first (parity with UI)
             if patient.assigned_bed is not None:
-                patient.assigned_bed.available = True
+                self._mark_free(self._free_bed_ids, self._bed_queued, patient.assigned_bed)
                 patient.assigned_bed = None
                 self._free_beds += 1
             patient.assigned_ventilator = ventilator
@@ -340,20 +625,23 @@ class SimICU:
             second_nurse = self.get_available_nurse()
             if second_nurse is None:
                 # Roll back if second nurse not found (shouldn't happen due to counter check)
-                nurse.available = True
+                self._mark_free(self._free_nurse_ids, self._nurse_queued, nurse)
                 patient.assigned_ventilator = None
                 patient.assigned_nurse = None
-                ventilator.available = True
+                self._mark_free(self._free_vent_ids, self._vent_queued, ventilator)
                 return False
             second_nurse.available = False
             # Track second nurse so we can release availability later
-            self.patients[self.patients.index(patient)].assigned_nurse2 = second_nurse
-            patient.status = PatientStatus.ON_VENTILATOR
+            patient.assigned_nurse2 = second_nurse
+            if patient.status == _WAITING:
+                self._n_waiting -= 1
+            patient.status = _ON_VENTILATOR
             # Setup delay before ventilator effect starts
             patient.vent_setup_ticks = 5
             # Decrement resource counters (two nurses)
             self._free_vents -= 1
             self._free_nurses -= 2
+            self._sync_arrays()
             return True
         return False
 
@@ -362,7 +650,7 @@ class SimICU:
         Assign the given patient to a specific ventilator with an attending nurse.
         This ensures UI-clicked ventilator is honored.
         """
-        if patient.status not in [PatientStatus.WAITING, PatientStatus.IN_BED, PatientStatus.PENDING_DISCHARGE]:
+        if patient.status not in _VENTILATABLE:
             return False
         if ventilator is None or not ventilator.available:
             return False
@@ -374,11 +662,11 @@ class SimICU:
             return False
 
         # If upgrading from bed to ventilator, mark setup delay for reward shaping
-        if patient.status == PatientStatus.IN_BED:
+        if patient.status == _IN_BED:
             self.just_incurred_setup_delay = True
             # release bed immediately (nurse will switch to vent)
             if patient.assigned_bed:
-                patient.assigned_bed.available = True
+                self._mark_free(self._free_bed_ids, self._bed_queued, patient.assigned_bed)
                 patient.assigned_bed = None
                 self._free_beds += 1
 
@@ -390,17 +678,20 @@ class SimICU:
         second_nurse = self.get_available_nurse()
         if second_nurse is None:
             # Roll back
-            chosen_nurse.available = True
+            self._mark_free(self._free_nurse_ids, self._nurse_queued, chosen_nurse)
             patient.assigned_nurse = None
             patient.assigned_ventilator = None
-            ventilator.available = True
+            self._mark_free(self._free_vent_ids, self._vent_queued, ventilator)
             return False
         second_nurse.available = False
         patient.assigned_nurse2 = second_nurse
-        patient.status = PatientStatus.ON_VENTILATOR
+        if patient.status == _WAITING:
+            self._n_waiting -= 1
+        patient.status = _ON_VENTILATOR
         patient.vent_setup_ticks = 5
         self._free_vents -= 1
         self._free_nurses -= 2
+        self._sync_arrays()
         return True
     
     def perform_action(self, patient_id: int, action_type: int):
@@ -408,14 +699,8 @@ class SimICU:
         Perform an action on a patient
         action_type: 0 = assign to bed, 1 = assign to ventilator, 2 = do nothing
         """
-        # Find patient by ID
-        patient = None
-        for p in self.patients:
-            if p.id == patient_id:
-                patient = p
-                break
-        
-        if patient is None or patient.status in [PatientStatus.CURED, PatientStatus.LOST]:
+        patient = self.get_patient(patient_id)
+        if patient is None or patient.status in _DISCHARGED:
             return False
         
         if action_type == 0:  # Assign to bed
@@ -425,7 +710,7 @@ class SimICU:
         elif action_type == 1:  # Assign to ventilator
             if self._free_vents > 0:
                 # If upgrading from bed to ventilator, this incurs a setup delay (tracked for reward shaping)
-                if patient.status == PatientStatus.IN_BED:
+                if patient.status == _IN_BED:
                     self.just_incurred_setup_delay = True
                 return self.assign_patient_to_ventilator(patient)
             return False
@@ -457,55 +742,72 @@ class SimICU:
                     remaining.append(t)
             self._step_down_occupancies = remaining
 
-        # Update all patients
-        for patient in self.patients:
-            prev_status = patient.status
-            # Track which resources were assigned before update (for counter updates)
-            had_bed = patient.assigned_bed is not None
-            had_nurse = patient.assigned_nurse is not None
-            had_vent = patient.assigned_ventilator is not None
-            
-            patient.update()
-            
-            # Track state changes and release resources
-            if prev_status != PatientStatus.CURED and patient.status == PatientStatus.CURED:
-                self.just_saved_a_patient = True
-                self.patients_saved += 1
-                # Release resources when patient is cured (update counters)
-                self._release_patient_resources_counters(had_bed, had_nurse, had_vent)
-            elif prev_status != PatientStatus.LOST and patient.status == PatientStatus.LOST:
-                self.just_lost_a_patient = True
-                self.patients_lost += 1
-                # Release resources when patient is lost (update counters)
-                self._release_patient_resources_counters(had_bed, had_nurse, had_vent)
-            
-            # Track wait time
-            if patient.status == PatientStatus.WAITING:
-                self.total_wait_time += 1
+        # Update every patient still in the ICU in one kernel call over their columns
+        # (arrivals since the last sync are not in the live set yet)
+        patients = self.patients
+        live = self._live_rows + list(range(self._synced_patients, len(patients)))
+        if live:
+            rows = [patients[i] for i in live]
+            # Every kernel column comes straight from the SoA rows (up to date: every
+            # mutation ends in a sync and add_patient writes new rows)
+            idx = np.array(live, dtype=np.intp)
+            severity = self._severity_buf[idx]
+            status_id = self._status_buf[idx]
+            type_id = self._type_buf[idx]
+            time_waiting = self._time_waiting_buf[idx]
+            setup = self._setup_buf[idx]
+            attended = self._attended_buf[idx]
+            # Track wait time (only patients lost while waiting leave WAITING during a tick)
+            self._n_waiting = tick_patients(
+                severity, status_id, type_id, time_waiting, setup, attended,
+                WAIT_DECLINE, BED_GAIN, VENT_GAIN, CARDIAC_ID, CARDIAC_CRASH_SEVERITY, CARDIAC_CRASH_DECLINE,
+                WAITING_ID, IN_BED_ID, ON_VENTILATOR_ID, PENDING_DISCHARGE_ID, LOST_ID)
+            self.total_wait_time += self._n_waiting
+            self._severity_buf[idx] = severity
+            self._time_waiting_buf[idx] = time_waiting
+            for patient, sev, waited, ticks, status in zip(
+                    rows, severity.tolist(), time_waiting.tolist(), setup.tolist(), status_id.tolist()):
+                patient.severity = sev
+                # Only the column matching the pre-tick status can have changed
+                previous = patient.status
+                if previous is _WAITING:
+                    patient.time_waiting = waited
+                elif previous is _IN_BED:
+                    patient.bed_setup_ticks = ticks
+                elif previous is _ON_VENTILATOR:
+                    patient.vent_setup_ticks = ticks
+                if status == previous.id:
+                    continue
+                if status == LOST_ID:
+                    patient.status = _LOST
+                    self._release_patient(patient)
+                    self.just_lost_a_patient = True
+                    self.patients_lost += 1
+                else:
+                    # Reached full life: pending discharge keeps its ICU resources
+                    patient.status = _STATUS_BY_ID[status]
 
         # Move pending discharges if step-down bed available
         for patient in self.patients:
-            if patient.status == PatientStatus.PENDING_DISCHARGE and self._free_step_down_beds > 0:
+            if patient.status == _PENDING_DISCHARGE and self._free_step_down_beds > 0:
                 self._free_step_down_beds -= 1
                 # Occupy step-down for a long, variable time
-                occupancy_time = random.randint(20, 40)
+                occupancy_time = int(self.rng.integers(20, 41))
                 self._step_down_occupancies.append(occupancy_time)
                 # Free ICU resources now
-                had_bed = patient.assigned_bed is not None
-                had_nurse = patient.assigned_nurse is not None
-                had_vent = patient.assigned_ventilator is not None
-                patient._release_resources()
-                self._release_patient_resources_counters(had_bed, had_nurse, had_vent)
-                patient.status = PatientStatus.CURED
+                self._release_patient(patient)
+                patient.status = _CURED
                 self.patients_saved += 1
                 self.just_saved_a_patient = True
+
+        self._sync_arrays()
         
         # Remove cured/lost patients after a delay (optional - for now keep them for stats)
         # In practice, you might want to remove them after a few ticks
     
     def _release_patient_resources_counters(self, had_bed: bool, had_nurse: bool, had_vent: bool):
         """Update resource counters when a patient is cured or lost"""
-        # Note: Patient._release_resources() already handles setting resource objects to None
+        # Note: _release_patient() already handles setting resource objects to None
         # and setting their available flags. We just need to update the counters here.
         if had_bed:
             self._free_beds += 1
@@ -520,13 +822,18 @@ class SimICU:
     
     def get_waiting_patients(self) -> List[Patient]:
         """Get list of patients currently waiting"""
-        return [p for p in self.patients if p.status == PatientStatus.WAITING]
+        return [p for p in self.patients if p.status == _WAITING]
     
     @property
     def total_waiting_patients(self) -> int:
         """Get count of waiting patients"""
-        return len(self.get_waiting_patients())
+        return self._n_waiting
     
+    @property
+    def active_severity(self) -> float:
+        """Total severity of patients still in the ICU (not cured or lost), as of the last array sync"""
+        return self._active_severity
+
     @property
     def free_beds(self):
        return self._free_beds
@@ -541,7 +848,7 @@ class SimICU:
 
     @property
     def free_step_down_beds(self):
-       return getattr(self, "_free_step_down_beds", 0)
+       return self._free_step_down_beds
     
     def is_game_over(self, max_ticks: int = 1000) -> bool:
         """Check if game is over (e.g., time limit reached)"""
@@ -554,6 +861,7 @@ class SimICU:
             'patients_lost': self.patients_lost,
             'total_wait_time': self.total_wait_time,
             'tick': self.tick,
-            'active_patients': len([p for p in self.patients if p.status not in [PatientStatus.CURED, PatientStatus.LOST]])
+            # Rows still in the ICU as of the last sync (every mutation ends in one)
+            'active_patients': len(self._live_rows)
         }
 
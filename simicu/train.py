@@ -6,18 +6,20 @@ This script trains a reinforcement learning agent using Stable-Baselines3.
 from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import EvalCallback, CheckpointCallback
 from stable_baselines3.common.env_util import make_vec_env
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
 from sim_icu_env import SimICUEnv
 import os
 from stable_baselines3.common.monitor import Monitor
 
 
-def train_agent(total_timesteps=100000, save_path="models/sim_icu_ai_agent"):
+def train_agent(total_timesteps=100000, save_path="models/sim_icu_ai_agent", n_envs=4):
     """
     Train a PPO agent on the SimICU environment.
     
     Args:
         total_timesteps: Number of training steps
         save_path: Path to save the trained model
+        n_envs: Number of training environments, each stepped in its own worker process
     """
     print("=" * 60)
     print("SimICU - Training Reinforcement Learning Agent")
@@ -27,8 +29,11 @@ def train_agent(total_timesteps=100000, save_path="models/sim_icu_ai_agent"):
     os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else ".", exist_ok=True)
     
     print("\n1. Creating environment...")
-    # Vectorized training environment (4 parallel envs) with curriculum: easy first (arrival 0.05)
-    env = make_vec_env(lambda: Monitor(SimICUEnv(max_patients=10, max_ticks=300, render_mode=None, arrival_rate=0.05)), n_envs=4)
+    # The simulation is pure-Python CPU work, so training envs step in parallel worker processes
+    vec_env_cls = SubprocVecEnv if n_envs > 1 else DummyVecEnv
+    # Vectorized training environment with curriculum: easy first (arrival 0.05)
+    env = make_vec_env(lambda: Monitor(SimICUEnv(max_patients=10, max_ticks=300, render_mode=None, arrival_rate=0.05)),
+                       n_envs=n_envs, vec_env_cls=vec_env_cls)
  
     # Create evaluation environment (harder arrival rate to measure true performance)
     eval_env = make_vec_env(lambda: Monitor(SimICUEnv(max_patients=10, max_ticks=300, render_mode=None, arrival_rate=0.07)), n_envs=1)
@@ -90,21 +95,29 @@ def train_agent(total_timesteps=100000, save_path="models/sim_icu_ai_agent"):
     stage1 = max(80000, int(total_timesteps * 0.5))
     stage2 = max(0, total_timesteps - stage1)
 
-    model.learn(
-        total_timesteps=stage1,
-        callback=[eval_callback, checkpoint_callback],
-        progress_bar=use_progress_bar
-    )
-
-    if stage2 > 0:
-        # Switch to harder environment
-        env_hard = make_vec_env(lambda: Monitor(SimICUEnv(max_patients=10, max_ticks=300, render_mode=None, arrival_rate=0.08)), n_envs=4)
-        model.set_env(env_hard)
+    try:
         model.learn(
-            total_timesteps=stage2,
+            total_timesteps=stage1,
             callback=[eval_callback, checkpoint_callback],
             progress_bar=use_progress_bar
         )
+
+        if stage2 > 0:
+            # Switch to harder environment
+            env_hard = make_vec_env(lambda: Monitor(SimICUEnv(max_patients=10, max_ticks=300, render_mode=None, arrival_rate=0.08)),
+                                    n_envs=n_envs, vec_env_cls=vec_env_cls)
+            env.close()
+            env = env_hard
+            model.set_env(env)
+            model.learn(
+                total_timesteps=stage2,
+                callback=[eval_callback, checkpoint_callback],
+                progress_bar=use_progress_bar
+            )
+    finally:
+        # Shut down the worker processes even if training is interrupted
+        env.close()
+        eval_env.close()
     
     # Save the final model
     print(f"\n5. Saving trained model to {save_path}...")
@@ -176,8 +189,14 @@ if __name__ == "__main__":
         default="models/sim_icu_ai_agent",
         help="Path to save the trained model (default: models/sim_icu_ai_agent)"
     )
+    parser.add_argument(
+        "--n-envs",
+        type=int,
+        default=4,
+        help="Parallel training environments, one worker process each (default: 4)"
+    )
     
     args = parser.parse_args()
     
-    train_agent(total_timesteps=args.timesteps, save_path=args.save_path)
+    train_agent(total_timesteps=args.timesteps, save_path=args.save_path, n_envs=args.n_envs)
 
@@ -1,7 +1,12 @@
+import math
 import os
+import numpy as np
 import pygame
-from typing import Optional, Dict, Tuple, List
+from collections import deque
+from typing import Optional, Deque, Dict, Tuple, List
 from sim_icu_logic import SimICU, PatientStatus, PatientType
+from sim_icu_kernels import step_nurses
+from ui_shared import scaled_sprite
 
 GREEN = (50, 205, 50)
 BLUE = (30, 144, 255)
@@ -13,6 +18,11 @@ ORANGE = (255, 165, 0)
 RED = (220, 20, 60)
 DARK_GRAY = (64, 64, 64)
 
+TYPE_LETTERS = {PatientType.RESPIRATORY: "R", PatientType.CARDIAC: "C", PatientType.TRAUMA: "T"}
+# Life-bar color per whole severity point (0..100); severity is never negative,
+# so int() truncation lands in the same band as the float thresholds
+LIFE_COLORS = tuple(GREEN if s >= 70 else ORANGE if s >= 40 else RED for s in range(101))
+
 
 class SimICUView:
     """
@@ -38,6 +48,26 @@ class SimICUView:
         self.small_font = pygame.font.Font(None, 22)
         self.font = pygame.font.Font(None, 28)
         self.large_font = pygame.font.Font(None, 40)
+        self._text_cache: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+        # Section titles never change: render them once
+        self._t_waiting = self.font.render("WAITING ROOM", self.retro_antialias, WHITE)
+        self._t_beds = self.font.render("ICU BEDS", self.retro_antialias, WHITE)
+        self._t_vents = self.font.render("VENTILATORS", self.retro_antialias, WHITE)
+        self._t_nurses = self.font.render("NURSES", self.retro_antialias, WHITE)
+        # Type badges: letter on its yellow plate, one pre-composed Surface per patient type
+        self._badge_surfaces: Dict[PatientType, pygame.Surface] = {}
+        for ptype, letter in TYPE_LETTERS.items():
+            glyph = self.small_font.render(letter, self.retro_antialias, BLACK)
+            plate = pygame.Surface((glyph.get_width() + 6, glyph.get_height() + 6))
+            plate.fill(YELLOW)
+            plate.blit(glyph, (3, 3))
+            self._badge_surfaces[ptype] = plate.convert()
+        # Life bars: one full-width strip per color, blitted with an area sub-rect of the bar's width
+        self._bar_strips: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        for color in set(LIFE_COLORS):
+            strip = pygame.Surface((140, 10))
+            strip.fill(color)
+            self._bar_strips[color] = strip.convert()
 
         # Sprites and caches
         base_dir = os.path.dirname(os.path.dirname(__file__))
@@ -51,16 +81,19 @@ class SimICUView:
         self._load_sprite("floor_bg_raw", os.path.join(sprites_dir, "hospital_floor.png"), convert=False)
         self._load_sprite("nurse_sprite_raw", os.path.join(sprites_dir, "nurse.png"))
 
-        self._patient_sprite_cache: Dict = {}
-        self._patient_in_bed_sprite_cache: Dict = {}
-        self._bed_sprite_cache: Dict = {}
-        self._vent_bed_cache: Dict = {}
-        self._vent_patient_cache: Dict = {}
-        self._waiting_bg_cache: Dict = {}
-        self._floor_bg_cache: Dict = {}
+        self._patient_sprite_cache: Dict = {}  # (w, h, mode) -> (Surface, dx, dy), pre-filled in _build_sprite_sizes
+        self._scale_cache: Dict = {}  # scaled_sprite() memo for off-size art
         self.patient_in_bed_scale = 1.2
         self.waiting_sprite_scale_w = 1.3
         self.waiting_sprite_scale_h = 1.6
+        self._build_tile_sprites()
+        # Backgrounds only ever draw at one size each: scale once into plain attributes
+        self._floor_bg = None
+        if self.floor_bg_raw is not None:
+            self._floor_bg = pygame.transform.smoothscale(self.floor_bg_raw, (self.width, self.height)).convert()
+        self._waiting_bg = None
+        if self.waiting_bg_raw is not None:
+            self._waiting_bg = pygame.transform.smoothscale(self.waiting_bg_raw, (800, self.waiting_room_height)).convert_alpha()
 
         # Animations/state
         self.selected_patient = None
@@ -68,16 +101,41 @@ class SimICUView:
         self.patients_waiting_at_target: Dict[int, Tuple[float, float]] = {}
         self.nurse_size = 64
         self.nurse_speed = 28.0
-        self.nurse_positions: Dict = {}
-        self.nurse_paths: Dict = {}
-        self.nurse_stations: Dict = {}
-        self.pending_assignments: List[Dict] = []
-        self.bed_positions: Dict = {}
-        self.vent_positions: Dict = {}
+        # Nurse motion state, one row per nurse.id (SimICU numbers nurses 0..n-1; sized by _build_layout)
+        self._nurse_pos = np.zeros((0, 2), dtype=np.float32)
+        self._nurse_target = np.zeros_like(self._nurse_pos)
+        self._nurse_waypoint = np.zeros_like(self._nurse_pos)
+        self._nurse_placed = np.zeros(0, dtype=bool)
+        self.nurse_paths: List[List[Tuple[float, float]]] = []
+        self.nurse_stations: List[Tuple[int, int]] = []
+        self.pending_assignments: Deque[Dict] = deque()
+        # Tile rects for nurse targeting, indexed by bed.id / vent.id
+        self.bed_positions: List[Tuple[int, int, int, int]] = []
+        self.vent_positions: List[Tuple[int, int, int, int]] = []
+        self.drawn_rects: List[pygame.Rect] = []
+        # Set by update_animations(): whether anything moved, i.e. whether the scene needs redrawing
+        self.animating = False
+        # Tile layout and nurse stations (rebuilt by _build_layout when resource counts change)
+        self._layout_counts = None
+        self._bed_layout: List[Tuple[int, int]] = []   # (x, y) per bed
+        self._vent_layout: List[Tuple[int, int]] = []  # (x, y) per vent
+        self._build_layout()
 
         # Deferral for parity: only commit engine action on nurse arrival
         self.deferred_action = None
         self.ready_to_apply_deferred = False
+        self._build_sprite_sizes()
+
+    def _text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Rendered text, cached by (font, text, color); labels like "#12" repeat every frame."""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= 1024:
+                # Patient ids keep growing over a long session: start over rather than grow forever
+                self._text_cache.clear()
+            surf = self._text_cache[key] = font.render(text, self.retro_antialias, color)
+        return surf
 
     def _load_sprite(self, attr: str, path: str, convert: bool = True):
         try:
@@ -87,12 +145,93 @@ class SimICUView:
         except Exception:
             setattr(self, attr, None)
 
+    def _tile_sprite(self, raw, size, fallback, border, inset=0):
+        """Scaled copy of raw (or a flat fallback fill) with the 120x120 status border baked in."""
+        if raw is not None:
+            surf = pygame.transform.smoothscale(raw, size)
+        else:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill(fallback)
+        pygame.draw.rect(surf, border, (inset, inset, 120, 120), 2)
+        return surf.convert_alpha()
+
+    def _build_tile_sprites(self):
+        """Pre-compose bed/vent tiles for both states so drawing a tile is a single blit."""
+        self._bed_sprite_avail = self._tile_sprite(self.bed_sprite_raw, (120, 120), LIGHT_GRAY, GREEN)
+        # Occupied beds show the (larger, centered) patient-in-bed sprite; without it a plain 120x120 tile
+        if self.patient_in_bed_sprite_raw is not None:
+            sw = int(120 * self.patient_in_bed_scale)
+            sh = int(120 * self.patient_in_bed_scale)
+            self._bed_occupied_offset = ((120 - sw) // 2, (120 - sh) // 2)
+            self._bed_sprite_occupied = self._tile_sprite(self.patient_in_bed_sprite_raw, (sw, sh), DARK_GRAY, RED,
+                                                          inset=-self._bed_occupied_offset[0])
+        else:
+            self._bed_occupied_offset = (0, 0)
+            self._bed_sprite_occupied = self._tile_sprite(None, (120, 120), DARK_GRAY, RED)
+        self._vent_sprite_avail = self._tile_sprite(self.vent_bed_raw, (120, 120), LIGHT_GRAY, GREEN)
+        self._vent_sprite_occupied = self._tile_sprite(self.vent_patient_raw, (120, 120), DARK_GRAY, RED)
+
+    def _patient_sprite(self, width: int, height: int, mode: str = "fit"):
+        """
+        Patient sprite for a width x height slot as (Surface, dx, dy) centering offsets.
+        "fit" keeps the aspect ratio inside the slot; "waiting" stretches it by the waiting-room factors.
+        """
+        key = (width, height, mode)
+        entry = self._patient_sprite_cache.get(key)
+        if entry is None:
+            raw = self.patient_sprite_raw
+            if mode == "waiting":
+                tw = int(width * self.waiting_sprite_scale_w)
+                th = int(height * self.waiting_sprite_scale_h)
+            else:
+                src_w, src_h = raw.get_size()
+                scale = min(width / src_w, height / src_h)
+                tw, th = max(1, int(src_w * scale)), max(1, int(src_h * scale))
+            # smoothscale: the source art is ~1k px, nearest-neighbour would alias badly at these sizes
+            sprite = pygame.transform.smoothscale(raw, (tw, th)).convert_alpha()
+            entry = self._patient_sprite_cache[key] = (sprite, (width - tw) // 2, (height - th) // 2)
+        return entry
+
+    def _build_layout(self):
+        """
+        Precompute bed/vent tile positions and nurse stations. The grid only depends on
+        the resource counts, so draw(), the click handlers and nurse targeting share it.
+        """
+        game = self.game
+        counts = (len(game.beds), len(game.ventilators), len(game.nurses))
+        if counts == self._layout_counts:
+            return
+        self._layout_counts = counts
+        self._bed_layout = [(200 + (i % 4) * 150, self.bed_area_y + 50 + (i // 4) * 120) for i in range(counts[0])]
+        self._vent_layout = [(50, self.bed_area_y + 50 + i * 120) for i in range(counts[1])]
+        self.bed_positions = [(x, y, 120, 120) for x, y in self._bed_layout]
+        self.vent_positions = [(x, y, 120, 120) for x, y in self._vent_layout]
+        self.nurse_stations = [(850, self.bed_area_y + 50 + i * 56) for i in range(counts[2])]
+        # Nurses start out (unplaced) at their stations
+        self._nurse_pos = np.array(self.nurse_stations, dtype=np.float32).reshape(-1, 2)
+        self._nurse_target = self._nurse_pos.copy()
+        self._nurse_waypoint = self._nurse_pos.copy()
+        self._nurse_placed = np.zeros(counts[2], dtype=bool)
+        self.nurse_paths = [[] for _ in range(counts[2])]
+
+    def _build_sprite_sizes(self):
+        """Scale patient and nurse art once, up front, for every size draw() uses."""
+        if self.patient_sprite_raw is not None:
+            self._patient_sprite(140, 110)           # walking to a bed/vent
+            self._patient_sprite(100, 80)            # standing at the target
+            self._patient_sprite(100, 60)            # overlay when there is no in-bed art
+            self._patient_sprite(100, 80, "waiting")  # waiting room
+        self._nurse_sprite = None
+        if self.nurse_sprite_raw is not None:
+            size = (self.nurse_size, self.nurse_size)
+            self._nurse_sprite = pygame.transform.smoothscale(self.nurse_sprite_raw, size).convert_alpha()
+
     # Controller API (mouse/AI use these)
     def select_patient(self, patient_id: int):
-        for p in self.game.patients:
-            if p.id == patient_id and p.status == PatientStatus.WAITING:
-                self.selected_patient = p
-                return True
+        p = self.game.get_patient(patient_id)
+        if p is not None and p.status == PatientStatus.WAITING:
+            self.selected_patient = p
+            return True
         return False
 
     def click_bed(self, bed_index: int):
@@ -102,8 +241,8 @@ class SimICUView:
         if not self.selected_patient or not bed.available:
             return False
         # compute target pos and queue movement + nurse run (engine action is deferred)
-        bed_x = 200 + (bed_index % 4) * 150
-        bed_y = self.bed_area_y + 50 + (bed_index // 4) * 120
+        self._build_layout()
+        bed_x, bed_y = self._bed_layout[bed_index]
         # start movement if no other patient moving
         if not self.patient_moves:
             start_x, start_y = self._waiting_slot_of(self.selected_patient)
@@ -125,8 +264,8 @@ class SimICUView:
         vent = self.game.ventilators[vent_index]
         if not self.selected_patient or not vent.available:
             return False
-        vent_x = 50
-        vent_y = self.bed_area_y + 50 + vent_index * 120
+        self._build_layout()
+        vent_x, vent_y = self._vent_layout[vent_index]
         if not self.patient_moves:
             start_x, start_y = self._waiting_slot_of(self.selected_patient)
             self.patient_moves[self.selected_patient.id] = {'x': float(start_x), 'y': float(start_y),
@@ -140,17 +279,15 @@ class SimICUView:
         return False
 
     def _nearest_available_nurse(self, tx: int, ty: int):
-        avail = [n for n in self.game.nurses if n.available]
-        if not avail:
+        self._build_layout()
+        avail = np.flatnonzero(self.game.nurse_available)
+        if not avail.size:
             return None
-        for n in avail:
-            if n not in self.nurse_positions:
-                self.nurse_positions[n] = self.nurse_stations.get(n, (850, self.bed_area_y + 50))
-        def dist2(n):
-            nx, ny = self.nurse_positions.get(n, (tx, ty))
-            dx = nx - tx; dy = ny - ty
-            return dx*dx + dy*dy
-        return min(avail, key=dist2)
+        # Unplaced nurses stand at their station, which is where _nurse_pos starts them
+        self._nurse_placed[avail] = True
+        d = self._nurse_pos[avail] - (tx, ty)
+        # argmin keeps the first of equally near nurses, like min() over the roster did
+        return self.game.nurses[avail[np.argmin(np.einsum('ij,ij->i', d, d))]]
 
     def _waiting_slot_of(self, patient):
         waiting = self.game.get_waiting_patients()
@@ -163,13 +300,14 @@ class SimICUView:
     # Animation and drawing
     def update_animations(self):
         # update nurse positions and complete tasks
-        self._update_nurse_positions()
+        self.animating = self._update_nurse_positions()
         # update patient movement and placeholders
         if self.patient_moves:
+            self.animating = True
             finished = []
             for pid, mv in list(self.patient_moves.items()):
                 dx = mv['tx'] - mv['x']; dy = mv['ty'] - mv['y']
-                dist = max(1e-6, (dx*dx + dy*dy) ** 0.5)
+                dist = max(1e-6, math.hypot(dx, dy))
                 step = min(mv['speed'], dist)
                 mv['x'] += (dx / dist) * step; mv['y'] += (dy / dist) * step
                 if dist <= mv['speed'] + 0.1:
@@ -178,197 +316,161 @@ class SimICUView:
             for pid in finished:
                 self.patient_moves.pop(pid, None)
 
-    def draw(self):
+    def draw(self, background: bool = True):
+        """
+        Draw the scene. Every region touched is recorded in self.drawn_rects so
+        callers can restore the background there and push only those rects to
+        the display. With background=False the caller has already prepared the
+        floor under the scene.
+        """
+        rects: List[pygame.Rect] = []
+        self._build_layout()
         # background
-        if getattr(self, "floor_bg_raw", None):
-            key_bg = (self.width, self.height)
-            if key_bg not in self._floor_bg_cache:
-                self._floor_bg_cache[key_bg] = pygame.transform.smoothscale(self.floor_bg_raw, (self.width, self.height))
-            self.screen.blit(self._floor_bg_cache[key_bg], (0, 0))
-        else:
-            self.screen.fill(BLACK)
+        if background:
+            if self._floor_bg is not None:
+                self.screen.blit(self._floor_bg, (0, 0))
+            else:
+                self.screen.fill(BLACK)
         # waiting room
-        title = self.font.render("WAITING ROOM", self.retro_antialias, WHITE)
-        self.screen.blit(title, (50, 20))
+        rects.append(self.screen.blit(self._t_waiting, (50, 20)))
         wr_x, wr_y, wr_w, wr_h = 50, self.waiting_room_y, 800, self.waiting_room_height
-        if getattr(self, "waiting_bg_raw", None):
-            key = (wr_w, wr_h)
-            if key not in self._waiting_bg_cache:
-                self._waiting_bg_cache[key] = pygame.transform.smoothscale(self.waiting_bg_raw, (wr_w, wr_h))
-            self.screen.blit(self._waiting_bg_cache[key], (wr_x, wr_y))
+        if self._waiting_bg is not None:
+            self.screen.blit(self._waiting_bg, (wr_x, wr_y))
         else:
             pygame.draw.rect(self.screen, DARK_GRAY, (wr_x, wr_y, wr_w, wr_h))
         pygame.draw.rect(self.screen, WHITE, (wr_x, wr_y, wr_w, wr_h), 2)
+        rects.append(pygame.Rect(wr_x, wr_y, wr_w, wr_h))
 
         # waiting patients (exclude moving)
         moving_ids = set(self.patient_moves.keys())
         waiting_patients = [p for p in self.game.get_waiting_patients() if p.id not in moving_ids]
         for i, patient in enumerate(waiting_patients[:6]):
-            self._draw_patient(patient, 50 + i * 120, self.waiting_room_y + 20, minimal=True)
+            rects.append(self._draw_patient(patient, 50 + i * 120, self.waiting_room_y + 20, minimal=True))
 
         # beds
-        bed_title = self.font.render("ICU BEDS", self.retro_antialias, WHITE)
-        self.screen.blit(bed_title, (200, self.bed_area_y - 30))
-        for i, bed in enumerate(self.game.beds):
-            bed_x = 200 + (i % 4) * 150
-            bed_y = self.bed_area_y + 50 + (i // 4) * 120
-            self.bed_positions[bed] = (bed_x, bed_y, 120, 120)
-            self._draw_bed(bed, bed_x, bed_y)
+        rects.append(self.screen.blit(self._t_beds, (200, self.bed_area_y - 30)))
+        game = self.game
+        beds = game.beds
+        bed_overlay = self.patient_in_bed_sprite_raw is None
+        for i, (bed, (bed_x, bed_y)) in enumerate(zip(beds, self._bed_layout)):
+            rects.append(self._draw_bed(bed, bed_x, bed_y))
             # fallback overlay if no patient-in-bed sprite
-            if not getattr(self, "patient_in_bed_sprite_raw", None):
-                for p in self.game.patients:
-                    if p.assigned_bed == bed and (p.id not in self.patient_moves):
-                        self._draw_patient(p, bed_x + 10, bed_y - 20, 100, 60)
+            if bed_overlay:
+                p = game.patient_in_bed(i)
+                if p is not None and p.id not in self.patient_moves:
+                    rects.append(self._draw_patient(p, bed_x + 10, bed_y - 20, 100, 60))
 
         # ventilators
-        vent_title = self.font.render("VENTILATORS", self.retro_antialias, WHITE)
-        self.screen.blit(vent_title, (50, self.bed_area_y - 30))
-        for i, vent in enumerate(self.game.ventilators):
-            vent_x = 50
-            vent_y = self.bed_area_y + 50 + i * 120
-            self.vent_positions[vent] = (vent_x, vent_y, 120, 120)
-            self._draw_vent(vent, vent_x, vent_y)
-            if not getattr(self, "vent_patient_raw", None):
-                for p in self.game.patients:
-                    if p.assigned_ventilator == vent and (p.id not in self.patient_moves):
-                        self._draw_patient(p, vent_x + 10, vent_y - 20, 100, 60)
+        rects.append(self.screen.blit(self._t_vents, (50, self.bed_area_y - 30)))
+        vents = game.ventilators
+        vent_overlay = self.vent_patient_raw is None
+        for i, (vent, (vent_x, vent_y)) in enumerate(zip(vents, self._vent_layout)):
+            rects.append(self._draw_vent(vent, vent_x, vent_y))
+            if vent_overlay:
+                p = game.patient_on_ventilator(i)
+                if p is not None and p.id not in self.patient_moves:
+                    rects.append(self._draw_patient(p, vent_x + 10, vent_y - 20, 100, 60))
 
         # moving patients
+        patients = game.patients
         for pid, mv in self.patient_moves.items():
-            p = next((q for q in self.game.patients if q.id == pid), None)
+            p = patients[pid] if pid < len(patients) else None
             if p:
-                self._draw_patient(p, int(mv['x']), int(mv['y']), 140, 110, bar_only=True)
+                rects.append(self._draw_patient(p, int(mv['x']), int(mv['y']), 140, 110, bar_only=True))
 
         # standing-at-target placeholders
         for pid, (px, py) in list(self.patients_waiting_at_target.items()):
-            p = next((q for q in self.game.patients if q.id == pid), None)
+            p = patients[pid] if pid < len(patients) else None
             if p and p.status == PatientStatus.WAITING:
-                self._draw_patient(p, int(px), int(py), 100, 80, bar_only=True)
+                rects.append(self._draw_patient(p, int(px), int(py), 100, 80, bar_only=True))
 
         # nurses
-        nurse_title = self.font.render("NURSES", self.retro_antialias, WHITE)
-        self.screen.blit(nurse_title, (850, self.bed_area_y - 30))
-        for i, nurse in enumerate(self.game.nurses):
-            self.nurse_stations[nurse] = (850, self.bed_area_y + 50 + i * 56)
-        for nurse in self.game.nurses:
-            nx, ny = self.nurse_positions.get(nurse, self.nurse_stations[nurse])
-            self._draw_nurse(nurse, int(nx), int(ny), self.nurse_size)
+        rects.append(self.screen.blit(self._t_nurses, (850, self.bed_area_y - 30)))
+        positions = self._nurse_pos.tolist()
+        if self._nurse_sprite is not None:
+            # Every nurse is the same sprite: one batched blit for the lot
+            sprite = self._nurse_sprite
+            rects.extend(self.screen.blits([(sprite, (int(nx), int(ny))) for nx, ny in positions]))
+        else:
+            for nurse, (nx, ny) in zip(self.game.nurses, positions):
+                rects.append(self._draw_nurse(nurse, int(nx), int(ny), self.nurse_size))
+        self.drawn_rects = rects
 
     # internals
-    def _draw_bed(self, bed, x, y):
+    def _draw_bed(self, bed, x, y) -> pygame.Rect:
         # available -> bed sprite; occupied -> patient-in-bed sprite + overlays drawn in Retro style
-        if bed.available:
-            if getattr(self, "bed_sprite_raw", None):
-                key = (120, 120)
-                if key not in self._bed_sprite_cache:
-                    self._bed_sprite_cache[key] = pygame.transform.smoothscale(self.bed_sprite_raw, (120, 120))
-                self.screen.blit(self._bed_sprite_cache[key], (x, y))
-            else:
-                pygame.draw.rect(self.screen, LIGHT_GRAY, (x, y, 120, 120))
-            pygame.draw.rect(self.screen, GREEN, (x, y, 120, 120), 2)
+        touched = pygame.Rect(x, y, 120, 120)
+        game = self.game
+        if game.bed_available[bed.id]:
+            self.screen.blit(self._bed_sprite_avail, (x, y))
         else:
-            if getattr(self, "patient_in_bed_sprite_raw", None):
-                sw = int(120 * self.patient_in_bed_scale)
-                sh = int(120 * self.patient_in_bed_scale)
-                key = (sw, sh)
-                if key not in self._patient_in_bed_sprite_cache:
-                    self._patient_in_bed_sprite_cache[key] = pygame.transform.smoothscale(self.patient_in_bed_sprite_raw, (sw, sh))
-                self.screen.blit(self._patient_in_bed_sprite_cache[key], (x + (120 - sw)//2, y + (120 - sh)//2))
-            else:
-                pygame.draw.rect(self.screen, DARK_GRAY, (x, y, 120, 120))
-            pygame.draw.rect(self.screen, RED, (x, y, 120, 120), 2)
-            try:
-                patient = next(p for p in self.game.patients if p.assigned_bed == bed)
-                bar_width = int((patient.severity / 100.0) * 120)
-                bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-                pygame.draw.rect(self.screen, bar_color, (x, y + 120 - 10, bar_width, 10))
-                id_text = self.small_font.render(f"#{patient.id}", self.retro_antialias, WHITE)
-                self.screen.blit(id_text, (x + 4, y + 4))
-                t_letter = "R" if patient.patient_type == PatientType.RESPIRATORY else "C" if patient.patient_type == PatientType.CARDIAC else "T"
-                badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
-                bw, bh = badge.get_size()
-                pygame.draw.rect(self.screen, YELLOW, (x + 120 - bw - 8, y + 2, bw + 6, bh + 6))
-                self.screen.blit(badge, (x + 120 - bw - 5, y + 5))
-            except StopIteration:
-                pass
-
-    def _draw_vent(self, vent, x, y):
-        occupied = not vent.available
+            ox, oy = self._bed_occupied_offset
+            # Tile, bar, id and badge go to the screen in one blits() call
+            blits = [(self._bed_sprite_occupied, (x + ox, y + oy))]
+            pidx = game.bed_patient[bed.id]
+            if pidx >= 0:
+                patient = game.patients[pidx]
+                severity = game.patient_severity[pidx]
+                bar_width = int((severity / 100.0) * 120)
+                strip = self._bar_strips[LIFE_COLORS[min(100, int(severity))]]
+                badge = self._badge_surfaces[patient.patient_type]
+                blits += [
+                    (strip, (x, y + 120 - 10), (0, 0, bar_width, 10)),
+                    (self._text(self.small_font, f"#{patient.id}", WHITE), (x + 4, y + 4)),
+                    (badge, (x + 120 - badge.get_width() - 2, y + 2)),
+                ]
+            touched.union_ip(self.screen.blits(blits)[0])
+        return touched
+
+    def _draw_vent(self, vent, x, y) -> pygame.Rect:
+        game = self.game
+        occupied = not game.vent_available[vent.id]
         if not occupied:
-            if getattr(self, "vent_bed_raw", None):
-                key = (120, 120)
-                if key not in self._vent_bed_cache:
-                    self._vent_bed_cache[key] = pygame.transform.smoothscale(self.vent_bed_raw, (120, 120))
-                self.screen.blit(self._vent_bed_cache[key], (x, y))
-            else:
-                pygame.draw.rect(self.screen, LIGHT_GRAY, (x, y, 120, 120))
-            pygame.draw.rect(self.screen, GREEN, (x, y, 120, 120), 2)
+            self.screen.blit(self._vent_sprite_avail, (x, y))
         else:
-            if getattr(self, "vent_patient_raw", None):
-                key = (120, 120)
-                if key not in self._vent_patient_cache:
-                    self._vent_patient_cache[key] = pygame.transform.smoothscale(self.vent_patient_raw, (120, 120))
-                self.screen.blit(self._vent_patient_cache[key], (x, y))
-            else:
-                pygame.draw.rect(self.screen, DARK_GRAY, (x, y, 120, 120))
-            pygame.draw.rect(self.screen, RED, (x, y, 120, 120), 2)
-            try:
-                patient = next(p for p in self.game.patients if p.assigned_ventilator == vent and p.status == PatientStatus.ON_VENTILATOR)
-                bar_width = int((patient.severity / 100.0) * 120)
-                bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-                pygame.draw.rect(self.screen, bar_color, (x, y + 120 - 10, bar_width, 10))
-                t_letter = "R" if patient.patient_type == PatientType.RESPIRATORY else "C" if patient.patient_type == PatientType.CARDIAC else "T"
-                badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
-                bw, bh = badge.get_size()
-                pygame.draw.rect(self.screen, YELLOW, (x + 120 - bw - 8, y + 2, bw + 6, bh + 6))
-                self.screen.blit(badge, (x + 120 - bw - 5, y + 5))
-            except StopIteration:
-                pass
-
-    def _draw_patient(self, patient, x, y, width=100, height=80, minimal=False, bar_only=False):
+            blits = [(self._vent_sprite_occupied, (x, y))]
+            pidx = game.vent_patient[vent.id]
+            if pidx >= 0:
+                patient = game.patients[pidx]
+                severity = game.patient_severity[pidx]
+                bar_width = int((severity / 100.0) * 120)
+                strip = self._bar_strips[LIFE_COLORS[min(100, int(severity))]]
+                badge = self._badge_surfaces[patient.patient_type]
+                blits += [
+                    (strip, (x, y + 120 - 10), (0, 0, bar_width, 10)),
+                    (badge, (x + 120 - badge.get_width() - 2, y + 2)),
+                ]
+            self.screen.blits(blits, doreturn=0)
+        return pygame.Rect(x, y, 120, 120)
+
+    def _blit_life_bar(self, severity, x, y, width):
+        """Life bar as a sub-rect of the pre-filled strip for its color (width = severity% of width)."""
+        strip = self._bar_strips[LIFE_COLORS[min(100, int(severity))]]
+        self.screen.blit(strip, (x, y), (0, 0, int((severity / 100.0) * width), 10))
+
+    def _draw_patient(self, patient, x, y, width=100, height=80, minimal=False, bar_only=False) -> pygame.Rect:
+        touched = pygame.Rect(x, y, width, height)
         if bar_only:
-            if getattr(self, "patient_sprite_raw", None):
-                key = (width, height, "bar_only")
-                if key not in self._patient_sprite_cache:
-                    src_w, src_h = self.patient_sprite_raw.get_size()
-                    scale = min(width / src_w, height / src_h)
-                    scaled = (max(1, int(src_w * scale)), max(1, int(src_h * scale)))
-                    self._patient_sprite_cache[key] = pygame.transform.smoothscale(self.patient_sprite_raw, scaled)
-                sprite = self._patient_sprite_cache[key]
-                self.screen.blit(sprite, (x + (width - sprite.get_width()) // 2, y + (height - sprite.get_height()) // 2))
-            bar_width = int((patient.severity / 100.0) * width)
-            bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-            pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
-            return
+            if self.patient_sprite_raw is not None:
+                sprite, dx, dy = self._patient_sprite(width, height)
+                self.screen.blit(sprite, (x + dx, y + dy))
+            self._blit_life_bar(patient.severity, x, y + height - 10, width)
+            return touched
         if minimal:
-            if getattr(self, "patient_sprite_raw", None):
-                tw = int(width * self.waiting_sprite_scale_w)
-                th = int(height * self.waiting_sprite_scale_h)
-                key = (tw, th, "waiting")
-                if key not in self._patient_sprite_cache:
-                    self._patient_sprite_cache[key] = pygame.transform.smoothscale(self.patient_sprite_raw, (tw, th))
-                self.screen.blit(self._patient_sprite_cache[key], (x + (width - tw) // 2, y + (height - th) // 2))
-            bar_width = int((patient.severity / 100.0) * width)
-            bar_color = GREEN if patient.severity >= 70 else ORANGE if patient.severity >= 40 else RED
-            pygame.draw.rect(self.screen, bar_color, (x, y + height - 10, bar_width, 10))
+            if self.patient_sprite_raw is not None:
+                sprite, dx, dy = self._patient_sprite(width, height, "waiting")
+                touched.union_ip(self.screen.blit(sprite, (x + dx, y + dy)))
+            self._blit_life_bar(patient.severity, x, y + height - 10, width)
             # type badge
-            t_letter = "R" if patient.patient_type == PatientType.RESPIRATORY else "C" if patient.patient_type == PatientType.CARDIAC else "T"
-            badge = self.small_font.render(t_letter, self.retro_antialias, BLACK)
-            bw, bh = badge.get_size()
-            pygame.draw.rect(self.screen, YELLOW, (x + width - bw - 8, y + 2, bw + 6, bh + 6))
-            self.screen.blit(badge, (x + width - bw - 5, y + 5))
-            return
+            badge = self._badge_surfaces[patient.patient_type]
+            self.screen.blit(badge, (x + width - badge.get_width() - 2, y + 2))
+            return touched
         # full sprite fallback
-        if getattr(self, "patient_sprite_raw", None):
-            key = (width, height)
-            if key not in self._patient_sprite_cache:
-                src_w, src_h = self.patient_sprite_raw.get_size()
-                scale = min(width / src_w, height / src_h)
-                scaled = (max(1, int(src_w * scale)), max(1, int(src_h * scale)))
-                self._patient_sprite_cache[key] = pygame.transform.smoothscale(self.patient_sprite_raw, scaled)
-            sprite = self._patient_sprite_cache[key]
-            self.screen.blit(sprite, (x + (width - sprite.get_width()) // 2, y + (height - sprite.get_height()) // 2))
+        if self.patient_sprite_raw is not None:
+            sprite, dx, dy = self._patient_sprite(width, height)
+            self.screen.blit(sprite, (x + dx, y + dy))
             pygame.draw.rect(self.screen, BLACK, (x, y, width, height), 2)
+        return touched
 
     # Nurse pathing
     def _row_corridor_y(self):
@@ -388,100 +490,109 @@ class SimICUView:
             path.append((tx, ty))
         return path
 
-    def _get_nurse_target(self, nurse, size=None):
-        for task in self.pending_assignments:
-            if task.get('nurse') == nurse:
-                if 'bed' in task and task['bed'] in self.bed_positions:
-                    bx, by, bw, bh = self.bed_positions[task['bed']]
-                    return bx + bw - (size or self.nurse_size), by
-                if 'vent' in task and task['vent'] in self.vent_positions:
-                    vx, vy, vw, vh = self.vent_positions[task['vent']]
-                    return vx + vw - (size or self.nurse_size), vy
-        return self.nurse_stations.get(nurse, (850, self.bed_area_y + 50))
-
-    def _update_nurse_positions(self, size=None):
+    def _get_nurse_target(self, nurse, pending_by_nurse, size=None):
+        task = pending_by_nurse.get(nurse)
+        if task is not None:
+            if 'bed' in task:
+                bx, by, bw, bh = self.bed_positions[task['bed'].id]
+                return bx + bw - (size or self.nurse_size), by
+            if 'vent' in task:
+                vx, vy, vw, vh = self.vent_positions[task['vent'].id]
+                return vx + vw - (size or self.nurse_size), vy
+        return self.nurse_stations[nurse.id]
+
+    def _update_nurse_positions(self, size=None) -> bool:
+        """Advance every nurse one frame toward its target; returns whether any nurse moved."""
         if size is None:
             size = self.nurse_size
-        for nurse in self.game.nurses:
-            target_x, target_y = self._get_nurse_target(nurse, size=size)
-            if nurse not in self.nurse_positions:
-                self.nurse_positions[nurse] = self.nurse_stations.get(nurse, (850, self.bed_area_y + 50))
-                self.nurse_paths[nurse] = []
+        self._build_layout()
+        pos = self._nurse_pos
+        before = pos.copy()
+        placed = self._nurse_placed
+        stations = self.nurse_stations
+        paths = self.nurse_paths
+        target = self._nurse_target
+        waypoint = self._nurse_waypoint
+        moving = np.zeros(len(paths), dtype=bool)
+        # First pending task per nurse wins, matching the order tasks were queued
+        pending_by_nurse = {t['nurse']: t for t in reversed(self.pending_assignments)}
+        # Waypoint planning is branchy, so it stays a Python loop; the motion itself is vectorized below
+        for i, nurse in enumerate(self.game.nurses):
+            target_x, target_y = self._get_nurse_target(nurse, pending_by_nurse, size=size)
+            if not placed[i]:
+                pos[i] = stations[i]
+                placed[i] = True
+                paths[i] = []
                 continue
-            cur_x, cur_y = self.nurse_positions[nurse]
-            has_pending = any(t.get('nurse') == nurse for t in self.pending_assignments)
+            cur_x, cur_y = pos[i].tolist()
+            has_pending = nurse in pending_by_nurse
             is_idle = not has_pending
             use_corridor = not is_idle
             if is_idle:
-                target_x, target_y = self.nurse_stations.get(nurse, (850, self.bed_area_y + 50))
+                target_x, target_y = stations[i]
                 if abs(cur_x - target_x) <= 1 and abs(cur_y - target_y) <= 1:
-                    self.nurse_positions[nurse] = (target_x, target_y)
-                    self.nurse_paths[nurse] = []
+                    pos[i] = (target_x, target_y)
+                    paths[i] = []
                     continue
+            target[i] = (target_x, target_y)
             dx_t = target_x - cur_x; dy_t = target_y - cur_y
-            dist_to_target = (dx_t * dx_t + dy_t * dy_t) ** 0.5
-            if dist_to_target <= 2:
-                self.nurse_positions[nurse] = (target_x, target_y)
-                self.nurse_paths[nurse] = []
+            # Thresholds only, so compare squared distances (2px snap, 20px direct approach)
+            dist2_to_target = dx_t * dx_t + dy_t * dy_t
+            if dist2_to_target <= 4:
+                pos[i] = (target_x, target_y)
+                paths[i] = []
                 continue
-            if dist_to_target <= 20:
+            if dist2_to_target <= 400:
                 use_corridor = False
-            if nurse not in self.nurse_paths:
-                self.nurse_paths[nurse] = []
-            if (not self.nurse_paths[nurse]
-                or (abs(self.nurse_paths[nurse][-1][0] - target_x) > 3 and abs(self.nurse_paths[nurse][-1][1] - target_y) > 3)):
-                self.nurse_paths[nurse] = self._plan_path((cur_x, cur_y), (target_x, target_y), use_corridor=use_corridor)
-            if self.nurse_paths[nurse]:
-                wx, wy = self.nurse_paths[nurse][0]
-            else:
-                wx, wy = target_x, target_y
-            dx = wx - cur_x; dy = wy - cur_y
-            dist = (dx * dx + dy * dy) ** 0.5
-            if dist < 1:
-                if self.nurse_paths[nurse]:
-                    self.nurse_paths[nurse].pop(0)
-                if not self.nurse_paths[nurse] and dist_to_target <= 2:
-                    self.nurse_positions[nurse] = (target_x, target_y)
-                    continue
-                self.nurse_positions[nurse] = (wx, wy)
-                continue
-            step = min(self.nurse_speed, dist)
-            if dist > 0:
-                new_x = cur_x + dx / dist * step
-                new_y = cur_y + dy / dist * step
-            else:
-                new_x, new_y = wx, wy
-            self.nurse_positions[nurse] = (new_x, new_y)
+            path = paths[i]
+            if (not path
+                or (abs(path[-1][0] - target_x) > 3 and abs(path[-1][1] - target_y) > 3)):
+                path = paths[i] = self._plan_path((cur_x, cur_y), (target_x, target_y), use_corridor=use_corridor)
+            waypoint[i] = path[0] if path else (target_x, target_y)
+            moving[i] = True
+
+        rows = np.flatnonzero(moving)
+        if rows.size:
+            pos[rows], arrived = step_nurses(pos[rows], waypoint[rows], self.nurse_speed)
+            # Reached waypoint: pop it off the path
+            for i in rows[arrived].tolist():
+                if paths[i]:
+                    paths[i].pop(0)
 
         # complete pending tasks -> signal deferred action ready
         if self.pending_assignments:
-            remaining = []
-            for task in self.pending_assignments:
-                nurse = task['nurse']
-                nx, ny = self.nurse_positions.get(nurse, (None, None))
-                if nx is None:
-                    remaining.append(task)
+            # Rotate the queue once: finished tasks drop out, the rest go back in order
+            pending = self.pending_assignments
+            for _ in range(len(pending)):
+                task = pending.popleft()
+                nurse_id = task['nurse'].id
+                if not placed[nurse_id]:
+                    pending.append(task)
                     continue
-                if 'bed' in task and task['bed'] in self.bed_positions:
-                    bx, by, bw, bh = self.bed_positions[task['bed']]
+                nx, ny = pos[nurse_id].tolist()
+                if 'bed' in task:
+                    bx, by, bw, bh = self.bed_positions[task['bed'].id]
                     reached_rect = (bx - 4) <= nx <= (bx + bw + 4) and (by - 4) <= ny <= (by + bh + 4)
                     if not reached_rect:
-                        remaining.append(task)
+                        pending.append(task)
                         continue
-                if 'vent' in task and task['vent'] in self.vent_positions:
-                    vx, vy, vw, vh = self.vent_positions[task['vent']]
+                if 'vent' in task:
+                    vx, vy, vw, vh = self.vent_positions[task['vent'].id]
                     reached_rect = (vx - 4) <= nx <= (vx + vw + 4) and (vy - 4) <= ny <= (vy + vh + 4)
                     if not reached_rect:
-                        remaining.append(task)
+                        pending.append(task)
                         continue
                 self.ready_to_apply_deferred = True
-            self.pending_assignments = remaining
+        return not np.array_equal(before, pos)
 
-    def _draw_nurse(self, nurse, x, y, size=40):
-        if getattr(self, "nurse_sprite_raw", None):
-            sprite = pygame.transform.smoothscale(self.nurse_sprite_raw, (size, size))
+    def _draw_nurse(self, nurse, x, y, size=40) -> pygame.Rect:
+        if self._nurse_sprite is not None:
+            sprite = self._nurse_sprite
+            if size != self.nurse_size:
+                sprite = scaled_sprite(self._scale_cache, self.nurse_sprite_raw, (size, size))
             self.screen.blit(sprite, (x, y))
         else:
             pygame.draw.circle(self.screen, GREEN if nurse.available else RED, (x + size // 2, y + size // 2), size // 2)
+        return pygame.Rect(x, y, size, size)
 
 
@@ -2,6 +2,38 @@ import pygame
 
 # Shared UI helpers to match Retro visuals
 
+def merge_rects(rects):
+    """
+    Coalesce overlapping dirty rects before pygame.display.update().
+    Each rect absorbs (Rect.unionall) every rect it overlaps until no overlaps remain,
+    so the display gets a few larger updates instead of many small overlapping ones.
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        hits = rect.collidelistall(merged)
+        while hits:
+            rect.unionall_ip([merged[i] for i in hits])
+            for i in reversed(hits):
+                del merged[i]
+            hits = rect.collidelistall(merged)
+        merged.append(rect)
+    return merged
+
+
+def scaled_sprite(cache, raw, size, smooth=True):
+    """
+    raw scaled to size, converted for alpha blitting and memoized in cache by (raw, size).
+    smooth picks smoothscale over nearest-neighbour scale (retro art uses the latter).
+    """
+    key = (id(raw), size[0], size[1], smooth)
+    surf = cache.get(key)
+    if surf is None:
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        surf = cache[key] = scale(raw, size).convert_alpha()
+    return surf
+
+
 def draw_bed(surface, sprites, caches, fonts, bed, x, y, width=120, height=120, retro_antialias=False):
     """
     Draw a bed tile.